@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import timedelta
+from time import time
 from typing import Any, cast
 
 import jwt
@@ -15,7 +16,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_CACHE_TIME,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -158,6 +164,9 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Verified access tokens and the timestamp until they can be used
+        # without verifying them again
+        self._access_token_cache: dict[str, tuple[models.RefreshToken, float]] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -310,6 +319,9 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(
+            lambda refresh_token: refresh_token.user is user
+        )
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -350,6 +362,9 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(
+            lambda refresh_token: refresh_token.user is user
+        )
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -473,6 +488,9 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(
+            lambda cached_token: cached_token.id == refresh_token.id
+        )
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -554,6 +572,13 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        cache = self._access_token_cache
+        if (cached := cache.get(token)) is not None:
+            cached_token, valid_until = cached
+            if time() < valid_until and cached_token.user.is_active:
+                return cached_token
+            del cache[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -571,7 +596,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -580,8 +605,29 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        valid_until = time() + ACCESS_TOKEN_CACHE_TIME.total_seconds()
+        if (expiration := claims.get("exp")) is not None:
+            valid_until = min(valid_until, expiration)
+        if len(cache) >= ACCESS_TOKEN_CACHE_SIZE:
+            # Evict the oldest entry
+            del cache[next(iter(cache))]
+        cache[token] = (refresh_token, valid_until)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, matcher: Callable[[models.RefreshToken], bool]
+    ) -> None:
+        """Remove cached access tokens of matching refresh tokens."""
+        cache = self._access_token_cache
+        for token in [
+            token
+            for token, (refresh_token, _) in cache.items()
+            if matcher(refresh_token)
+        ]:
+            del cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -44,6 +44,8 @@ class AuthStore:
         """Initialize the auth store."""
         self.hass = hass
         self._users: dict[str, models.User] | None = None
+        # Refresh tokens of all users by id
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
         self._store = Store[dict[str, list[dict[str, Any]]]](
@@ -150,6 +152,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for token_id in user.refresh_tokens:
+            self._refresh_tokens.pop(token_id, None)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -238,6 +242,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens[refresh_token.id] = refresh_token
 
         self._async_schedule_save()
         return refresh_token
@@ -250,10 +255,9 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        if self._refresh_tokens.pop(refresh_token.id, None):
+            refresh_token.user.refresh_tokens.pop(refresh_token.id, None)
+            self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -263,12 +267,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -493,6 +492,11 @@ class AuthStore:
 
         self._groups = groups
         self._users = users
+        self._refresh_tokens = {
+            token.id: token
+            for user in users.values()
+            for token in user.refresh_tokens.values()
+        }
 
     @callback
     def _async_schedule_save(self) -> None:
@@ -583,6 +587,7 @@ class AuthStore:
     def _set_defaults(self) -> None:
         """Set default values for auth store."""
         self._users = OrderedDict()
+        self._refresh_tokens = {}
 
         groups: dict[str, models.Group] = OrderedDict()
         admin_group = _system_admin_group()
@@ -3,6 +3,9 @@ from datetime import timedelta
 
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
+# Verified access tokens are cached for at most this long
+ACCESS_TOKEN_CACHE_TIME = timedelta(minutes=1)
+ACCESS_TOKEN_CACHE_SIZE = 1024
 
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
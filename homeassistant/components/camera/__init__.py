@@ -74,6 +74,7 @@ from .const import (  # noqa: F401
     STREAM_TYPE_WEB_RTC,
     StreamType,
 )
+from .frame_broker import CameraFrameBroker
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
@@ -166,15 +167,21 @@ async def _async_get_image(
     that we can scale, however the majority of cases
     are handled.
     """
+    broker = camera.frame_broker
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
+            frame_id: int | None = None
+            if camera.use_stream_for_stills:
+                image_bytes = await _async_get_stream_image(
                     camera, width=width, height=height, wait_for_next_keyframe=False
                 )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
+            elif frame := await broker.async_get_frame(
+                camera.frame_interval, width, height
+            ):
+                frame_id = frame.id
+                image_bytes = frame.content
+            else:
+                image_bytes = None
             if image_bytes:
                 content_type = camera.content_type
                 image = Image(content_type, image_bytes)
@@ -183,11 +190,15 @@ async def _async_get_image(
                     and height is not None
                     and ("jpeg" in content_type or "jpg" in content_type)
                 ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
+                    if frame_id is None:
+                        scaled = await camera.hass.async_add_executor_job(
+                            scale_jpeg_camera_image, image, width, height
+                        )
+                    else:
+                        scaled = await broker.async_get_scaled(
+                            frame_id, image, width, height
+                        )
+                    return Image(content_type, scaled)
 
                 return image
 
@@ -476,6 +487,7 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.frame_broker = CameraFrameBroker(self)
 
     @property
     def entity_picture(self) -> str:
@@ -613,8 +625,14 @@ class Camera(Entity):
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
+
+        async def _async_get_frame() -> bytes | None:
+            """Return the frame shared by all viewers of the interval."""
+            frame = await self.frame_broker.async_get_frame(interval)
+            return frame.content if frame else None
+
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request, _async_get_frame, self.content_type, interval
         )
 
     async def handle_async_mjpeg_stream(
@@ -0,0 +1,119 @@
+"""Share camera frames between all viewers of a camera."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .img_util import scale_jpeg_camera_image
+
+if TYPE_CHECKING:
+    from . import Camera, Image
+
+# Time a shared fetch may take before it is given up for all viewers
+FRAME_FETCH_TIMEOUT = 10
+
+# Sizes the latest frames are kept for
+MAX_FRAME_SIZES = 8
+
+# Scaled variants of the latest frames kept for viewers asking for a size
+MAX_SCALED_VARIANTS = 8
+
+
+@dataclass(slots=True, frozen=True)
+class Frame:
+    """A frame fetched from a camera."""
+
+    id: int
+    content: bytes
+    fetched_at: float
+
+
+class CameraFrameBroker:
+    """Fetch frames of a camera once for all viewers.
+
+    Viewers asking for a frame of the same size within the frame interval
+    get the same frame, and concurrent requests share a single fetch.
+    The size is passed to the camera, so cameras that scale natively keep
+    doing so. The most recently used scaled variants of the latest frames
+    are cached so each frame is only scaled once.
+    """
+
+    def __init__(self, camera: Camera) -> None:
+        """Initialize the frame broker."""
+        self._camera = camera
+        self._frame_id = 0
+        self._frames: dict[tuple[int | None, int | None], Frame] = {}
+        self._fetches: dict[
+            tuple[int | None, int | None], asyncio.Task[Frame | None]
+        ] = {}
+        self._scaled: dict[tuple[int, int, int], asyncio.Future[bytes]] = {}
+
+    async def async_get_frame(
+        self, max_age: float, width: int | None = None, height: int | None = None
+    ) -> Frame | None:
+        """Return a frame of a size that was fetched at most max_age seconds ago."""
+        size = (width, height)
+        if (frame := self._frames.get(size)) is not None and (
+            monotonic() - frame.fetched_at < max_age
+        ):
+            return frame
+        if (fetch := self._fetches.get(size)) is None:
+            fetch = self._fetches[size] = self._camera.hass.async_create_task(
+                self._async_fetch_frame(size),
+                f"camera {self._camera.entity_id} frame fetch",
+            )
+            fetch.add_done_callback(_retrieve_fetch_exception)
+        # A viewer that times out must not cancel the fetch of the others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch_frame(
+        self, size: tuple[int | None, int | None]
+    ) -> Frame | None:
+        """Fetch a new frame of a size from the camera."""
+        try:
+            async with asyncio.timeout(FRAME_FETCH_TIMEOUT):
+                content = await self._camera.async_camera_image(
+                    width=size[0], height=size[1]
+                )
+        finally:
+            del self._fetches[size]
+        frames = self._frames
+        if (previous := frames.pop(size, None)) is not None:
+            # Scaled variants of the previous frame are no longer needed
+            for key in [key for key in self._scaled if key[2] == previous.id]:
+                del self._scaled[key]
+        if not content:
+            return None
+        if len(frames) >= MAX_FRAME_SIZES:
+            del frames[next(iter(frames))]
+        self._frame_id += 1
+        frame = frames[size] = Frame(self._frame_id, content, monotonic())
+        return frame
+
+    async def async_get_scaled(
+        self, frame_id: int, image: Image, width: int, height: int
+    ) -> bytes:
+        """Return the image of a frame scaled to the width and height."""
+        key = (width, height, frame_id)
+        if (scaled := self._scaled.pop(key, None)) is None:
+            scaled = self._camera.hass.async_add_executor_job(
+                scale_jpeg_camera_image, image, width, height
+            )
+            if len(self._scaled) >= MAX_SCALED_VARIANTS:
+                del self._scaled[next(iter(self._scaled))]
+        # Keep the most recently used variants at the end
+        self._scaled[key] = scaled
+        try:
+            return await asyncio.shield(scaled)
+        except Exception:
+            if self._scaled.get(key) is scaled:
+                del self._scaled[key]
+            raise
+
+
+def _retrieve_fetch_exception(fetch: asyncio.Task[Frame | None]) -> None:
+    """Retrieve the exception of a fetch all viewers may have given up on."""
+    if not fetch.cancelled():
+        fetch.exception()
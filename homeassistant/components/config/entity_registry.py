@@ -1,6 +1,8 @@
 """HTTP views to interact with the entity registry."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -9,6 +11,10 @@ from homeassistant import config_entries
 from homeassistant.components import websocket_api
 from homeassistant.components.websocket_api import ERR_NOT_FOUND
 from homeassistant.components.websocket_api.decorators import require_admin
+from homeassistant.components.websocket_api.snapshots import (
+    SerializedSnapshotCache,
+    async_render_snapshot,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import (
     config_validation as cv,
@@ -17,6 +23,9 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.json import json_dumps
 
+DATA_ENTITIES_SNAPSHOT = "config_entity_registry_list_snapshot"
+DATA_DISPLAY_ENTITIES_SNAPSHOT = "config_entity_registry_list_for_display_snapshot"
+
 
 async def async_setup(hass: HomeAssistant) -> bool:
     """Enable the Entity Registry views."""
@@ -30,6 +39,51 @@ async def async_setup(hass: HomeAssistant) -> bool:
     return True
 
 
+def _serialize_entities(entries: list[er.RegistryEntry]) -> str:
+    """Serialize registry entries."""
+    # Concatenate cached entity registry item JSON serializations
+    joined_entries = ",".join(
+        entry.partial_json_repr
+        for entry in entries
+        if entry.partial_json_repr is not None
+    )
+    return f"[{joined_entries}]"
+
+
+def _serialize_entities_for_display(entries: list[er.RegistryEntry]) -> str:
+    """Serialize the enabled registry entries for display."""
+    entity_categories = json_dumps(er.ENTITY_CATEGORY_INDEX_TO_VALUE)
+    # Concatenate cached entity registry item JSON serializations
+    joined_entries = ",".join(
+        entry.display_json_repr
+        for entry in entries
+        if entry.disabled_by is None and entry.display_json_repr is not None
+    )
+    return f'{{"entity_categories":{entity_categories},"entities":[{joined_entries}]}}'
+
+
+@callback
+def _async_send_entities(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    key: str,
+    serialize: Callable[[list[er.RegistryEntry]], str],
+) -> None:
+    """Send the serialized registry entries, shared by all connections."""
+    if (cache := hass.data.get(key)) is None:
+        cache = hass.data[key] = SerializedSnapshotCache(hass, serialize)
+    payload = cache.async_get(list(er.async_get(hass).entities.values()))
+    connection.send_message(
+        async_render_snapshot(
+            hass,
+            msg_id,
+            payload,
+            partial(websocket_api.messages.construct_result_message, msg_id),
+        )
+    )
+
+
 @websocket_api.websocket_command({vol.Required("type"): "config/entity_registry/list"})
 @callback
 def websocket_list_entities(
@@ -38,23 +92,9 @@ def websocket_list_entities(
     msg: dict[str, Any],
 ) -> None:
     """Handle list registry entries command."""
-    registry = er.async_get(hass)
-    # Build start of response message
-    msg_json_prefix = (
-        f'{{"id":{msg["id"]},"type": "{websocket_api.const.TYPE_RESULT}",'
-        '"success":true,"result": ['
-    )
-    # Concatenate cached entity registry item JSON serializations
-    msg_json = (
-        msg_json_prefix
-        + ",".join(
-            entry.partial_json_repr
-            for entry in registry.entities.values()
-            if entry.partial_json_repr is not None
-        )
-        + "]}"
+    _async_send_entities(
+        hass, connection, msg["id"], DATA_ENTITIES_SNAPSHOT, _serialize_entities
     )
-    connection.send_message(msg_json)
 
 
 @websocket_api.websocket_command(
@@ -67,24 +107,13 @@ def websocket_list_entities_for_display(
     msg: dict[str, Any],
 ) -> None:
     """Handle list registry entries command."""
-    registry = er.async_get(hass)
-    # Build start of response message
-    entity_categories = json_dumps(er.ENTITY_CATEGORY_INDEX_TO_VALUE)
-    msg_json_prefix = (
-        f'{{"id":{msg["id"]},"type":"{websocket_api.const.TYPE_RESULT}","success":true,'
-        f'"result":{{"entity_categories":{entity_categories},"entities":['
-    )
-    # Concatenate cached entity registry item JSON serializations
-    msg_json = (
-        msg_json_prefix
-        + ",".join(
-            entry.display_json_repr
-            for entry in registry.entities.values()
-            if entry.disabled_by is None and entry.display_json_repr is not None
-        )
-        + "]}}"
+    _async_send_entities(
+        hass,
+        connection,
+        msg["id"],
+        DATA_DISPLAY_ENTITIES_SNAPSHOT,
+        _serialize_entities_for_display,
     )
-    connection.send_message(msg_json)
 
 
 @websocket_api.websocket_command(
@@ -24,12 +24,10 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.derived_sensor import async_track_derived_state_change_event
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import (
-    EventStateChangedData,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, EventType
 
 from .const import (
@@ -237,11 +235,19 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
                 < self._time_window
             ]
 
+            if (new_value := new_state.as_decimal) is None or (
+                old_value := old_state.as_decimal
+            ) is None:
+                _LOGGER.warning(
+                    "Invalid state (%s > %s)", old_state.state, new_state.state
+                )
+                return
+
             try:
                 elapsed_time = (
                     new_state.last_updated - old_state.last_updated
                 ).total_seconds()
-                delta_value = Decimal(new_state.state) - Decimal(old_state.state)
+                delta_value = new_value - old_value
                 new_derivative = (
                     delta_value
                     / Decimal(elapsed_time)
@@ -287,7 +293,7 @@ class DerivativeSensor(RestoreSensor, SensorEntity):
             self.async_write_ha_state()
 
         self.async_on_remove(
-            async_track_state_change_event(
+            async_track_derived_state_change_event(
                 self.hass, self._sensor_source_id, calc_derivative
             )
         )
@@ -20,6 +20,7 @@ from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
 )
+from homeassistant.helpers.polling import async_get_poll_scheduler
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import async_get_custom_components, async_get_integration
@@ -171,14 +172,17 @@ async def _async_get_json_file_response(
             "version": cc_obj.version,
             "requirements": cc_obj.requirements,
         }
+    diagnostics = {
+        "home_assistant": hass_sys_info,
+        "custom_components": custom_components,
+        "integration_manifest": integration.manifest,
+        "data": data,
+    }
+    if poll_statistics := async_get_poll_scheduler(hass).async_statistics(domain):
+        diagnostics["poll_statistics"] = poll_statistics
     try:
         json_data = json.dumps(
-            {
-                "home_assistant": hass_sys_info,
-                "custom_components": custom_components,
-                "integration_manifest": integration.manifest,
-                "data": data,
-            },
+            diagnostics,
             indent=2,
             cls=ExtendedJSONEncoder,
         )
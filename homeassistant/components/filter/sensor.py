@@ -36,11 +36,9 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.derived_sensor import async_track_derived_state_change_event
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import (
-    EventStateChangedData,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import (
@@ -366,7 +364,7 @@ class SensorFilter(SensorEntity):
         def _async_hass_started(hass: HomeAssistant) -> None:
             """Delay source entity tracking."""
             self.async_on_remove(
-                async_track_state_change_event(
+                async_track_derived_state_change_event(
                     self.hass, [self._entity], self._update_filter_sensor_state_event
                 )
             )
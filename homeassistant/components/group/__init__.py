@@ -5,6 +5,7 @@ from abc import abstractmethod
 import asyncio
 from collections.abc import Callable, Collection, Iterable, Mapping
 from contextvars import ContextVar
+from functools import partial
 import logging
 from typing import Any, Protocol, cast
 
@@ -21,6 +22,7 @@ from homeassistant.const import (
     CONF_NAME,
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
     STATE_OFF,
     STATE_ON,
@@ -28,6 +30,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
+    Event,
     HomeAssistant,
     ServiceCall,
     State,
@@ -81,6 +84,7 @@ PLATFORMS = [
 ]
 
 REG_KEY = f"{DOMAIN}_registry"
+MEMBERSHIP_KEY = f"{DOMAIN}_membership"
 
 ENTITY_PREFIX = f"{DOMAIN}."
 
@@ -173,30 +177,20 @@ def expand_entity_ids(hass: HomeAssistant, entity_ids: Iterable[Any]) -> list[st
 
     Async friendly.
     """
-    found_ids: list[str] = []
-    for entity_id in entity_ids:
-        if not isinstance(entity_id, str) or entity_id in (
-            ENTITY_MATCH_NONE,
-            ENTITY_MATCH_ALL,
-        ):
-            continue
-
-        entity_id = entity_id.lower()
+    expand: Callable[[str], Iterable[str]]
+    if (membership := _get_membership(hass)) is not None:
+        expand = membership.async_expand
+    else:
+        expand = partial(_expand_group_state, hass)
+    found_ids: dict[str, None] = {}
+    for entity_id in _normalize_entity_ids(entity_ids):
         # If entity_id points at a group, expand it
         if entity_id.startswith(ENTITY_PREFIX):
-            child_entities = get_entity_ids(hass, entity_id)
-            if entity_id in child_entities:
-                child_entities = list(child_entities)
-                child_entities.remove(entity_id)
-            found_ids.extend(
-                ent_id
-                for ent_id in expand_entity_ids(hass, child_entities)
-                if ent_id not in found_ids
-            )
-        elif entity_id not in found_ids:
-            found_ids.append(entity_id)
+            found_ids.update(dict.fromkeys(expand(entity_id)))
+        else:
+            found_ids[entity_id] = None
 
-    return found_ids
+    return list(found_ids)
 
 
 @bind_hass
@@ -230,13 +224,167 @@ def groups_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    groups = []
+    if (membership := _get_membership(hass)) is not None:
+        return membership.async_groups_with_entity(entity_id)
+
+    return [
+        group.entity_id
+        for group in hass.data[DOMAIN].entities
+        if entity_id in group.tracking
+    ]
+
+
+def _normalize_entity_ids(entity_ids: Iterable[Any]) -> Iterable[str]:
+    """Return the lower cased entity ids, skipping non entity ids."""
+    for entity_id in entity_ids:
+        if not isinstance(entity_id, str) or entity_id in (
+            ENTITY_MATCH_NONE,
+            ENTITY_MATCH_ALL,
+        ):
+            continue
+        yield entity_id.lower()
+
+
+def _get_membership(hass: HomeAssistant) -> GroupMembership | None:
+    """Return the group membership graph when it can be used.
 
-    for group in hass.data[DOMAIN].entities:
-        if entity_id in group.tracking:
-            groups.append(group.entity_id)
+    The graph is created by async_setup and is only updated and read in
+    the event loop. Callers in other threads read the group states instead.
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    if running_loop is not hass.loop:
+        return None
+    return cast(GroupMembership | None, hass.data.get(MEMBERSHIP_KEY))
+
+
+def _expand_group_state(
+    hass: HomeAssistant,
+    group_id: str,
+    found_ids: dict[str, None] | None = None,
+    seen_groups: set[str] | None = None,
+) -> dict[str, None]:
+    """Return the non group entities contained in a group from its state."""
+    if found_ids is None:
+        found_ids = {}
+    if seen_groups is None:
+        seen_groups = {group_id}
+    for member_id in _normalize_entity_ids(get_entity_ids(hass, group_id)):
+        if not member_id.startswith(ENTITY_PREFIX):
+            found_ids[member_id] = None
+        elif member_id not in seen_groups:
+            seen_groups.add(member_id)
+            _expand_group_state(hass, member_id, found_ids, seen_groups)
+    return found_ids
 
-    return groups
+
+class GroupMembership:
+    """Graph of the members of the group entities.
+
+    The direct members of each group and the groups each entity is a
+    direct member of are kept up to date from the entity_id attribute of
+    the group states. The expansion of a group into its non group members
+    is memoized until the members of the group, or of a group nested in
+    it, change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the graph from the current group states."""
+        self._members: dict[str, tuple[str, ...]] = {}
+        self._groups_of: dict[str, dict[str, None]] = {}
+        self._expanded: dict[str, tuple[str, ...]] = {}
+        for state in hass.states.async_all(DOMAIN):
+            self._async_set_members(state.entity_id, state)
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_filter_group_changes,
+            run_immediately=True,
+        )
+
+    @callback
+    def async_groups_with_entity(self, entity_id: str) -> list[str]:
+        """Return the groups the entity is a direct member of."""
+        return list(self._groups_of.get(entity_id, ()))
+
+    @callback
+    def async_expand(self, group_id: str) -> tuple[str, ...]:
+        """Return the non group entities contained in a group."""
+        if (expanded := self._expanded.get(group_id)) is not None:
+            return expanded
+        found_ids: dict[str, None] = {}
+        seen_groups = {group_id}
+        self._async_walk(group_id, found_ids, seen_groups)
+        expanded = self._expanded[group_id] = tuple(found_ids)
+        return expanded
+
+    @callback
+    def _async_walk(
+        self, group_id: str, found_ids: dict[str, None], seen_groups: set[str]
+    ) -> None:
+        """Add the members of a group to found_ids, walking nested groups once."""
+        for member_id in self._members.get(group_id, ()):
+            if not member_id.startswith(ENTITY_PREFIX):
+                found_ids[member_id] = None
+            elif member_id not in seen_groups:
+                seen_groups.add(member_id)
+                if (expanded := self._expanded.get(member_id)) is not None:
+                    found_ids.update(dict.fromkeys(expanded))
+                else:
+                    self._async_walk(member_id, found_ids, seen_groups)
+
+    @callback
+    def _async_filter_group_changes(self, event: Event) -> bool:
+        """Return if the members of a group may have changed."""
+        entity_id: str = event.data["entity_id"]
+        if not entity_id.startswith(ENTITY_PREFIX):
+            return False
+        old_state: State | None = event.data["old_state"]
+        new_state: State | None = event.data["new_state"]
+        return (
+            old_state is None
+            or new_state is None
+            or old_state.attributes.get(ATTR_ENTITY_ID)
+            != new_state.attributes.get(ATTR_ENTITY_ID)
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the members of a group when its state changes."""
+        self._async_set_members(event.data["entity_id"], event.data["new_state"])
+
+    @callback
+    def _async_set_members(self, group_id: str, state: State | None) -> None:
+        """Replace the direct members of a group."""
+        members: tuple[str, ...] = ()
+        if state is not None and (entity_ids := state.attributes.get(ATTR_ENTITY_ID)):
+            members = tuple(dict.fromkeys(_normalize_entity_ids(entity_ids)))
+        if members == self._members.get(group_id, ()):
+            return
+
+        groups_of = self._groups_of
+        for member_id in self._members.pop(group_id, ()):
+            groups = groups_of[member_id]
+            del groups[group_id]
+            if not groups:
+                del groups_of[member_id]
+        if members:
+            self._members[group_id] = members
+            for member_id in members:
+                groups_of.setdefault(member_id, {})[group_id] = None
+
+        # Forget the expansion of the group and of all groups it is nested in
+        stale = {group_id}
+        to_visit = [group_id]
+        while to_visit:
+            stale_id = to_visit.pop()
+            self._expanded.pop(stale_id, None)
+            for parent_id in groups_of.get(stale_id, ()):
+                if parent_id not in stale:
+                    stale.add(parent_id)
+                    to_visit.append(parent_id)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -287,6 +435,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     component: EntityComponent[Group] = hass.data[DOMAIN]
 
     hass.data[REG_KEY] = GroupIntegrationRegistry()
+    hass.data[MEMBERSHIP_KEY] = GroupMembership(hass)
 
     await async_process_integration_platforms(hass, DOMAIN, _process_group_platform)
 
@@ -484,6 +633,7 @@ class GroupEntity(Entity):
         for entity_id in self._entity_ids:
             if (state := self.hass.states.get(entity_id)) is None:
                 continue
+            self.async_update_member_state(entity_id, state)
             self.async_update_supported_features(entity_id, state)
 
         @callback
@@ -491,6 +641,10 @@ class GroupEntity(Entity):
             event: EventType[EventStateChangedData] | None,
         ) -> None:
             """Handle child updates."""
+            if event:
+                self.async_update_member_state(
+                    event.data["entity_id"], event.data["new_state"]
+                )
             self.async_update_group_state()
             if event:
                 self.async_update_supported_features(
@@ -508,6 +662,7 @@ class GroupEntity(Entity):
         for entity_id in self._entity_ids:
             if (state := self.hass.states.get(entity_id)) is None:
                 continue
+            self.async_update_member_state(entity_id, state)
             self.async_update_supported_features(entity_id, state)
 
         @callback
@@ -516,6 +671,9 @@ class GroupEntity(Entity):
         ) -> None:
             """Handle child updates."""
             self.async_set_context(event.context)
+            self.async_update_member_state(
+                event.data["entity_id"], event.data["new_state"]
+            )
             self.async_update_supported_features(
                 event.data["entity_id"], event.data["new_state"]
             )
@@ -547,6 +705,14 @@ class GroupEntity(Entity):
     def async_update_group_state(self) -> None:
         """Abstract method to update the entity."""
 
+    @callback
+    def async_update_member_state(
+        self,
+        entity_id: str,
+        new_state: State | None,
+    ) -> None:
+        """Update incremental aggregates with the new state of a member."""
+
     @callback
     def async_update_supported_features(
         self,
@@ -1,6 +1,7 @@
 """Platform allowing several cover to be grouped into one cover."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import voluptuous as vol
@@ -30,7 +31,6 @@ from homeassistant.const import (
     SERVICE_SET_COVER_TILT_POSITION,
     SERVICE_STOP_COVER,
     SERVICE_STOP_COVER_TILT,
-    STATE_CLOSED,
     STATE_CLOSING,
     STATE_OPEN,
     STATE_OPENING,
@@ -43,7 +43,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import GroupEntity
-from .util import reduce_attribute
+from .util import GroupStateAggregator, MeanReducer
 
 KEY_OPEN_CLOSE = "open_close"
 KEY_STOP = "stop"
@@ -130,10 +130,31 @@ class CoverGroup(GroupEntity, CoverEntity):
             KEY_POSITION: set(),
         }
 
+        self._aggregator = GroupStateAggregator()
+        self._position = self._aggregator.add_reducer(
+            MeanReducer(),
+            _supported_attribute(
+                CoverEntityFeature.SET_POSITION, ATTR_CURRENT_POSITION
+            ),
+        )
+        self._tilt_position = self._aggregator.add_reducer(
+            MeanReducer(),
+            _supported_attribute(
+                CoverEntityFeature.SET_TILT_POSITION, ATTR_CURRENT_TILT_POSITION
+            ),
+        )
+
         self._attr_name = name
         self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entities}
         self._attr_unique_id = unique_id
 
+    @callback
+    def async_update_member_state(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Update the aggregated member states with the new state of a member."""
+        self._aggregator.async_update(entity_id, new_state)
+
     @callback
     def async_update_supported_features(
         self,
@@ -249,53 +270,24 @@ class CoverGroup(GroupEntity, CoverEntity):
     @callback
     def async_update_group_state(self) -> None:
         """Update state and attributes."""
-        states = [
-            state.state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ]
+        state_counts = self._aggregator.state_counts
+        members = len(self._aggregator.states)
+        unavailable = state_counts.get(STATE_UNAVAILABLE, 0)
 
-        valid_state = any(
-            state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
-        )
+        valid_state = members > unavailable + state_counts.get(STATE_UNKNOWN, 0)
 
         # Set group as unavailable if all members are unavailable or missing
-        self._attr_available = any(state != STATE_UNAVAILABLE for state in states)
-
-        self._attr_is_closed = True
-        self._attr_is_closing = False
-        self._attr_is_opening = False
-        for entity_id in self._entity_ids:
-            if not (state := self.hass.states.get(entity_id)):
-                continue
-            if state.state == STATE_OPEN:
-                self._attr_is_closed = False
-                continue
-            if state.state == STATE_CLOSED:
-                continue
-            if state.state == STATE_CLOSING:
-                self._attr_is_closing = True
-                continue
-            if state.state == STATE_OPENING:
-                self._attr_is_opening = True
-                continue
+        self._attr_available = members > unavailable
+
+        self._attr_is_closed = STATE_OPEN not in state_counts
+        self._attr_is_closing = STATE_CLOSING in state_counts
+        self._attr_is_opening = STATE_OPENING in state_counts
         if not valid_state:
             # Set as unknown if all members are unknown or unavailable
             self._attr_is_closed = None
 
-        position_covers = self._covers[KEY_POSITION]
-        all_position_states = [self.hass.states.get(x) for x in position_covers]
-        position_states: list[State] = list(filter(None, all_position_states))
-        self._attr_current_cover_position = reduce_attribute(
-            position_states, ATTR_CURRENT_POSITION
-        )
-
-        tilt_covers = self._tilts[KEY_POSITION]
-        all_tilt_states = [self.hass.states.get(x) for x in tilt_covers]
-        tilt_states: list[State] = list(filter(None, all_tilt_states))
-        self._attr_current_cover_tilt_position = reduce_attribute(
-            tilt_states, ATTR_CURRENT_TILT_POSITION
-        )
+        self._attr_current_cover_position = self._position.result
+        self._attr_current_cover_tilt_position = self._tilt_position.result
 
         supported_features = CoverEntityFeature(0)
         if self._covers[KEY_OPEN_CLOSE]:
@@ -312,3 +304,16 @@ class CoverGroup(GroupEntity, CoverEntity):
         if self._tilts[KEY_POSITION]:
             supported_features |= CoverEntityFeature.SET_TILT_POSITION
         self._attr_supported_features = supported_features
+
+
+def _supported_attribute(
+    feature: CoverEntityFeature, key: str
+) -> Callable[[State], Any]:
+    """Return a function getting an attribute of a member supporting feature."""
+
+    def _value(state: State) -> Any:
+        if not state.attributes.get(ATTR_SUPPORTED_FEATURES, 0) & feature:
+            return None
+        return state.attributes.get(key)
+
+    return _value
@@ -1,8 +1,7 @@
 """Platform allowing several lights to be grouped into one light."""
 from __future__ import annotations
 
-from collections import Counter
-import itertools
+from collections.abc import Callable
 import logging
 from typing import Any, cast
 
@@ -44,13 +43,19 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import GroupEntity
-from .util import find_state_attributes, mean_tuple, reduce_attribute
+from .util import (
+    GroupStateAggregator,
+    MeanReducer,
+    TupleMeanReducer,
+    UnionCounter,
+    ValueCounter,
+)
 
 DEFAULT_NAME = "Light Group"
 CONF_ALL = "all"
@@ -162,6 +167,45 @@ class LightGroup(GroupEntity, LightEntity):
         if mode:
             self.mode = all
 
+        aggregator = self._aggregator = GroupStateAggregator()
+        self._brightness = aggregator.add_reducer(
+            MeanReducer(), _on_attribute(ATTR_BRIGHTNESS)
+        )
+        self._color_temp_kelvin = aggregator.add_reducer(
+            MeanReducer(), _on_attribute(ATTR_COLOR_TEMP_KELVIN)
+        )
+        self._colors = {
+            key: aggregator.add_reducer(TupleMeanReducer(), _on_attribute(key))
+            for key in (
+                ATTR_HS_COLOR,
+                ATTR_RGB_COLOR,
+                ATTR_RGBW_COLOR,
+                ATTR_RGBWW_COLOR,
+                ATTR_XY_COLOR,
+            )
+        }
+        self._min_color_temp_kelvin = aggregator.add_reducer(
+            ValueCounter(), _attribute(ATTR_MIN_COLOR_TEMP_KELVIN)
+        )
+        self._max_color_temp_kelvin = aggregator.add_reducer(
+            ValueCounter(), _attribute(ATTR_MAX_COLOR_TEMP_KELVIN)
+        )
+        self._effect_lists = aggregator.add_reducer(
+            UnionCounter(), _attribute(ATTR_EFFECT_LIST)
+        )
+        self._effects = aggregator.add_reducer(
+            ValueCounter(), _on_attribute(ATTR_EFFECT)
+        )
+        self._color_modes = aggregator.add_reducer(
+            ValueCounter(), _on_attribute(ATTR_COLOR_MODE)
+        )
+        self._supported_color_modes = aggregator.add_reducer(
+            UnionCounter(), _attribute(ATTR_SUPPORTED_COLOR_MODES)
+        )
+        self._supported_features = aggregator.add_reducer(
+            ValueCounter(), _attribute(ATTR_SUPPORTED_FEATURES)
+        )
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Forward the turn_on command to all lights in the light group."""
         data = {
@@ -195,98 +239,107 @@ class LightGroup(GroupEntity, LightEntity):
         )
 
     @callback
-    def async_update_group_state(self) -> None:
-        """Query all members and determine the light group state."""
-        states = [
-            state
-            for entity_id in self._entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-        ]
-        on_states = [state for state in states if state.state == STATE_ON]
+    def async_update_member_state(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Update the aggregated member states with the new state of a member."""
+        self._aggregator.async_update(entity_id, new_state)
 
-        valid_state = self.mode(
-            state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE) for state in states
+    @callback
+    def async_update_group_state(self) -> None:
+        """Determine the light group state from the aggregated member states."""
+        aggregator = self._aggregator
+        state_counts = aggregator.state_counts
+        members = len(aggregator.states)
+        on_states = state_counts.get(STATE_ON, 0)
+        valid_states = (
+            members
+            - state_counts.get(STATE_UNKNOWN, 0)
+            - state_counts.get(STATE_UNAVAILABLE, 0)
         )
-
-        if not valid_state:
-            # Set as unknown if any / all member is unknown or unavailable
-            self._attr_is_on = None
+        if self.mode is all:
+            valid_state = valid_states == members
+            is_on = on_states == members
         else:
-            # Set as ON if any / all member is ON
-            self._attr_is_on = self.mode(state.state == STATE_ON for state in states)
+            valid_state = valid_states > 0
+            is_on = on_states > 0
 
-        self._attr_available = any(state.state != STATE_UNAVAILABLE for state in states)
-        self._attr_brightness = reduce_attribute(on_states, ATTR_BRIGHTNESS)
+        # Set as unknown if any / all member is unknown or unavailable
+        # Otherwise set as ON if any / all member is ON
+        self._attr_is_on = is_on if valid_state else None
 
-        self._attr_hs_color = reduce_attribute(
-            on_states, ATTR_HS_COLOR, reduce=mean_tuple
-        )
-        self._attr_rgb_color = reduce_attribute(
-            on_states, ATTR_RGB_COLOR, reduce=mean_tuple
-        )
-        self._attr_rgbw_color = reduce_attribute(
-            on_states, ATTR_RGBW_COLOR, reduce=mean_tuple
-        )
-        self._attr_rgbww_color = reduce_attribute(
-            on_states, ATTR_RGBWW_COLOR, reduce=mean_tuple
-        )
-        self._attr_xy_color = reduce_attribute(
-            on_states, ATTR_XY_COLOR, reduce=mean_tuple
-        )
+        self._attr_available = members > state_counts.get(STATE_UNAVAILABLE, 0)
+        self._attr_brightness = self._brightness.result
 
-        self._attr_color_temp_kelvin = reduce_attribute(
-            on_states, ATTR_COLOR_TEMP_KELVIN
-        )
-        self._attr_min_color_temp_kelvin = reduce_attribute(
-            states, ATTR_MIN_COLOR_TEMP_KELVIN, default=2000, reduce=min
+        self._attr_hs_color = self._colors[ATTR_HS_COLOR].result
+        self._attr_rgb_color = self._colors[ATTR_RGB_COLOR].result
+        self._attr_rgbw_color = self._colors[ATTR_RGBW_COLOR].result
+        self._attr_rgbww_color = self._colors[ATTR_RGBWW_COLOR].result
+        self._attr_xy_color = self._colors[ATTR_XY_COLOR].result
+
+        self._attr_color_temp_kelvin = self._color_temp_kelvin.result
+        self._attr_min_color_temp_kelvin = self._min_color_temp_kelvin.extreme(
+            min, default=2000
         )
-        self._attr_max_color_temp_kelvin = reduce_attribute(
-            states, ATTR_MAX_COLOR_TEMP_KELVIN, default=6500, reduce=max
+        self._attr_max_color_temp_kelvin = self._max_color_temp_kelvin.extreme(
+            max, default=6500
         )
 
         self._attr_effect_list = None
-        all_effect_lists = list(find_state_attributes(states, ATTR_EFFECT_LIST))
-        if all_effect_lists:
+        if all_effects := self._effect_lists.counts:
             # Merge all effects from all effect_lists with a union merge.
-            self._attr_effect_list = list(set().union(*all_effect_lists))
-            self._attr_effect_list.sort()
+            self._attr_effect_list = sorted(all_effects)
             if "None" in self._attr_effect_list:
                 self._attr_effect_list.remove("None")
                 self._attr_effect_list.insert(0, "None")
 
-        self._attr_effect = None
-        all_effects = list(find_state_attributes(on_states, ATTR_EFFECT))
-        if all_effects:
-            # Report the most common effect.
-            effects_count = Counter(itertools.chain(all_effects))
-            self._attr_effect = effects_count.most_common(1)[0][0]
+        # Report the most common effect.
+        self._attr_effect = self._effects.most_common(self._entity_ids)
 
         self._attr_color_mode = None
-        all_color_modes = list(find_state_attributes(on_states, ATTR_COLOR_MODE))
-        if all_color_modes:
+        if color_mode_count := self._color_modes.counts:
             # Report the most common color mode, select brightness and onoff last
-            color_mode_count = Counter(itertools.chain(all_color_modes))
+            color_mode_count = color_mode_count.copy()
             if ColorMode.ONOFF in color_mode_count:
                 color_mode_count[ColorMode.ONOFF] = -1
             if ColorMode.BRIGHTNESS in color_mode_count:
                 color_mode_count[ColorMode.BRIGHTNESS] = 0
-            self._attr_color_mode = color_mode_count.most_common(1)[0][0]
+            self._attr_color_mode = self._color_modes.most_common(
+                self._entity_ids, color_mode_count
+            )
 
         self._attr_supported_color_modes = None
-        all_supported_color_modes = list(
-            find_state_attributes(states, ATTR_SUPPORTED_COLOR_MODES)
-        )
-        if all_supported_color_modes:
+        if all_supported_color_modes := self._supported_color_modes.counts:
             # Merge all color modes.
             self._attr_supported_color_modes = cast(
-                set[str], set().union(*all_supported_color_modes)
+                set[str], set(all_supported_color_modes)
             )
 
         self._attr_supported_features = LightEntityFeature(0)
-        for support in find_state_attributes(states, ATTR_SUPPORTED_FEATURES):
+        for support in self._supported_features.counts:
             # Merge supported features by emulating support for every feature
             # we find.
             self._attr_supported_features |= support
         # Bitwise-and the supported features with the GroupedLight's features
         # so that we don't break in the future when a new feature is added.
         self._attr_supported_features &= SUPPORT_GROUP_LIGHT
+
+
+def _attribute(key: str) -> Callable[[State], Any]:
+    """Return a function getting an attribute of a member state."""
+
+    def _value(state: State) -> Any:
+        return state.attributes.get(key)
+
+    return _value
+
+
+def _on_attribute(key: str) -> Callable[[State], Any]:
+    """Return a function getting an attribute of a member state if it is on."""
+
+    def _value(state: State) -> Any:
+        if state.state != STATE_ON:
+            return None
+        return state.attributes.get(key)
+
+    return _value
@@ -1,11 +1,16 @@
 """Utility functions to combine state attributes from multiple entities."""
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
 from itertools import groupby
-from typing import Any
+import math
+from typing import Any, TypeVar
 
-from homeassistant.core import State
+from homeassistant.core import State, callback
+
+_ReducerT = TypeVar("_ReducerT", bound="IncrementalReducer")
 
 
 def find_state_attributes(states: list[State], key: str) -> Iterator[Any]:
@@ -82,3 +87,195 @@ def reduce_attribute(
         return attrs[0]
 
     return reduce(*attrs)
+
+
+class IncrementalReducer(ABC):
+    """Reduce a value of the members of a group one member change at a time.
+
+    Members with a value of None do not contribute, like with
+    find_state_attributes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reducer."""
+        self.values: dict[str, Any] = {}
+
+    @callback
+    def async_update(self, entity_id: str, value: Any) -> None:
+        """Replace the value of a member."""
+        values = self.values
+        if (old_value := values.get(entity_id)) is not None:
+            if old_value == value:
+                return
+            del values[entity_id]
+            self._remove(old_value)
+        if value is not None:
+            values[entity_id] = value
+            self._add(value)
+
+    @abstractmethod
+    def _add(self, value: Any) -> None:
+        """Add the value of a member."""
+
+    @abstractmethod
+    def _remove(self, value: Any) -> None:
+        """Remove the value of a member."""
+
+
+class MeanReducer(IncrementalReducer):
+    """Mean of a numeric value, like reduce_attribute with mean_int.
+
+    The mean is summed from the values when it is read after a change, a
+    running sum updated by adding and subtracting would drift.
+    """
+
+    def __init__(self, default: Any | None = None) -> None:
+        """Initialize the reducer."""
+        super().__init__()
+        self._default = default
+        self._result: Any | None = None
+
+    def _add(self, value: Any) -> None:
+        """Add the value of a member."""
+        self._result = None
+
+    def _remove(self, value: Any) -> None:
+        """Remove the value of a member."""
+        self._result = None
+
+    @property
+    def result(self) -> Any:
+        """Return the mean of the values."""
+        if not (values := self.values):
+            return self._default
+        if len(values) == 1:
+            return next(iter(values.values()))
+        if self._result is None:
+            self._result = int(math.fsum(values.values()) / len(values))
+        return self._result
+
+
+class TupleMeanReducer(MeanReducer):
+    """Column mean of tuples, like reduce_attribute with mean_tuple."""
+
+    @property
+    def result(self) -> Any:
+        """Return the column means of the values."""
+        if not (values := self.values):
+            return self._default
+        if len(values) == 1:
+            return next(iter(values.values()))
+        if self._result is None:
+            count = len(values)
+            # Like zip, only the columns all values have are reduced
+            self._result = tuple(
+                math.fsum(column) / count for column in zip(*values.values())
+            )
+        return self._result
+
+
+class ValueCounter(IncrementalReducer):
+    """Count how many members have each value."""
+
+    def __init__(self) -> None:
+        """Initialize the reducer."""
+        super().__init__()
+        self.counts: Counter[Any] = Counter()
+
+    def _add(self, value: Any) -> None:
+        """Add the value of a member."""
+        self.counts[value] += 1
+
+    def _remove(self, value: Any) -> None:
+        """Remove the value of a member."""
+        counts = self.counts
+        if counts[value] == 1:
+            del counts[value]
+        else:
+            counts[value] -= 1
+
+    def extreme(self, func: Callable[..., Any], default: Any | None = None) -> Any:
+        """Return min or max of the values, like reduce_attribute with min or max."""
+        if not (values := self.values):
+            return default
+        if len(values) == 1:
+            return next(iter(values.values()))
+        return func(self.counts)
+
+    def most_common(
+        self, member_order: Iterable[str], counts: Counter[Any] | None = None
+    ) -> Any | None:
+        """Return the value most members have.
+
+        Ties go to the value of the first member in member_order, like
+        Counter.most_common on values collected in member order.
+        """
+        if counts is None:
+            counts = self.counts
+        if not counts:
+            return None
+        top_count = max(counts.values())
+        top_values = [value for value, count in counts.items() if count == top_count]
+        if len(top_values) == 1:
+            return top_values[0]
+        values = self.values
+        for entity_id in member_order:
+            if (value := values.get(entity_id)) is not None and value in top_values:
+                return value
+        return None
+
+
+class UnionCounter(ValueCounter):
+    """Count how many members have each item in a collection value."""
+
+    def _add(self, value: Any) -> None:
+        """Add the items of the value of a member."""
+        self.counts.update(value)
+
+    def _remove(self, value: Any) -> None:
+        """Remove the items of the value of a member."""
+        counts = self.counts
+        counts.subtract(value)
+        for item in value:
+            if counts.get(item, 0) <= 0:
+                counts.pop(item, None)
+
+
+class GroupStateAggregator:
+    """Aggregate the member states of a group incrementally.
+
+    The group feeds the aggregator the new state of each member as it
+    changes, and each registered reducer only has to account for that one
+    member instead of reducing all member states again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self.states: dict[str, State] = {}
+        self.state_counts: Counter[str] = Counter()
+        self._reducers: list[tuple[IncrementalReducer, Callable[[State], Any]]] = []
+
+    def add_reducer(
+        self, reducer: _ReducerT, value: Callable[[State], Any]
+    ) -> _ReducerT:
+        """Register a reducer of the value returned by value for each member."""
+        self._reducers.append((reducer, value))
+        return reducer
+
+    @callback
+    def async_update(self, entity_id: str, new_state: State | None) -> None:
+        """Replace the state of a member."""
+        state_counts = self.state_counts
+        if (old_state := self.states.pop(entity_id, None)) is not None:
+            if state_counts[old_state.state] == 1:
+                del state_counts[old_state.state]
+            else:
+                state_counts[old_state.state] -= 1
+        if new_state is None:
+            for reducer, _ in self._reducers:
+                reducer.async_update(entity_id, None)
+            return
+        self.states[entity_id] = new_state
+        state_counts[new_state.state] += 1
+        for reducer, value in self._reducers:
+            reducer.async_update(entity_id, value(new_state))
@@ -5,3 +5,8 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Key of the distinct attributes referenced by index from compressed states
+HISTORY_ATTRIBUTES = "attributes"
+
+HISTORY_STREAM_TAP = "history_stream_tap"
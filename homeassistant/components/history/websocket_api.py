@@ -6,7 +6,7 @@ from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 import voluptuous as vol
 
@@ -19,6 +19,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_CHANGED,
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -32,23 +33,35 @@ from homeassistant.core import (
 from homeassistant.helpers.event import (
     EventStateChangedData,
     async_track_point_in_utc_time,
-    async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_ATTRIBUTES,
+    HISTORY_STREAM_TAP,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class HistoryStreamedState(NamedTuple):
+    """A compressed state of a live history stream."""
+
+    entity_id: str
+    time_fired: dt
+    compressed_state: dict[str, Any]
+
+
 @dataclass(slots=True)
 class HistoryLiveStream:
     """Track a history live stream."""
 
-    stream_queue: asyncio.Queue[Event]
+    stream_queue: asyncio.Queue[HistoryStreamedState]
     subscriptions: list[CALLBACK_TYPE]
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
@@ -72,23 +85,33 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    deduplicate_attributes: bool,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
+    states = cast(
+        MutableMapping[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    if not deduplicate_attributes:
+        return JSON_DUMP(messages.result_message(msg_id, states))
     return JSON_DUMP(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+            {
+                "states": states,
+                HISTORY_ATTRIBUTES: _deduplicate_attributes(states),
+            },
         )
     )
 
@@ -103,6 +126,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("deduplicate_attributes", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -128,8 +152,13 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    deduplicate_attributes = msg["deduplicate_attributes"]
+    empty_result: dict[str, Any] = (
+        {"states": {}, HISTORY_ATTRIBUTES: []} if deduplicate_attributes else {}
+    )
+
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        connection.send_result(msg["id"], empty_result)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -148,7 +177,7 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        connection.send_result(msg["id"], empty_result)
         return
 
     significant_changes_only = msg["significant_changes_only"]
@@ -166,32 +195,72 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            deduplicate_attributes,
         )
     )
 
 
+def _deduplicate_attributes(
+    states: MutableMapping[str, list[dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    """Replace the attributes of compressed states by an index.
+
+    Returns the distinct attributes the indexes refer to. Rows that share
+    their attributes are decoded to the same dict, and attributes that did
+    not change since the previous state of an entity compare equal. The
+    compressed states are replaced by copies since live states are shared
+    between streams.
+    """
+    attributes: list[dict[str, Any]] = []
+    index_by_id: dict[int, int] = {}
+    for state_list in states.values():
+        prev_attrs: dict[str, Any] | None = None
+        prev_index = 0
+        for idx, comp_state in enumerate(state_list):
+            if (attrs := comp_state.get(COMPRESSED_STATE_ATTRIBUTES)) is None:
+                continue
+            if attrs is not prev_attrs and attrs != prev_attrs:
+                if (index := index_by_id.get(id(attrs))) is None:
+                    index = index_by_id[id(attrs)] = len(attributes)
+                    attributes.append(attrs)
+                prev_attrs = attrs
+                prev_index = index
+            state_list[idx] = {**comp_state, COMPRESSED_STATE_ATTRIBUTES: prev_index}
+    return attributes
+
+
 def _generate_stream_message(
     states: MutableMapping[str, list[dict[str, Any]]],
     start_day: dt,
     end_day: dt,
+    deduplicate_attributes: bool,
 ) -> dict[str, Any]:
     """Generate a history stream message response."""
-    return {
+    message: dict[str, Any] = {
         "states": states,
         "start_time": dt_util.utc_to_timestamp(start_day),
         "end_time": dt_util.utc_to_timestamp(end_day),
     }
+    if deduplicate_attributes:
+        message[HISTORY_ATTRIBUTES] = _deduplicate_attributes(states)
+    return message
 
 
 @callback
 def _async_send_empty_response(
-    connection: ActiveConnection, msg_id: int, start_time: dt, end_time: dt | None
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    deduplicate_attributes: bool,
 ) -> None:
     """Send an empty response when we know all results are filtered away."""
     connection.send_result(msg_id)
     stream_end_time = end_time or dt_util.utcnow()
     connection.send_message(
-        _generate_websocket_response(msg_id, start_time, stream_end_time, {})
+        _generate_websocket_response(
+            msg_id, start_time, stream_end_time, {}, deduplicate_attributes
+        )
     )
 
 
@@ -200,11 +269,15 @@ def _generate_websocket_response(
     start_time: dt,
     end_time: dt,
     states: MutableMapping[str, list[dict[str, Any]]],
+    deduplicate_attributes: bool,
 ) -> str:
     """Generate a websocket response."""
     return JSON_DUMP(
         messages.event_message(
-            msg_id, _generate_stream_message(states, start_time, end_time)
+            msg_id,
+            _generate_stream_message(
+                states, start_time, end_time, deduplicate_attributes
+            ),
         )
     )
 
@@ -219,6 +292,7 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    deduplicate_attributes: bool,
     send_empty: bool,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
@@ -259,7 +333,9 @@ def _generate_historical_response(
     return (
         last_time_ts,
         last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
+        _generate_websocket_response(
+            msg_id, start_time, last_time_dt, states, deduplicate_attributes
+        ),
     )
 
 
@@ -274,6 +350,7 @@ async def _async_send_historical_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    deduplicate_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
@@ -289,6 +366,7 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        deduplicate_attributes,
         send_empty,
     )
     if payload:
@@ -311,16 +389,14 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     return comp_state
 
 
-def _events_to_compressed_states(
-    events: Iterable[Event], no_attributes: bool
+def _streamed_states_by_entity_id(
+    streamed_states: Iterable[HistoryStreamedState],
 ) -> MutableMapping[str, list[dict[str, Any]]]:
-    """Convert events to a compressed states."""
+    """Group streamed compressed states by entity_id."""
     states_by_entity_ids: dict[str, list[dict[str, Any]]] = {}
-    for event in events:
-        state: State = event.data["new_state"]
-        entity_id: str = state.entity_id
-        states_by_entity_ids.setdefault(entity_id, []).append(
-            _history_compressed_state(state, no_attributes)
+    for streamed_state in streamed_states:
+        states_by_entity_ids.setdefault(streamed_state.entity_id, []).append(
+            streamed_state.compressed_state
         )
     return states_by_entity_ids
 
@@ -329,15 +405,15 @@ async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    no_attributes: bool,
+    stream_queue: asyncio.Queue[HistoryStreamedState],
+    deduplicate_attributes: bool,
 ) -> None:
     """Stream events from the queue."""
     while True:
-        events: list[Event] = [await stream_queue.get()]
+        streamed_states = [await stream_queue.get()]
         # If the event is older than the last db
         # event we already sent it so we skip it.
-        if events[0].time_fired <= subscriptions_setup_complete_time:
+        if streamed_states[0].time_fired <= subscriptions_setup_complete_time:
             continue
         # We sleep for the EVENT_COALESCE_TIME so
         # we can group events together to minimize
@@ -345,52 +421,132 @@ async def _async_events_consumer(
         # system is overloaded with an event storm
         await asyncio.sleep(EVENT_COALESCE_TIME)
         while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
-
-        if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
-                JSON_DUMP(
-                    messages.event_message(
-                        msg_id,
-                        {"states": history_states},
-                    )
-                )
+            streamed_states.append(stream_queue.get_nowait())
+
+        if history_states := _streamed_states_by_entity_id(streamed_states):
+            message: dict[str, Any] = {"states": history_states}
+            if deduplicate_attributes:
+                message[HISTORY_ATTRIBUTES] = _deduplicate_attributes(history_states)
+            connection.send_message(JSON_DUMP(messages.event_message(msg_id, message)))
+
+
+@dataclass(slots=True)
+class _HistoryStreamSubscriber:
+    """A live history stream subscribed to the stream tap."""
+
+    target: Callable[[HistoryStreamedState], None]
+    significant_changes_only: bool
+    no_attributes: bool
+
+
+class HistoryStreamTap:
+    """Convert state changes once for all live history streams.
+
+    Every state change of a streamed entity is filtered and converted to
+    a compressed state once, and routed to the streams of the entity
+    through an entity_id index.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the stream tap."""
+        self.hass = hass
+        self._subscribers: dict[str, list[_HistoryStreamSubscriber]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: list[str], subscriber: _HistoryStreamSubscriber
+    ) -> CALLBACK_TYPE:
+        """Forward the state changes of the entities to a subscriber."""
+        subscribers = self._subscribers
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+        for entity_id in entity_ids:
+            subscribers.setdefault(entity_id, []).append(subscriber)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,  # type: ignore[arg-type]
+                event_filter=self._async_filter_event,
+                run_immediately=True,
             )
 
+        @callback
+        def _async_unsubscribe() -> None:
+            """Stop forwarding state changes to the subscriber."""
+            for entity_id in entity_ids:
+                subscribers[entity_id].remove(subscriber)
+                if not subscribers[entity_id]:
+                    del subscribers[entity_id]
+            if not subscribers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_filter_event(self, event: Event) -> bool:
+        """Return if the event is for a streamed entity."""
+        return event.data["entity_id"] in self._subscribers
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Convert a state change and forward it to the subscribers."""
+        if (new_state := event.data["new_state"]) is None or (
+            old_state := event.data["old_state"]
+        ) is None:
+            return
+        if not (subscribers := self._subscribers.get(new_state.entity_id)):
+            return
+        significant = (
+            new_state.state != old_state.state
+            or new_state.domain in history.SIGNIFICANT_DOMAINS
+        )
+        streamed_states: dict[bool, HistoryStreamedState] = {}
+        # Subscribers unsubscribe when their queue is full
+        for subscriber in subscribers.copy():
+            if subscriber.significant_changes_only and not significant:
+                continue
+            no_attributes = subscriber.no_attributes
+            if (streamed_state := streamed_states.get(no_attributes)) is None:
+                streamed_state = streamed_states[no_attributes] = HistoryStreamedState(
+                    new_state.entity_id,
+                    event.time_fired,
+                    _history_compressed_state(new_state, no_attributes),
+                )
+            subscriber.target(streamed_state)
+
+
+@callback
+def _async_get_stream_tap(hass: HomeAssistant) -> HistoryStreamTap:
+    """Return the history stream tap, creating it if needed."""
+    if (tap := hass.data.get(HISTORY_STREAM_TAP)) is None:
+        tap = hass.data[HISTORY_STREAM_TAP] = HistoryStreamTap(hass)
+    return tap
+
 
 @callback
 def _async_subscribe_events(
     hass: HomeAssistant,
     subscriptions: list[CALLBACK_TYPE],
-    target: Callable[[Event], None],
+    target: Callable[[HistoryStreamedState], None],
     entity_ids: list[str],
     significant_changes_only: bool,
     minimal_response: bool,
+    no_attributes: bool,
 ) -> None:
-    """Subscribe to events for the entities and devices or all.
+    """Subscribe to the state changes of the entities.
 
     These are the events we need to listen for to do
     the live history stream.
     """
     assert is_callback(target), "target must be a callback"
-
-    @callback
-    def _forward_state_events_filtered(event: EventType[EventStateChangedData]) -> None:
-        """Filter state events and forward them."""
-        if (new_state := event.data["new_state"]) is None or (
-            old_state := event.data["old_state"]
-        ) is None:
-            return
-        if (
-            (significant_changes_only or minimal_response)
-            and new_state.state == old_state.state
-            and new_state.domain not in history.SIGNIFICANT_DOMAINS
-        ):
-            return
-        target(event)
-
     subscriptions.append(
-        async_track_state_change_event(hass, entity_ids, _forward_state_events_filtered)
+        _async_get_stream_tap(hass).async_subscribe(
+            entity_ids,
+            _HistoryStreamSubscriber(
+                target, significant_changes_only or minimal_response, no_attributes
+            ),
+        )
     )
 
 
@@ -404,6 +560,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("deduplicate_attributes", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -443,6 +600,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    deduplicate_attributes = msg["deduplicate_attributes"]
 
     if end_time and end_time <= utc_now:
         if (
@@ -452,7 +610,9 @@ async def ws_stream(
                 hass, entity_ids, start_time, no_attributes
             )
         ):
-            _async_send_empty_response(connection, msg_id, start_time, end_time)
+            _async_send_empty_response(
+                connection, msg_id, start_time, end_time, deduplicate_attributes
+            )
             return
 
         connection.subscriptions[msg_id] = callback(lambda: None)
@@ -468,12 +628,15 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            deduplicate_attributes,
             True,
         )
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_HISTORY_STATES)
+    stream_queue: asyncio.Queue[HistoryStreamedState] = asyncio.Queue(
+        MAX_PENDING_HISTORY_STATES
+    )
     live_stream = HistoryLiveStream(
         subscriptions=subscriptions, stream_queue=stream_queue
     )
@@ -498,10 +661,10 @@ async def ws_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
+    def _queue_or_cancel(streamed_state: HistoryStreamedState) -> None:
+        """Queue a state to be processed or cancel."""
         try:
-            stream_queue.put_nowait(event)
+            stream_queue.put_nowait(streamed_state)
         except asyncio.QueueFull:
             _LOGGER.debug(
                 "Client exceeded max pending messages of %s",
@@ -516,6 +679,7 @@ async def ws_stream(
         entity_ids,
         significant_changes_only=significant_changes_only,
         minimal_response=minimal_response,
+        no_attributes=no_attributes,
     )
     subscriptions_setup_complete_time = dt_util.utcnow()
     connection.subscriptions[msg_id] = _unsub
@@ -532,6 +696,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        deduplicate_attributes,
         True,
     )
 
@@ -545,7 +710,7 @@ async def ws_stream(
             connection,
             msg_id,
             stream_queue,
-            no_attributes,
+            deduplicate_attributes,
         )
     )
 
@@ -573,5 +738,6 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        deduplicate_attributes,
         send_empty=not last_event_time,
     )
@@ -1,6 +1,7 @@
 """Manage the history_stats data."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 import datetime
 
@@ -50,7 +51,12 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
+        self._history_current_period: deque[HistoryState] = deque()
+        # Running totals of the history in the current period, the seconds
+        # matched are counted up to the last state change
+        self._window_start_timestamp: float | None = None
+        self._seconds_matched_until_last_change = 0.0
+        self._match_count = 0
         self._previous_run_before_start = False
         self._entity_states = set(entity_states)
         self._duration = duration
@@ -84,7 +90,7 @@ class HistoryStats:
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
+            self._async_set_history(None, [])
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
@@ -92,13 +98,17 @@ class HistoryStats:
         # We avoid querying the database if the below did NOT happen:
         #
         # - The previous run happened before the start time
-        # - The start time changed
+        # - The start time moved backward
         # - The period shrank in size
         # - The previous period ended before now
         #
+        # When the start time moved forward, the period slides and
+        # the history before the new start is evicted
+        #
         if (
             not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
+            and self._window_start_timestamp is not None
+            and current_period_start_timestamp >= previous_period_start_timestamp
             and (
                 current_period_end_timestamp == previous_period_end_timestamp
                 or (
@@ -108,13 +118,16 @@ class HistoryStats:
             )
         ):
             new_data = False
+            if current_period_start_timestamp != previous_period_start_timestamp:
+                self._async_slide_window(current_period_start_timestamp)
+                new_data = True
             if event and (new_state := event.data["new_state"]) is not None:
                 if (
                     current_period_start_timestamp
                     <= floored_timestamp(new_state.last_changed)
                     <= current_period_end_timestamp
                 ):
-                    self._history_current_period.append(
+                    self._async_append_history(
                         HistoryState(
                             new_state.state, new_state.last_changed.timestamp()
                         )
@@ -150,10 +163,13 @@ class HistoryStats:
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
+        self._async_set_history(
+            current_period_start_timestamp,
+            [
+                HistoryState(state.state, state.last_changed.timestamp())
+                for state in states
+            ],
+        )
 
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
@@ -170,39 +186,88 @@ class HistoryStats:
             no_attributes=True,
         ).get(self.entity_id, [])
 
-    def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
-    ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
-        )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
+    def _async_set_history(
+        self, start_timestamp: float | None, period_history: list[HistoryState]
+    ) -> None:
+        """Replace the history of the current period and its running totals."""
+        self._history_current_period = deque()
+        self._window_start_timestamp = start_timestamp
+        self._seconds_matched_until_last_change = 0.0
+        self._match_count = 0
+        for history_state in period_history:
+            self._async_append_history(history_state)
 
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
+    def _async_append_history(self, history_state: HistoryState) -> None:
+        """Append a state change to the history and update the running totals."""
+        period_history = self._history_current_period
+        current_state_matches = history_state.state in self._entity_states
+        if not period_history:
+            # state_changes_during_period is called with include_start_time_state=True
+            # so the first state is the state at the start of the period
+            assert self._window_start_timestamp is not None
+            if current_state_matches:
+                self._seconds_matched_until_last_change += (
+                    history_state.last_changed - self._window_start_timestamp
+                )
+                self._match_count += 1
+            period_history.append(history_state)
+            return
+        previous_state = period_history[-1]
+        if previous_state.state in self._entity_states:
+            self._seconds_matched_until_last_change += (
+                history_state.last_changed - previous_state.last_changed
+            )
+        elif current_state_matches:
+            self._match_count += 1
+        period_history.append(history_state)
 
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
+    def _async_slide_window(self, start_timestamp: float) -> None:
+        """Move the start of the period forward and evict the history before it."""
+        period_history = self._history_current_period
+        entity_states = self._entity_states
+        window_start_timestamp = self._window_start_timestamp
+        assert window_start_timestamp is not None
+        self._window_start_timestamp = start_timestamp
+        if not period_history:
+            return
+        # The state in effect at the new start becomes the first state
+        while (
+            len(period_history) > 1
+            and period_history[1].last_changed <= start_timestamp
+        ):
+            evicted_state_matches = period_history.popleft().state in entity_states
+            first_state = period_history[0]
+            first_state_matches = first_state.state in entity_states
+            if evicted_state_matches:
+                self._seconds_matched_until_last_change -= (
+                    first_state.last_changed - window_start_timestamp
+                )
+                self._match_count -= 1
+            elif first_state_matches:
+                # No longer a change to a matching state
+                self._match_count -= 1
+            if first_state_matches:
+                self._match_count += 1
+            window_start_timestamp = first_state.last_changed
+        first_state = period_history[0]
+        if first_state.state in entity_states:
+            self._seconds_matched_until_last_change -= (
+                start_timestamp - window_start_timestamp
+            )
+        if first_state.last_changed < start_timestamp:
+            period_history[0] = HistoryState(first_state.state, start_timestamp)
+            if len(period_history) == 1:
+                self._seconds_matched_until_last_change = 0.0
 
+    def _async_compute_seconds_and_changes(
+        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
+    ) -> tuple[float, int]:
+        """Compute the seconds matched and changes from the running totals."""
+        seconds_matched = self._seconds_matched_until_last_change
         # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
+        if (period_history := self._history_current_period) and (
+            last_state := period_history[-1]
+        ).state in self._entity_states:
             measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
+            seconds_matched += measure_end - last_state.last_changed
+        return seconds_matched, self._match_count
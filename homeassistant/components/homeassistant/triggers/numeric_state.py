@@ -1,5 +1,11 @@
 """Offer numeric state listening automation rules."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
 import logging
+import math
+from typing import Any
 
 import voluptuous as vol
 
@@ -12,8 +18,10 @@ from homeassistant.const import (
     CONF_FOR,
     CONF_PLATFORM,
     CONF_VALUE_TEMPLATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
-from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import (
     condition,
     config_validation as cv,
@@ -68,6 +76,11 @@ _TRIGGER_SCHEMA = vol.All(
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_THRESHOLD_INDEXES = "numeric_state_threshold_indexes"
+
+# Marks a value which can not be compared to the thresholds
+_INVALID = object()
+
 
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
@@ -141,8 +154,8 @@ async def async_attach_trigger(
             )
 
     @callback
-    def state_automation_listener(event):
-        """Listen for state changes and calls action."""
+    def async_matched(event):
+        """Handle an armed entity that started to match and call action."""
         entity_id = event.data.get("entity_id")
         from_s = event.data.get("old_state")
         to_s = event.data.get("new_state")
@@ -176,11 +189,40 @@ async def async_attach_trigger(
             except exceptions.ConditionError:
                 # This is an internal same-state listener so we just drop the
                 # error. The same error will be reached and logged by the
-                # primary async_track_state_change_event() listener.
+                # primary state change listener.
                 return False
 
+        if time_delta:
+            try:
+                period[entity_id] = cv.positive_time_period(
+                    template.render_complex(time_delta, variables(entity_id))
+                )
+            except (exceptions.TemplateError, vol.Invalid) as ex:
+                _LOGGER.error(
+                    "Error rendering '%s' for template: %s",
+                    trigger_info["name"],
+                    ex,
+                )
+                return
+
+            unsub_track_same[entity_id] = async_track_same_state(
+                hass,
+                period[entity_id],
+                call_action,
+                entity_ids=entity_id,
+                async_check_same_func=check_numeric_state_no_raise,
+            )
+        else:
+            call_action()
+
+    @callback
+    def state_automation_listener(event):
+        """Listen for state changes and calls action."""
+        entity_id = event.data.get("entity_id")
         try:
-            matching = check_numeric_state(entity_id, from_s, to_s)
+            matching = check_numeric_state(
+                entity_id, event.data.get("old_state"), event.data.get("new_state")
+            )
         except exceptions.ConditionError as ex:
             _LOGGER.warning("Error in '%s' trigger: %s", trigger_info["name"], ex)
             return
@@ -189,31 +231,38 @@ async def async_attach_trigger(
             armed_entities.add(entity_id)
         elif entity_id in armed_entities:
             armed_entities.discard(entity_id)
+            async_matched(event)
 
-            if time_delta:
-                try:
-                    period[entity_id] = cv.positive_time_period(
-                        template.render_complex(time_delta, variables(entity_id))
-                    )
-                except (exceptions.TemplateError, vol.Invalid) as ex:
-                    _LOGGER.error(
-                        "Error rendering '%s' for template: %s",
-                        trigger_info["name"],
-                        ex,
-                    )
-                    return
-
-                unsub_track_same[entity_id] = async_track_same_state(
-                    hass,
-                    period[entity_id],
-                    call_action,
-                    entity_ids=entity_id,
-                    async_check_same_func=check_numeric_state_no_raise,
+    if (
+        value_template is None
+        and not isinstance(below, str)
+        and not isinstance(above, str)
+    ):
+        # Fixed thresholds are matched by the threshold index of the entity,
+        # which is shared by all numeric_state triggers of the entity
+        unsubs = [
+            _async_get_threshold_index(hass, entity_id, attribute).async_add(
+                _Threshold(
+                    above,
+                    below,
+                    entity_id in armed_entities,
+                    async_matched,
+                    state_automation_listener,
                 )
-            else:
-                call_action()
+            )
+            for entity_id in entity_ids
+        ]
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+        @callback
+        def unsub() -> None:
+            """Remove the thresholds from the threshold indexes."""
+            for unsub_threshold in unsubs:
+                unsub_threshold()
+
+    else:
+        unsub = async_track_state_change_event(
+            hass, entity_ids, state_automation_listener
+        )
 
     @callback
     def async_remove():
@@ -224,3 +273,203 @@ async def async_attach_trigger(
         unsub_track_same.clear()
 
     return async_remove
+
+
+class _Threshold:
+    """A fixed range of a numeric_state trigger for one entity."""
+
+    __slots__ = ("above", "below", "armed", "on_match", "on_error")
+
+    def __init__(
+        self,
+        above: float | None,
+        below: float | None,
+        armed: bool,
+        on_match: Callable[[Event], None],
+        on_error: Callable[[Event], None],
+    ) -> None:
+        """Initialize the threshold."""
+        self.above = above
+        self.below = below
+        # Armed thresholds fire when the value enters the range
+        self.armed = armed
+        self.on_match = on_match
+        # Called to report states which cannot be compared to the range
+        self.on_error = on_error
+
+    def matches(self, value: float) -> bool:
+        """Return if the value is in the range."""
+        return (self.below is None or value < self.below) and (
+            self.above is None or value > self.above
+        )
+
+
+class _ThresholdIndex:
+    """Match the state of an entity against the thresholds of all triggers.
+
+    The bounds of all thresholds are kept sorted. When the value changes,
+    only thresholds with a bound between the old and the new value can
+    start or stop matching, so only those are checked.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entity_id: str, attribute: str | None
+    ) -> None:
+        """Initialize the threshold index."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.attribute = attribute
+        self._thresholds: set[_Threshold] = set()
+        self._bounds: list[float] = []
+        self._bound_thresholds: list[_Threshold] = []
+        self._disarmed: set[_Threshold] = set()
+        # The last numeric value and the thresholds matching it
+        self._value: float | None = None
+        self._matching: set[_Threshold] = set()
+        # If the last state that could be compared was numeric
+        self._numeric = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, threshold: _Threshold) -> CALLBACK_TYPE:
+        """Add a threshold to the index."""
+        self._thresholds.add(threshold)
+        for bound in (threshold.above, threshold.below):
+            if bound is not None:
+                idx = bisect_right(self._bounds, bound)
+                self._bounds.insert(idx, bound)
+                self._bound_thresholds.insert(idx, threshold)
+        if not threshold.armed:
+            self._disarmed.add(threshold)
+        if self._value is not None and threshold.matches(self._value):
+            self._matching.add(threshold)
+        if self._unsub is None:
+            self._unsub = async_track_state_change_event(
+                self.hass, self.entity_id, self._async_state_changed
+            )
+
+        @callback
+        def remove() -> None:
+            """Remove the threshold from the index."""
+            self._async_remove(threshold)
+
+        return remove
+
+    @callback
+    def _async_remove(self, threshold: _Threshold) -> None:
+        """Remove a threshold from the index."""
+        self._thresholds.discard(threshold)
+        self._disarmed.discard(threshold)
+        self._matching.discard(threshold)
+        while threshold in self._bound_thresholds:
+            idx = self._bound_thresholds.index(threshold)
+            del self._bounds[idx]
+            del self._bound_thresholds[idx]
+        if self._thresholds:
+            return
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        del self.hass.data[DATA_THRESHOLD_INDEXES][(self.entity_id, self.attribute)]
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Fire and arm the thresholds the new state changed."""
+        if (new_state := event.data["new_state"]) is None:
+            value: Any = _INVALID
+        elif self.attribute is None:
+            value = new_state.state
+            if value not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                value = _INVALID if (fvalue := new_state.as_float) is None else fvalue
+        elif self.attribute not in new_state.attributes:
+            value = None
+        else:
+            value = new_state.attributes[self.attribute]
+            if value not in (None, STATE_UNAVAILABLE, STATE_UNKNOWN):
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    value = _INVALID
+
+        if value is _INVALID:
+            # The state can't be compared, let each trigger report it. The
+            # thresholds keep being armed or not and are all checked again
+            # against the next number.
+            self._value = None
+            for threshold in list(self._thresholds):
+                threshold.on_error(event)
+            return
+
+        if not isinstance(value, float):
+            # Unknown or unavailable, none of the thresholds match
+            self._numeric = False
+            for threshold in self._disarmed:
+                threshold.armed = True
+            self._disarmed.clear()
+            return
+
+        if math.isnan(value):
+            # NaN can't be ordered and is in every range, as it is for the
+            # numeric_state condition
+            self._value = None
+            matched = [threshold for threshold in self._thresholds if threshold.armed]
+            for threshold in matched:
+                threshold.armed = False
+                self._disarmed.add(threshold)
+            for threshold in matched:
+                threshold.on_match(event)
+            return
+
+        matching = self._matching
+        to_check: Iterable[_Threshold]
+        if self._value is None:
+            matching.clear()
+            matching.update(
+                threshold for threshold in self._thresholds if threshold.matches(value)
+            )
+            to_check = self._thresholds
+        else:
+            low, high = sorted((self._value, value))
+            changed = set(
+                self._bound_thresholds[
+                    bisect_left(self._bounds, low) : bisect_right(self._bounds, high)
+                ]
+            )
+            for threshold in changed:
+                if threshold.matches(value):
+                    matching.add(threshold)
+                else:
+                    matching.discard(threshold)
+            # After a state that was not numeric all thresholds are armed,
+            # so every matching threshold fires
+            to_check = changed if self._numeric else matching
+        self._value = value
+        self._numeric = True
+
+        matched: list[_Threshold] = []
+        for threshold in to_check:
+            if threshold in matching:
+                if threshold.armed:
+                    threshold.armed = False
+                    self._disarmed.add(threshold)
+                    matched.append(threshold)
+            elif not threshold.armed:
+                threshold.armed = True
+                self._disarmed.discard(threshold)
+        for threshold in matched:
+            threshold.on_match(event)
+
+
+@callback
+def _async_get_threshold_index(
+    hass: HomeAssistant, entity_id: str, attribute: str | None
+) -> _ThresholdIndex:
+    """Return the threshold index of an entity, creating it if needed."""
+    indexes: dict[tuple[str, str | None], _ThresholdIndex] = hass.data.setdefault(
+        DATA_THRESHOLD_INDEXES, {}
+    )
+    if (index := indexes.get((entity_id, attribute))) is None:
+        index = indexes[(entity_id, attribute)] = _ThresholdIndex(
+            hass, entity_id, attribute
+        )
+    return index
@@ -32,12 +32,10 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.derived_sensor import async_track_derived_state_change_event
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import (
-    EventStateChangedData,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, EventType
 
 from .const import (
@@ -330,34 +328,18 @@ class IntegrationSensor(RestoreSensor):
                     new_state.last_updated - old_state.last_updated
                 ).total_seconds()
 
+                old_value = old_state.as_decimal
+                new_value = new_state.as_decimal
                 if (
                     self._method == METHOD_TRAPEZOIDAL
-                    and new_state.state
-                    not in (
-                        STATE_UNKNOWN,
-                        STATE_UNAVAILABLE,
-                    )
-                    and old_state.state
-                    not in (
-                        STATE_UNKNOWN,
-                        STATE_UNAVAILABLE,
-                    )
-                ):
-                    area = (
-                        (Decimal(new_state.state) + Decimal(old_state.state))
-                        * Decimal(elapsed_time)
-                        / 2
-                    )
-                elif self._method == METHOD_LEFT and old_state.state not in (
-                    STATE_UNKNOWN,
-                    STATE_UNAVAILABLE,
-                ):
-                    area = Decimal(old_state.state) * Decimal(elapsed_time)
-                elif self._method == METHOD_RIGHT and new_state.state not in (
-                    STATE_UNKNOWN,
-                    STATE_UNAVAILABLE,
+                    and new_value is not None
+                    and old_value is not None
                 ):
-                    area = Decimal(new_state.state) * Decimal(elapsed_time)
+                    area = (new_value + old_value) * Decimal(elapsed_time) / 2
+                elif self._method == METHOD_LEFT and old_value is not None:
+                    area = old_value * Decimal(elapsed_time)
+                elif self._method == METHOD_RIGHT and new_value is not None:
+                    area = new_value * Decimal(elapsed_time)
                 else:
                     _LOGGER.debug(
                         "Could not apply method %s to %s -> %s",
@@ -389,7 +371,7 @@ class IntegrationSensor(RestoreSensor):
                 self.async_write_ha_state()
 
         self.async_on_remove(
-            async_track_state_change_event(
+            async_track_derived_state_change_event(
                 self.hass, [self._sensor_source_id], calc_integration
             )
         )
@@ -18,6 +18,8 @@ ATTR_MESSAGE = "message"
 
 DOMAIN = "logbook"
 
+LOGBOOK_STREAM_TAP = "logbook_stream_tap"
+
 CONTEXT_USER_ID = "context_user_id"
 CONTEXT_ENTITY_ID = "context_entity_id"
 CONTEXT_ENTITY_ID_NAME = "context_entity_id_name"
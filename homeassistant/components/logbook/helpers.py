@@ -23,14 +23,17 @@ from homeassistant.core import (
     split_entity_id,
 )
 from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.helpers.event import (
-    EventStateChangedData,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.typing import EventType
 
-from .const import ALWAYS_CONTINUOUS_DOMAINS, AUTOMATION_EVENTS, BUILT_IN_EVENTS, DOMAIN
-from .models import LogbookConfig
+from .const import (
+    ALWAYS_CONTINUOUS_DOMAINS,
+    AUTOMATION_EVENTS,
+    BUILT_IN_EVENTS,
+    DOMAIN,
+    LOGBOOK_STREAM_TAP,
+)
+from .models import EventAsRow, LogbookConfig, async_event_to_row
 
 
 def async_filter_entities(hass: HomeAssistant, entity_ids: list[str]) -> list[str]:
@@ -156,11 +159,106 @@ def event_forwarder_filtered(
     return _forward_events_filtered_by_device_entity_ids
 
 
+_StreamSubscriber = tuple[Callable[[str], bool] | None, Callable[[EventAsRow], None]]
+
+
+class LogbookStreamTap:
+    """Filter and convert state changes once for all live logbook streams.
+
+    Every state change is checked against the logbook filters and
+    converted to a row once, and routed to the streams of the entity
+    through an entity_id index. Streams without entity_ids get all
+    state changes that pass their entities filter.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the stream tap."""
+        self.hass = hass
+        self._ent_reg = er.async_get(hass)
+        self._subscribers: dict[str, list[_StreamSubscriber]] = {}
+        self._firehose: list[_StreamSubscriber] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        target: Callable[[EventAsRow], None],
+        entities_filter: Callable[[str], bool] | None,
+        entity_ids: list[str] | None,
+    ) -> CALLBACK_TYPE:
+        """Forward the state changes of the entities or all to a target."""
+        subscriber: _StreamSubscriber = (entities_filter, target)
+        subscribers = self._subscribers
+        firehose = self._firehose
+        entity_ids = [entity_id.lower() for entity_id in entity_ids or ()]
+        for entity_id in entity_ids:
+            subscribers.setdefault(entity_id, []).append(subscriber)
+        if not entity_ids:
+            firehose.append(subscriber)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,  # type: ignore[arg-type]
+                event_filter=self._async_filter_event,
+                run_immediately=True,
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Stop forwarding state changes to the target."""
+            for entity_id in entity_ids:
+                subscribers[entity_id].remove(subscriber)
+                if not subscribers[entity_id]:
+                    del subscribers[entity_id]
+            if not entity_ids:
+                firehose.remove(subscriber)
+            if not subscribers and not firehose and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_filter_event(self, event: Event) -> bool:
+        """Return if the event is for a streamed entity."""
+        return bool(self._firehose) or event.data["entity_id"] in self._subscribers
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Convert a state change and forward it to the subscribers."""
+        if (old_state := event.data["old_state"]) is None or (
+            new_state := event.data["new_state"]
+        ) is None:
+            return
+        entity_id = new_state.entity_id
+        subscribers = self._subscribers.get(entity_id, [])
+        if (not subscribers and not self._firehose) or _is_state_filtered(
+            self._ent_reg, new_state, old_state
+        ):
+            return
+        row: EventAsRow | None = None
+        # Subscribers unsubscribe when their queue is full
+        for entities_filter, target in (*subscribers, *self._firehose):
+            if entities_filter and not entities_filter(entity_id):
+                continue
+            if row is None:
+                row = async_event_to_row(event)
+            target(row)
+
+
+@callback
+def _async_get_stream_tap(hass: HomeAssistant) -> LogbookStreamTap:
+    """Return the logbook stream tap, creating it if needed."""
+    if (tap := hass.data.get(LOGBOOK_STREAM_TAP)) is None:
+        tap = hass.data[LOGBOOK_STREAM_TAP] = LogbookStreamTap(hass)
+    return tap
+
+
 @callback
 def async_subscribe_events(
     hass: HomeAssistant,
     subscriptions: list[CALLBACK_TYPE],
-    target: Callable[[Event], None],
+    target: Callable[[EventAsRow], None],
     event_types: tuple[str, ...],
     entities_filter: Callable[[str], bool] | None,
     entity_ids: list[str] | None,
@@ -171,10 +269,14 @@ def async_subscribe_events(
     These are the events we need to listen for to do
     the live logbook stream.
     """
-    ent_reg = er.async_get(hass)
     assert is_callback(target), "target must be a callback"
+
+    @callback
+    def _forward_event_row(event: Event) -> None:
+        target(async_event_to_row(event))
+
     event_forwarder = event_forwarder_filtered(
-        target, entities_filter, entity_ids, device_ids
+        _forward_event_row, entities_filter, entity_ids, device_ids
     )
     for event_type in event_types:
         subscriptions.append(
@@ -187,33 +289,8 @@ def async_subscribe_events(
         # changed events
         return
 
-    @callback
-    def _forward_state_events_filtered(event: EventType[EventStateChangedData]) -> None:
-        if (old_state := event.data["old_state"]) is None or (
-            new_state := event.data["new_state"]
-        ) is None:
-            return
-        if _is_state_filtered(ent_reg, new_state, old_state) or (
-            entities_filter and not entities_filter(new_state.entity_id)
-        ):
-            return
-        target(event)
-
-    if entity_ids:
-        subscriptions.append(
-            async_track_state_change_event(
-                hass, entity_ids, _forward_state_events_filtered
-            )
-        )
-        return
-
-    # We want the firehose
     subscriptions.append(
-        hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _forward_state_events_filtered,  # type: ignore[arg-type]
-            run_immediately=True,
-        )
+        _async_get_stream_tap(hass).async_subscribe(target, entities_filter, entity_ids)
     )
 
 
@@ -4,12 +4,16 @@ from __future__ import annotations
 from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
+from itertools import islice
 import logging
+import math
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -67,6 +71,13 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of contexts kept to augment the entries of a paginated request,
+# older contexts are dropped as the rows are read
+CONTEXT_WINDOW_SIZE = 2048
+# How far before the continuation point rows are read again to find
+# the context of the first entries of a page
+CONTINUATION_CONTEXT_LOOKBACK = timedelta(minutes=10)
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -83,6 +94,43 @@ class LogbookRun:
     memoize_new_contexts: bool = True
 
 
+@dataclass(slots=True, frozen=True)
+class LogbookContinuation:
+    """Position in the logbook rows to continue a paginated request from.
+
+    The rows are ordered by time fired, rows_read is the number of rows
+    with the same time fired that have already been read.
+    """
+
+    time_fired_ts: float
+    rows_read: int
+
+    def as_token(self) -> str:
+        """Return the continuation as an opaque token."""
+        return f"{self.time_fired_ts!r}:{self.rows_read}"
+
+    @classmethod
+    def from_token(cls, token: str) -> LogbookContinuation | None:
+        """Return the continuation from a token or None if it is invalid."""
+        time_fired_ts_str, _, rows_read_str = token.partition(":")
+        try:
+            time_fired_ts = float(time_fired_ts_str)
+            rows_read = int(rows_read_str)
+        except ValueError:
+            return None
+        if not math.isfinite(time_fired_ts) or rows_read < 1:
+            return None
+        return cls(time_fired_ts, rows_read)
+
+
+@dataclass(slots=True)
+class _RowPosition:
+    """Position of the last row read from the database."""
+
+    time_fired_ts: float | None = None
+    rows_read: int = 0
+
+
 class EventProcessor:
     """Stream into logbook format."""
 
@@ -135,6 +183,32 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Generate the logbook statement for the period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+
     def get_events(
         self,
         start_day: dt,
@@ -142,35 +216,95 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
+            stmt = self._statement_for_request(session, start_day, end_day)
+            return self.humanify(
+                execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
-            stmt = statement_for_request(
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        page_size: int,
+        continuation: LogbookContinuation | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookContinuation | None]:
+        """Get a page of events for a period of time.
+
+        The rows are streamed from the database and humanified as they
+        are read, and only the most recent contexts are kept, so memory
+        is bound by the page size however long the period is.
+
+        Returns the events and the continuation of the next page, or None
+        if this is the last page.
+        """
+        query_start = start_day
+        if continuation:
+            query_start = max(
                 start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+                dt_util.utc_from_timestamp(continuation.time_fired_ts)
+                - CONTINUATION_CONTEXT_LOOKBACK,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        position = _RowPosition()
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, query_start, end_day)
+            rows = execute_stmt_lambda_element(
+                session, stmt, query_start, end_day, orm_rows=False
+            )
+            entries = _humanify(
+                self._stream_rows(rows, position, continuation),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
+            )
+            events = list(islice(entries, page_size))
+            if len(events) < page_size:
+                return events, None
+            assert position.time_fired_ts is not None
+            next_continuation = LogbookContinuation(
+                position.time_fired_ts, position.rows_read
             )
+            if next(entries, None) is None:
+                return events, None
+            return events, next_continuation
+
+    def _stream_rows(
+        self,
+        rows: Sequence[Row] | Result,
+        position: _RowPosition,
+        continuation: LogbookContinuation | None,
+    ) -> Generator[Row, None, None]:
+        """Track the position of the rows and skip the rows already sent.
+
+        Rows before the continuation are only used for their context.
+        """
+        logbook_run = self.logbook_run
+        context_lookup = logbook_run.context_lookup
+        for rows_read, row in enumerate(rows, 1):
+            if not rows_read % CONTEXT_WINDOW_SIZE:
+                _prune_context_lookup(context_lookup)
+                logbook_run.event_cache.clear()
+            if (time_fired_ts := row.time_fired_ts) == position.time_fired_ts:
+                position.rows_read += 1
+            else:
+                position.time_fired_ts = time_fired_ts
+                position.rows_read = 1
+            if continuation and (
+                time_fired_ts < continuation.time_fired_ts
+                or (
+                    time_fired_ts == continuation.time_fired_ts
+                    and position.rows_read <= continuation.rows_read
+                )
+            ):
+                context_lookup.setdefault(row.context_id_bin, row)
+                continue
+            yield row
 
     def humanify(
-        self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
+        self,
+        rows: Generator[EventAsRow, None, None]
+        | Sequence[EventAsRow]
+        | Sequence[Row]
+        | Result,
     ) -> list[dict[str, str]]:
         """Humanify rows."""
         return list(
@@ -184,7 +318,10 @@ class EventProcessor:
 
 
 def _humanify(
-    rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow | Row, None, None]
+    | Sequence[EventAsRow]
+    | Sequence[Row]
+    | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -370,6 +507,18 @@ class ContextAugmenter:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
 
 
+def _prune_context_lookup(
+    context_lookup: dict[bytes | None, Row | EventAsRow | None]
+) -> None:
+    """Drop the oldest contexts that are outside of the context window."""
+    if (excess := len(context_lookup) - CONTEXT_WINDOW_SIZE) <= 0:
+        return
+    # The None context is the first key and must be kept
+    for context_id_bin in list(islice(context_lookup, excess + 1)):
+        if context_id_bin is not None:
+            del context_lookup[context_id_bin]
+
+
 def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
     """Check of rows match by using the same method as Events __hash__."""
     return bool(
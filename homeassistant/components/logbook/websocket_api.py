@@ -14,7 +14,7 @@ from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import JSON_DUMP
 import homeassistant.util.dt as dt_util
@@ -25,8 +25,8 @@ from .helpers import (
     async_filter_entities,
     async_subscribe_events,
 )
-from .models import LogbookConfig, async_event_to_row
-from .processor import EventProcessor
+from .models import EventAsRow, LogbookConfig
+from .processor import EventProcessor, LogbookContinuation
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -34,6 +34,9 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+MAX_LOGBOOK_PAGE_SIZE = 10000
+
+_EMPTY_LOGBOOK_PAGE: dict[str, Any] = {"events": [], "continuation": None}
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,7 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
+    stream_queue: asyncio.Queue[EventAsRow]
     subscriptions: list[CALLBACK_TYPE]
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
@@ -216,15 +219,18 @@ async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
-    stream_queue: asyncio.Queue[Event],
+    stream_queue: asyncio.Queue[EventAsRow],
     event_processor: EventProcessor,
 ) -> None:
     """Stream events from the queue."""
+    subscriptions_setup_complete_time_ts = dt_util.utc_to_timestamp(
+        subscriptions_setup_complete_time
+    )
     while True:
-        events: list[Event] = [await stream_queue.get()]
+        rows: list[EventAsRow] = [await stream_queue.get()]
         # If the event is older than the last db
         # event we already sent it so we skip it.
-        if events[0].time_fired <= subscriptions_setup_complete_time:
+        if rows[0].time_fired_ts <= subscriptions_setup_complete_time_ts:
             continue
         # We sleep for the EVENT_COALESCE_TIME so
         # we can group events together to minimize
@@ -232,11 +238,9 @@ async def _async_events_consumer(
         # system is overloaded with an event storm
         await asyncio.sleep(EVENT_COALESCE_TIME)
         while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
+            rows.append(stream_queue.get_nowait())
 
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
+        if logbook_events := event_processor.humanify(rows):
             connection.send_message(
                 JSON_DUMP(
                     messages.event_message(
@@ -320,7 +324,7 @@ async def ws_event_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
+    stream_queue: asyncio.Queue[EventAsRow] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
     live_stream = LogbookLiveStream(
         subscriptions=subscriptions, stream_queue=stream_queue
     )
@@ -345,10 +349,10 @@ async def ws_event_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
+    def _queue_or_cancel(row: EventAsRow) -> None:
         """Queue an event to be processed or cancel."""
         try:
-            stream_queue.put_nowait(event)
+            stream_queue.put_nowait(row)
         except asyncio.QueueFull:
             _LOGGER.debug(
                 "Client exceeded max pending messages of %s",
@@ -444,6 +448,31 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    page_size: int,
+    continuation: LogbookContinuation | None,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_continuation = event_processor.get_events_page(
+        start_time, end_time, page_size, continuation
+    )
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "continuation": next_continuation.as_token()
+                if next_continuation
+                else None,
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -452,6 +481,10 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("page_size"): vol.All(
+            int, vol.Range(min=1, max=MAX_LOGBOOK_PAGE_SIZE)
+        ),
+        vol.Optional("continuation"): str,
     }
 )
 @websocket_api.async_response
@@ -477,8 +510,21 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    page_size: int | None = msg.get("page_size")
+    continuation: LogbookContinuation | None = None
+    if continuation_token := msg.get("continuation"):
+        if page_size is None or not (
+            continuation := LogbookContinuation.from_token(continuation_token)
+        ):
+            connection.send_error(
+                msg["id"], "invalid_continuation", "Invalid continuation"
+            )
+            return
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(
+            msg["id"], [] if page_size is None else _EMPTY_LOGBOOK_PAGE
+        )
         return
 
     device_ids = msg.get("device_ids")
@@ -488,7 +534,9 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(
+                msg["id"], [] if page_size is None else _EMPTY_LOGBOOK_PAGE
+            )
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -503,6 +551,20 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if page_size is not None:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                page_size,
+                continuation,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -328,14 +328,14 @@ class MinMaxSensor(SensorEntity):
             )
             self._unit_of_measurement_mismatch = True
 
-        try:
-            self.states[entity] = float(new_state.state)
-            self.last = float(new_state.state)
-            self.last_entity_id = entity
-        except ValueError:
+        if (value := new_state.as_float) is None:
             _LOGGER.warning(
                 "Unable to store state. Only numerical states are supported"
             )
+        else:
+            self.states[entity] = value
+            self.last = value
+            self.last_entity_id = entity
 
         if not update_state:
             return
@@ -160,6 +160,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     instance.async_initialize()
     instance.async_register()
+    await instance.async_load_warm_start()
     instance.start()
     async_register_services(hass, instance)
     websocket_api.async_setup(hass)
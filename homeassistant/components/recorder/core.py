@@ -30,12 +30,15 @@ from homeassistant.const import (
     MATCH_ALL,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import restore_state
 from homeassistant.helpers.event import (
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
@@ -112,6 +115,7 @@ from .tasks import (
     PurgeTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -150,6 +154,11 @@ KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
+# The ids cached by the table managers are stored at shutdown
+# so the caches are warm when the recorder starts again
+ID_CACHE_STORAGE_KEY = f"{DOMAIN}.id_cache"
+ID_CACHE_STORAGE_VERSION = 1
+
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
@@ -223,6 +232,16 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # The time zone the daily and monthly statistics rollups are valid for
+        self.statistics_rollups_time_zone: str | None = None
+        # The time zone and the start of the next month of a rollups rebuild,
+        # None as start until the old rollups are deleted
+        self.statistics_rollups_rebuild: tuple[str, float | None] | None = None
+        self._id_cache_store = Store[dict[str, list[int]]](
+            hass, ID_CACHE_STORAGE_VERSION, ID_CACHE_STORAGE_KEY
+        )
+        self._warm_start_ids: dict[str, list[int]] | None = None
+        self._warm_start_entity_ids: list[str] = []
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -345,6 +364,33 @@ class Recorder(threading.Thread):
             name="Recorder queue watcher",
         )
 
+    async def async_load_warm_start(self) -> None:
+        """Load the ids to prime the table manager caches with at startup."""
+        try:
+            self._warm_start_ids = await self._id_cache_store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Error loading the recorder id cache: %s", err)
+        if restore_state.DATA_RESTORE_STATE in self.hass.data:
+            # Entities with a restored state are likely to write the
+            # same state attributes again soon after startup
+            self._warm_start_entity_ids = list(
+                restore_state.async_get(self.hass).last_states
+            )
+
+    async def _async_save_id_cache(self) -> None:
+        """Save the ids cached by the table managers.
+
+        Must only be called once the recorder thread has finished.
+        """
+        if self.schema_version != SCHEMA_VERSION:
+            return
+        id_cache = {"state_attributes": self.state_attributes_manager.get_cached_ids()}
+        if self.event_type_manager.active:
+            id_cache["event_types"] = self.event_type_manager.get_cached_ids()
+        if self.states_meta_manager.active:
+            id_cache["states_meta"] = self.states_meta_manager.get_cached_ids()
+        await self._id_cache_store.async_save(id_cache)
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -471,6 +517,7 @@ class Recorder(threading.Thread):
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
+        await self._async_save_id_cache()
 
     @callback
     def _async_hass_started(self, hass: HomeAssistant) -> None:
@@ -570,6 +617,12 @@ class Recorder(threading.Thread):
         """
         start = statistics.get_start_time()
         self.queue_task(StatisticsTask(start, True))
+        if self.statistics_rollups_time_zone not in (
+            None,
+            str(dt_util.DEFAULT_TIME_ZONE),
+        ):
+            # The time zone has changed, the rollups need to be rebuilt
+            self.queue_task(StatisticsRollupTask())
 
     @callback
     def async_adjust_statistics(
@@ -844,6 +897,10 @@ class Recorder(threading.Thread):
                         self.queue_task(EventIdMigrationTask())
                         self.use_legacy_events_index = True
 
+        # The daily and monthly statistics are rebuilt if they do not
+        # match the hourly statistics or the time zone
+        self.queue_task(StatisticsRollupTask())
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -889,11 +946,47 @@ class Recorder(threading.Thread):
 
         assert self.event_session is not None
         session = self.event_session
+        self._warm_start_table_managers(session)
         self.event_data_manager.load(non_state_change_events, session)
         self.event_type_manager.load(non_state_change_events, session)
         self.states_meta_manager.load(state_change_events, session)
         self.state_attributes_manager.load(state_change_events, session)
 
+    def _warm_start_table_managers(self, session: Session) -> None:
+        """Prime the table manager caches with the ids cached at the last shutdown.
+
+        The cached ids are validated by looking them up in the database,
+        and the attributes of the latest states of the entities with a
+        restored state are fetched in bulk.
+        """
+        warm_start_ids = self._warm_start_ids or {}
+        entity_ids = self._warm_start_entity_ids
+        self._warm_start_ids = None
+        self._warm_start_entity_ids = []
+        if self.states_meta_manager.active:
+            if entity_ids:
+                metadata_ids = self.states_meta_manager.get_many(
+                    entity_ids, session, True
+                )
+                self.state_attributes_manager.load_latest(
+                    [
+                        metadata_id
+                        for metadata_id in metadata_ids.values()
+                        if metadata_id is not None
+                    ],
+                    session,
+                )
+            self.states_meta_manager.load_ids(
+                warm_start_ids.get("states_meta", []), session
+            )
+        if self.event_type_manager.active:
+            self.event_type_manager.load_ids(
+                warm_start_ids.get("event_types", []), session
+            )
+        self.state_attributes_manager.load_ids(
+            warm_start_ids.get("state_attributes", []), session
+        )
+
     def _guarded_process_one_task_or_recover(self, task: RecorderTask) -> None:
         """Process a task, guarding against exceptions to ensure the loop does not collapse."""
         _LOGGER.debug("Processing task: %s", task)
@@ -63,7 +63,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -1060,6 +1062,14 @@ def _apply_update(  # noqa: C901
     elif new_version == 41:
         _create_index(session_maker, "event_types", "ix_event_types_event_type")
         _create_index(session_maker, "states_meta", "ix_states_meta_entity_id")
+    elif new_version == 42:
+        # The rollup tables are filled by the StatisticsRollupTask
+        # once the migration is done.
+        #
+        # We need to cast __table__ to Table, explanation in
+        # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+        cast(Table, StatisticsDaily.__table__).create(engine, checkfirst=True)
+        cast(Table, StatisticsMonthly.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -16,7 +16,11 @@ from homeassistant.const import (
 from homeassistant.core import Context, State
 import homeassistant.util.dt as dt_util
 
-from .state_attributes import decode_attributes_from_source
+from .state_attributes import (
+    AttributesCache,
+    decode_attribute_from_source,
+    decode_attributes_from_source,
+)
 from .time import process_timestamp
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,7 +52,7 @@ class LazyState(State):
     def __init__(  # pylint: disable=super-init-not-called
         self,
         row: Row,
-        attr_cache: dict[str, dict[str, Any]],
+        attr_cache: AttributesCache,
         start_time_ts: float | None,
         entity_id: str,
         state: str,
@@ -79,6 +83,14 @@ class LazyState(State):
         """Set attributes."""
         self._attributes = value
 
+    def attribute(self, key: str, default: Any = None) -> Any:
+        """Return a single attribute without decoding all attributes if possible."""
+        if self._attributes is not None:
+            return self._attributes.get(key, default)
+        return decode_attribute_from_source(
+            getattr(self._row, "attributes", None), key, self.attr_cache, default
+        )
+
     @property
     def context(self) -> Context:
         """State context."""
@@ -139,7 +151,7 @@ class LazyState(State):
 
 def row_to_compressed_state(
     row: Row,
-    attr_cache: dict[str, dict[str, Any]],
+    attr_cache: AttributesCache,
     start_time_ts: float | None,
     entity_id: str,
     state: str,
@@ -25,3 +25,45 @@ def decode_attributes_from_source(
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
     return attributes
+
+
+class AttributesCache(dict[str, dict[str, Any]]):
+    """Cache of decoded attributes by row source.
+
+    Also remembers which keys are missing from sources that were not
+    decoded, so looking up a missing key only scans each source once.
+    """
+
+    __slots__ = ("missing_keys",)
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        super().__init__()
+        self.missing_keys: dict[str, set[str]] = {}
+
+
+def decode_attribute_from_source(
+    source: Any, key: str, attr_cache: AttributesCache, default: Any = None
+) -> Any:
+    """Decode a single attribute from a row source.
+
+    Sources that were not decoded yet and that do not contain the key are
+    not decoded at all.
+    """
+    if not source or source == EMPTY_JSON_OBJECT:
+        return default
+    if (attributes := attr_cache.get(source)) is None:
+        if _is_plain_key(key):
+            missing_keys = attr_cache.missing_keys
+            if key in missing_keys.get(source, ()):
+                return default
+            if f'"{key}"' not in source:
+                missing_keys.setdefault(source, set()).add(key)
+                return default
+        attributes = decode_attributes_from_source(source, attr_cache)
+    return attributes.get(key, default)
+
+
+def _is_plain_key(key: str) -> bool:
+    """Return if the key is encoded verbatim in JSON."""
+    return key.isascii() and key.isprintable() and '"' not in key and "\\" not in key
@@ -21,22 +21,32 @@ from .queries import (
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_in_range,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_in_range,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_in_range,
+    find_attributes_ids_in_range,
+    find_data_ids_in_range,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_id_range,
+    find_events_purge_boundary,
     find_events_to_purge,
+    find_existing_state_ids,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_id_range,
+    find_states_purge_boundary,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -182,8 +192,10 @@ def _purge_states_and_attributes_ids(
 
     Returns true if there are more states to purge.
     """
-    database_engine = instance.database_engine
-    assert database_engine is not None
+    if _purge_states_by_range(instance, session, states_batch_size, purge_before):
+        return True
+    # The range purge is done, purge any states left behind above the
+    # boundary, these only exist if the clock went backwards.
     has_remaining_state_ids_to_purge = True
     # There are more states relative to attributes_ids so
     # we purge enough state_ids to try to generate a full
@@ -219,6 +231,10 @@ def _purge_events_and_data_ids(
 
     Returns true if there are more states to purge.
     """
+    if _purge_events_by_range(instance, session, events_batch_size, purge_before):
+        return True
+    # The range purge is done, purge any events left behind above the
+    # boundary, these only exist if the clock went backwards.
     has_remaining_event_ids_to_purge = True
     # There are more events relative to data_ids so
     # we purge enough event_ids to try to generate a full
@@ -244,6 +260,135 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _purge_states_by_range(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge a chunk of states by state_id range.
+
+    States are inserted in time order so the states older than purge_before
+    are below the state_id of the oldest state to keep. We find that
+    boundary and delete the states below it by primary key range instead
+    of selecting every state_id first.
+
+    Only full chunks are purged by range, the remaining states close to
+    the boundary are purged by selecting their state_ids.
+
+    Returns true if states were purged and there may be more to purge.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    start_state_id, max_state_id = session.execute(find_states_id_range()).one()
+    if start_state_id is None:
+        return False
+    boundary_state_id = session.execute(
+        find_states_purge_boundary(purge_before_ts)
+    ).scalar()
+    if boundary_state_id is None:
+        boundary_state_id = max_state_id + 1
+    end_state_id = start_state_id + instance.max_bind_vars * states_batch_size
+    if end_state_id > boundary_state_id:
+        return False
+
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_attributes_ids_in_range(start_state_id, end_state_id, purge_before_ts)
+        )
+    }
+    # Update old_state_id to NULL before deleting to ensure
+    # the delete does not fail due to a foreign key constraint
+    # since some databases (MSSQL) cannot do the ON DELETE SET NULL
+    # for us.
+    disconnected_rows = session.execute(
+        disconnect_states_rows_in_range(start_state_id, end_state_id, purge_before_ts)
+    ).rowcount  # type: ignore[attr-defined]
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+    deleted_rows = session.execute(
+        delete_states_rows_in_range(start_state_id, end_state_id, purge_before_ts)
+    ).rowcount  # type: ignore[attr-defined]
+    _LOGGER.debug(
+        "Deleted %s states in state_id range %s-%s",
+        deleted_rows,
+        start_state_id,
+        end_state_id,
+    )
+    _evict_purged_state_id_range(instance, session, start_state_id, end_state_id)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    # Stop once a range no longer has anything to purge so states in the
+    # range that must be kept cannot make the purge loop forever.
+    return bool(deleted_rows)
+
+
+def _evict_purged_state_id_range(
+    instance: Recorder, session: Session, start_state_id: int, end_state_id: int
+) -> None:
+    """Evict the states purged from a range of state_ids from the old states cache.
+
+    Only states that no longer exist are evicted since the range may
+    contain states that are newer than purge_before.
+    """
+    states_manager = instance.states_manager
+    if not (
+        committed_state_ids := states_manager.committed_state_ids_in_range(
+            start_state_id, end_state_id
+        )
+    ):
+        return
+    existing_state_ids: set[int] = set()
+    for state_ids_chunk in chunked(committed_state_ids, instance.max_bind_vars):
+        existing_state_ids.update(
+            state_id
+            for (state_id,) in session.execute(find_existing_state_ids(state_ids_chunk))
+        )
+    states_manager.evict_purged_state_ids(committed_state_ids - existing_state_ids)
+
+
+def _purge_events_by_range(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge a chunk of events by event_id range.
+
+    See _purge_states_by_range for how the range is found.
+
+    Returns true if events were purged and there may be more to purge.
+    """
+    purge_before_ts = dt_util.utc_to_timestamp(purge_before)
+    start_event_id, max_event_id = session.execute(find_events_id_range()).one()
+    if start_event_id is None:
+        return False
+    boundary_event_id = session.execute(
+        find_events_purge_boundary(purge_before_ts)
+    ).scalar()
+    if boundary_event_id is None:
+        boundary_event_id = max_event_id + 1
+    end_event_id = start_event_id + instance.max_bind_vars * events_batch_size
+    if end_event_id > boundary_event_id:
+        return False
+
+    data_ids = {
+        data_id
+        for (data_id,) in session.execute(
+            find_data_ids_in_range(start_event_id, end_event_id, purge_before_ts)
+        )
+    }
+    deleted_rows = session.execute(
+        delete_event_rows_in_range(start_event_id, end_event_id, purge_before_ts)
+    ).rowcount  # type: ignore[attr-defined]
+    _LOGGER.debug(
+        "Deleted %s events in event_id range %s-%s",
+        deleted_rows,
+        start_event_id,
+        end_event_id,
+    )
+    _purge_unused_data_ids(instance, session, data_ids)
+    return bool(deleted_rows)
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
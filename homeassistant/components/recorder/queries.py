@@ -41,6 +41,34 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_shared_attributes_by_ids(attributes_ids: list[int]) -> StatementLambdaElement:
+    """Load shared attributes by attributes_ids from the database."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(StateAttributes.attributes_id.in_(attributes_ids))
+    )
+
+
+def get_latest_shared_attributes(metadata_ids: list[int]) -> StatementLambdaElement:
+    """Load the shared attributes of the latest state of each metadata_id."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(
+            StateAttributes.attributes_id.in_(
+                select(
+                    select(States.attributes_id)
+                    .where(States.metadata_id == StatesMeta.metadata_id)
+                    .order_by(States.last_updated_ts.desc())
+                    .limit(1)
+                    .scalar_subquery()
+                ).where(StatesMeta.metadata_id.in_(metadata_ids))
+            )
+        )
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -50,6 +78,15 @@ def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_shared_event_datas_by_ids(data_ids: list[int]) -> StatementLambdaElement:
+    """Load shared event data by data_ids from the database."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id, EventData.shared_data).where(
+            EventData.data_id.in_(data_ids)
+        )
+    )
+
+
 def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
     """Find an event_type id by event_type."""
     return lambda_stmt(
@@ -59,6 +96,15 @@ def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
     )
 
 
+def find_event_types_by_ids(event_type_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find event_types by event_type_ids."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type_id, EventTypes.event_type).filter(
+            EventTypes.event_type_id.in_(event_type_ids)
+        )
+    )
+
+
 def find_all_states_metadata_ids() -> StatementLambdaElement:
     """Find all metadata_ids and entity_ids."""
     return lambda_stmt(lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id))
@@ -73,6 +119,17 @@ def find_states_metadata_ids(entity_ids: Iterable[str]) -> StatementLambdaElemen
     )
 
 
+def find_states_metadata_by_ids(
+    metadata_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find entity_ids by metadata_ids."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id).filter(
+            StatesMeta.metadata_id.in_(metadata_ids)
+        )
+    )
+
+
 def _state_attrs_exist(attr: int | None) -> Select:
     """Check if a state attributes id exists in the states table."""
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
@@ -633,6 +690,124 @@ def find_states_to_purge(
     )
 
 
+def find_states_purge_boundary(purge_before: float) -> StatementLambdaElement:
+    """Find the state_id of the oldest state to keep."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.last_updated_ts >= purge_before)
+        .order_by(States.last_updated_ts)
+        .limit(1)
+    )
+
+
+def find_events_purge_boundary(purge_before: float) -> StatementLambdaElement:
+    """Find the event_id of the oldest event to keep."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.time_fired_ts >= purge_before)
+        .order_by(Events.time_fired_ts)
+        .limit(1)
+    )
+
+
+def find_states_id_range() -> StatementLambdaElement:
+    """Find the lowest and highest state_id."""
+    return lambda_stmt(
+        lambda: select(func.min(States.state_id), func.max(States.state_id))
+    )
+
+
+def find_events_id_range() -> StatementLambdaElement:
+    """Find the lowest and highest event_id."""
+    return lambda_stmt(
+        lambda: select(func.min(Events.event_id), func.max(Events.event_id))
+    )
+
+
+def disconnect_states_rows_in_range(
+    start_state_id: int, end_state_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Disconnect states rows linked to states purged in a range of state_ids."""
+    # The purged state_ids are wrapped in a derived table since
+    # MySQL cannot select from the table it updates in a subquery.
+    return lambda_stmt(
+        lambda: update(States)
+        .where(
+            States.old_state_id.in_(
+                select(
+                    select(States.state_id)
+                    .where(States.state_id >= start_state_id)
+                    .where(States.state_id < end_state_id)
+                    .where(States.last_updated_ts < purge_before)
+                    .subquery()
+                    .c.state_id
+                )
+            )
+        )
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_attributes_ids_in_range(
+    start_state_id: int, end_state_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find attributes_ids of states purged in a range of state_ids."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id))
+        .where(States.state_id >= start_state_id)
+        .where(States.state_id < end_state_id)
+        .where(States.last_updated_ts < purge_before)
+        .where(States.attributes_id.is_not(None))
+    )
+
+
+def find_data_ids_in_range(
+    start_event_id: int, end_event_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find data_ids of events purged in a range of event_ids."""
+    return lambda_stmt(
+        lambda: select(distinct(Events.data_id))
+        .where(Events.event_id >= start_event_id)
+        .where(Events.event_id < end_event_id)
+        .where(Events.time_fired_ts < purge_before)
+        .where(Events.data_id.is_not(None))
+    )
+
+
+def find_existing_state_ids(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find which of the given state_ids still exist."""
+    return lambda_stmt(
+        lambda: select(States.state_id).where(States.state_id.in_(state_ids))
+    )
+
+
+def delete_states_rows_in_range(
+    start_state_id: int, end_state_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Delete states rows older than purge_before in a range of state_ids."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= start_state_id)
+        .where(States.state_id < end_state_id)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_event_rows_in_range(
+    start_event_id: int, end_event_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Delete events rows older than purge_before in a range of event_ids."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= start_event_id)
+        .where(Events.event_id < end_event_id)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
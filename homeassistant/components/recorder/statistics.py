@@ -1,17 +1,18 @@
 """Statistics helper."""
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
-from operator import itemgetter
+from operator import is_not, itemgetter
 import re
-from statistics import mean
+from statistics import fmean
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
@@ -57,6 +58,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -122,6 +126,28 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_STATISTICS_ROLLUP_MEAN = (
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+    func.count(Statistics.mean),
+)
+
+QUERY_STATISTICS_ROLLUP_SUM = (
+    Statistics.metadata_id,
+    Statistics.start_ts,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(  # type: ignore[no-untyped-call]
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: DataRateConverter for unit in DataRateConverter.VALID_UNITS},
@@ -144,6 +170,8 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+_is_not_none = partial(is_not, None)
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -425,6 +453,10 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    # Add the hour to the daily and monthly rollups it belongs to
+    if summary:
+        _add_hour_to_statistics_rollups(session, summary, start_time_ts)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -857,62 +889,44 @@ def list_statistic_ids(
 
 
 def _reduce_statistics(
-    stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
+    stats_list: list[Row],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
-    _want_mean = "mean" in types
-    _want_min = "min" in types
-    _want_max = "max" in types
-    _want_last_reset = "last_reset" in types
-    _want_state = "state" in types
-    _want_sum = "sum" in types
-    for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
-
-    return result
+    start_ts_idx: int,
+    mean_idx: int | None,
+    min_idx: int | None,
+    max_idx: int | None,
+) -> list[list[Any]]:
+    """Reduce the hourly statistics rows of a statistic to one row per period.
+
+    The rows are processed column by column, the rows of each period are
+    found by bisecting the start column and their mean, min and max are
+    computed on slices of the columns. The other columns are taken from the
+    last row of the period.
+    """
+    columns = list(zip(*stats_list))
+    start_ts_column = columns[start_ts_idx]
+    reduced: list[list[Any]] = []
+    idx = 0
+    num_rows = len(stats_list)
+    while idx < num_rows:
+        period_start, period_end = period_start_end(start_ts_column[idx])
+        end_idx = bisect_left(start_ts_column, period_end, idx)
+        row = list(stats_list[end_idx - 1])
+        row[start_ts_idx] = period_start
+        if mean_idx is not None:
+            values = list(filter(_is_not_none, columns[mean_idx][idx:end_idx]))
+            row[mean_idx] = fmean(values) if values else None
+        if min_idx is not None:
+            row[min_idx] = min(
+                filter(_is_not_none, columns[min_idx][idx:end_idx]), default=None
+            )
+        if max_idx is not None:
+            row[max_idx] = max(
+                filter(_is_not_none, columns[max_idx][idx:end_idx]), default=None
+            )
+        reduced.append(row)
+        idx = end_idx
+    return reduced
 
 
 def reduce_day_ts_factory() -> (
@@ -952,17 +966,6 @@ def reduce_day_ts_factory() -> (
     return _same_day_ts, _day_start_end_ts_cached
 
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
-
-
 def reduce_week_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1002,17 +1005,6 @@ def reduce_week_ts_factory() -> (
     return _same_week_ts, _week_start_end_ts_cached
 
 
-def _reduce_statistics_per_week(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
-
-
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1059,15 +1051,357 @@ def reduce_month_ts_factory() -> (
     return _same_month_ts, _month_start_end_ts_cached
 
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
+STATISTICS_PERIODS: dict[
+    str,
+    Callable[
+        [],
+        tuple[
+            Callable[[float, float], bool],
+            Callable[[float], tuple[float, float]],
+        ],
+    ],
+] = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+STATISTICS_ROLLUPS: dict[
+    str,
+    tuple[
+        type[StatisticsRollupBase],
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool],
+                Callable[[float], tuple[float, float]],
+            ],
+        ],
+    ],
+] = {
+    "day": (StatisticsDaily, reduce_day_ts_factory),
+    "month": (StatisticsMonthly, reduce_month_ts_factory),
+}
+
+
+def _compile_statistics_rollup_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for a statistics rollup."""
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_ROLLUP_MEAN)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_ids is not None:
+        stmt += lambda q: q.filter(
+            # https://github.com/python/mypy/issues/2608
+            Statistics.metadata_id.in_(metadata_ids)  # type:ignore[arg-type]
+        )
+    stmt += lambda q: q.group_by(Statistics.metadata_id).order_by(
+        Statistics.metadata_id
+    )
+    return stmt
+
+
+def _compile_statistics_rollup_last_sum_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the last sum statement for a statistics rollup."""
+    if metadata_ids is None:
+        return lambda_stmt(
+            lambda: select(
+                subquery := (
+                    select(*QUERY_STATISTICS_ROLLUP_SUM)
+                    .filter(Statistics.start_ts >= start_time_ts)
+                    .filter(Statistics.start_ts < end_time_ts)
+                    .subquery()
+                )
+            )
+            .filter(subquery.c.rownum == 1)
+            .order_by(subquery.c.metadata_id)
+        )
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                select(*QUERY_STATISTICS_ROLLUP_SUM)
+                .filter(Statistics.start_ts >= start_time_ts)
+                .filter(Statistics.start_ts < end_time_ts)
+                .filter(
+                    Statistics.metadata_id.in_(metadata_ids)  # type:ignore[arg-type]
+                )
+                .subquery()
+            )
+        )
+        .filter(subquery.c.rownum == 1)
+        .order_by(subquery.c.metadata_id)
+    )
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile the daily or monthly rollup of the hourly statistics for one period.
+
+    This summarizes the hourly statistics the same way the hourly statistics
+    summarize the 5-minute statistics:
+    - average, min max is computed by a database query
+    - sum is taken from the last hourly entry during the period
+
+    If metadata_ids is None, the period is compiled for all statistics.
+    """
+    summary: dict[int, StatisticDataTimestamp] = {}
+    mean_counts: dict[int, int] = {}
+    stmt = _compile_statistics_rollup_mean_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, _mean, _min, _max, mean_count in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary[metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        mean_counts[metadata_id] = mean_count
+
+    stmt = _compile_statistics_rollup_last_sum_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, _, last_reset_ts, state, _sum, _ in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary.setdefault(metadata_id, {"start_ts": start_time_ts}).update(
+            {
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    query = session.query(table).filter(table.start_ts == start_time_ts)
+    if metadata_ids is not None:
+        query = query.filter(table.metadata_id.in_(metadata_ids))
+    query.delete(synchronize_session=False)
+    for metadata_id, summary_item in summary.items():
+        rollup = table.from_stats_ts(metadata_id, summary_item)
+        rollup.mean_count = mean_counts.get(metadata_id, 0)
+        session.add(rollup)
+
+
+def _add_hour_to_statistics_rollup(
+    rollup: StatisticsRollupBase, hour: StatisticDataTimestamp
+) -> None:
+    """Add an hour compiled after the hours of a rollup to the rollup."""
+    if (mean := hour.get("mean")) is not None:
+        if not (mean_count := rollup.mean_count) or rollup.mean is None:
+            rollup.mean = mean
+            mean_count = 0
+        else:
+            rollup.mean += (mean - rollup.mean) / (mean_count + 1)
+        rollup.mean_count = mean_count + 1
+    if (_min := hour.get("min")) is not None and (
+        rollup.min is None or _min < rollup.min
+    ):
+        rollup.min = _min
+    if (_max := hour.get("max")) is not None and (
+        rollup.max is None or _max > rollup.max
+    ):
+        rollup.max = _max
+    if "sum" in hour:
+        # The hour is the last one of the period
+        rollup.last_reset_ts = hour.get("last_reset_ts")
+        rollup.state = hour.get("state")
+        rollup.sum = hour.get("sum")
+
+
+def _add_hour_to_statistics_rollups(
+    session: Session, summary: dict[int, StatisticDataTimestamp], start_time_ts: float
+) -> None:
+    """Add a newly compiled hour to the rollups of the day and month it belongs to.
+
+    Hours are compiled in order, so the rollups are updated from the hour
+    without reading the other hours of the periods again.
+    """
+    # Flush the hourly statistics before the rollups are updated, so
+    # integrity errors are raised here rather than in the rollup queries
+    session.flush()
+    metadata_ids = list(summary)
+    for table, period_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = period_factory()
+        period_start_ts = period_start_end(start_time_ts)[0]
+        rollups = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(table)
+            .filter(table.start_ts == period_start_ts)
+            .filter(table.metadata_id.in_(metadata_ids))
+        }
+        for metadata_id, hour in summary.items():
+            if (rollup := rollups.get(metadata_id)) is None:
+                rollup = table.from_stats_ts(metadata_id, hour)
+                rollup.start_ts = period_start_ts
+                rollup.mean_count = 0 if hour.get("mean") is None else 1
+                session.add(rollup)
+            else:
+                _add_hour_to_statistics_rollup(rollup, hour)
+
+
+def _update_statistics_rollups(
+    session: Session, metadata_ids: list[int], start_times_ts: Iterable[float]
+) -> None:
+    """Compile the rollups of the periods the given hourly statistics belong to."""
+    # Flush the hourly statistics before the rollups are compiled from them,
+    # so integrity errors are raised here rather than in the rollup queries
+    session.flush()
+    start_times_ts = set(start_times_ts)
+    for table, period_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = period_factory()
+        periods = {period_start_end(start_time_ts) for start_time_ts in start_times_ts}
+        for start_time_ts, end_time_ts in sorted(periods):
+            _compile_statistics_rollup(
+                session, table, start_time_ts, end_time_ts, metadata_ids
+            )
+
+
+def _adjust_sum_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    start_time: datetime,
+    adj: float,
+) -> None:
+    """Adjust the statistics rollups after adjusting the hourly statistics."""
+    start_time_ts = start_time.timestamp()
+    for table, period_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = period_factory()
+        _, end_time_ts = period_start_end(start_time_ts)
+        _adjust_sum_statistics(
+            session, table, metadata_id, dt_util.utc_from_timestamp(end_time_ts), adj
+        )
+    # The period the adjustment starts in may end with an unadjusted sum
+    _update_statistics_rollups(session, [metadata_id], (start_time_ts,))
+
+
+def _statistics_rollups_need_rebuild(session: Session) -> bool:
+    """Return if the rollups do not match the hourly statistics.
+
+    The rollups must cover the same periods as the hourly statistics, and
+    their periods must start at midnight in the configured time zone.
+    """
+    oldest_ts, newest_ts = session.query(
+        func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+    ).one()
+    for table, period_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = period_factory()
+        rollup_oldest_ts, rollup_newest_ts = session.query(
+            func.min(table.start_ts), func.max(table.start_ts)
+        ).one()
+        if oldest_ts is None or rollup_oldest_ts is None:
+            if oldest_ts is not None or rollup_oldest_ts is not None:
+                return True
+            continue
+        if (
+            rollup_oldest_ts != period_start_end(oldest_ts)[0]
+            or rollup_newest_ts != period_start_end(newest_ts)[0]
+        ):
+            return True
+    return False
+
+
+def _start_statistics_rollups_rebuild(session: Session) -> float | None:
+    """Delete all rollups and return the start of the oldest month to rebuild."""
+    for table, _ in STATISTICS_ROLLUPS.values():
+        session.query(table).delete(synchronize_session=False)
+    if (oldest_ts := session.query(func.min(Statistics.start_ts)).scalar()) is None:
+        return None
+    _, month_start_end = reduce_month_ts_factory()
+    return month_start_end(oldest_ts)[0]
+
+
+def _rebuild_statistics_rollups_month(
+    session: Session, start_time_ts: float
+) -> float | None:
+    """Compile the rollups of one month of the hourly statistics.
+
+    Return the start of the next month to rebuild, or None when there are
+    no hourly statistics after the month.
+    """
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    _, end_time_ts = month_start_end(start_time_ts)
+    _compile_statistics_rollup(
+        session, StatisticsMonthly, start_time_ts, end_time_ts, None
     )
+    day_start_ts, day_end_ts = day_start_end(start_time_ts)
+    while day_start_ts < end_time_ts:
+        _compile_statistics_rollup(
+            session, StatisticsDaily, day_start_ts, day_end_ts, None
+        )
+        day_start_ts, day_end_ts = day_start_end(day_end_ts)
+    newest_ts = session.query(func.max(Statistics.start_ts)).scalar()
+    if newest_ts is None or newest_ts < end_time_ts:
+        return None
+    return end_time_ts
+
+
+@retryable_database_job("update statistics rollups")
+def update_statistics_rollups(instance: Recorder) -> bool:
+    """Rebuild the daily and monthly statistics rollups if they are not valid.
+
+    The rollups are only valid for the time zone they were compiled in,
+    they are rebuilt when the time zone changes. The rebuild commits one
+    month at a time and returns False until it is done, so the recorder
+    queue is processed in between.
+    """
+    time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+    if instance.statistics_rollups_time_zone == time_zone:
+        return True
+
+    with session_scope(session=instance.get_session()) as session:
+        if (rebuild := instance.statistics_rollups_rebuild) is None or rebuild[
+            0
+        ] != time_zone:
+            if (
+                rebuild is None
+                and instance.statistics_rollups_time_zone is None
+                and not _statistics_rollups_need_rebuild(session)
+            ):
+                instance.statistics_rollups_time_zone = time_zone
+                return True
+            _LOGGER.info(
+                "Compiling daily and monthly statistics for time zone %s", time_zone
+            )
+            # The rollups are not read until they are rebuilt
+            instance.statistics_rollups_time_zone = None
+            rebuild = instance.statistics_rollups_rebuild = (time_zone, None)
+        if (next_start_ts := rebuild[1]) is None:
+            next_start_ts = _start_statistics_rollups_rebuild(session)
+        if next_start_ts is not None:
+            next_start_ts = _rebuild_statistics_rollups_month(session, next_start_ts)
+
+    if next_start_ts is not None:
+        instance.statistics_rollups_rebuild = (time_zone, next_start_ts)
+        return False
+    instance.statistics_rollups_rebuild = None
+    instance.statistics_rollups_time_zone = time_zone
+    return True
+
+
+def _set_statistics_period_end(
+    result: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> None:
+    """Set the end of statistics reduced to or read as days, weeks or months.
+
+    The length of days and months varies, it can't be derived from the table.
+    """
+    for rows in result.values():
+        for row in rows:
+            row["end"] = period_start_end(row["start"])[1]
 
 
 def _generate_statistics_during_period_stmt(
@@ -1574,55 +1908,37 @@ def _extract_metadata_and_discard_impossible_columns(
     return metadata_ids
 
 
-def _augment_result_with_change(
-    hass: HomeAssistant,
+def _get_sums_before(
     session: Session,
     start_time: datetime,
-    units: dict[str, str] | None,
-    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
     table: type[Statistics | StatisticsShortTerm],
     metadata: dict[str, tuple[int, StatisticMetaData]],
-    result: dict[str, list[StatisticsRow]],
-) -> None:
-    """Add change to the result."""
-    drop_sum = "sum" not in _types
-    prev_sums = {}
-    if tmp := _statistics_at_time(
-        session,
-        {metadata[statistic_id][0] for statistic_id in result},
-        table,
-        start_time,
-        {"sum"},
+) -> dict[int, float | None]:
+    """Return the last sum before start_time of each statistic."""
+    if not (
+        rows := _statistics_at_time(
+            session,
+            {metadata_id for metadata_id, _ in metadata.values()},
+            table,
+            start_time,
+            {"sum"},
+        )
     ):
-        _metadata = dict(metadata.values())
-        for row in tmp:
-            metadata_by_id = _metadata[row.metadata_id]
-            statistic_id = metadata_by_id["statistic_id"]
-
-            state_unit = unit = metadata_by_id["unit_of_measurement"]
-            if state := hass.states.get(statistic_id):
-                state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+        return {}
+    return {row.metadata_id: row.sum for row in rows}
 
-            if convert is not None:
-                prev_sums[statistic_id] = convert(row.sum)
-            else:
-                prev_sums[statistic_id] = row.sum
 
-    for statistic_id, rows in result.items():
-        prev_sum = prev_sums.get(statistic_id) or 0
-        for statistics_row in rows:
-            if "sum" not in statistics_row:
-                continue
-            if drop_sum:
-                _sum = statistics_row.pop("sum")
-            else:
-                _sum = statistics_row["sum"]
-            if _sum is None:
-                statistics_row["change"] = None
-                continue
-            statistics_row["change"] = _sum - prev_sum
-            prev_sum = _sum
+def _sum_changes(sums: Sequence[float | None], prev_sum: float) -> list[float | None]:
+    """Return the change of each sum from the previous sum which is not None."""
+    changes: list[float | None] = []
+    changes_append = changes.append
+    for _sum in sums:
+        if _sum is None:
+            changes_append(None)
+            continue
+        changes_append(_sum - prev_sum)
+        prev_sum = _sum
+    return changes
 
 
 def _statistics_during_period_with_session(
@@ -1645,7 +1961,8 @@ def _statistics_during_period_with_session(
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
     # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
+    instance = get_instance(hass)
+    metadata = instance.statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
     if not metadata:
@@ -1695,8 +2012,14 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
+    # Read days and months from the rollups if they match the time zone,
+    # the start and end time are aligned with the period above.
+    rollup = None
+    if instance.statistics_rollups_time_zone == str(dt_util.DEFAULT_TIME_ZONE):
+        rollup = STATISTICS_ROLLUPS.get(period)
+    stats_table: type[StatisticsBase] = rollup[0] if rollup else table
     stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
+        start_time, end_time, metadata_ids, stats_table, types
     )
     stats = cast(
         Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
@@ -1705,6 +2028,10 @@ def _statistics_during_period_with_session(
     if not stats:
         return {}
 
+    period_start_end = None
+    if period_factory := STATISTICS_PERIODS.get(period):
+        _, period_start_end = period_factory()
+
     result = _sorted_statistics_to_dict(
         hass,
         session,
@@ -1712,25 +2039,19 @@ def _statistics_during_period_with_session(
         statistic_ids,
         metadata,
         True,
-        table,
+        stats_table,
         start_time,
         units,
         types,
+        None if rollup else period_start_end,
+        _get_sums_before(session, start_time, table, metadata)
+        if "change" in _types
+        else None,
+        "sum" in _types,
     )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
-
-    if "change" in _types:
-        _augment_result_with_change(
-            hass, session, start_time, units, _types, table, metadata, result
-        )
+    if period_start_end is not None:
+        _set_statistics_period_end(result, period_start_end)
 
     # Return statistics combined with metadata
     return result
@@ -1995,7 +2316,7 @@ def _statistics_at_time(
 
 
 def _fast_build_sum_list(
-    stats_list: list[Row],
+    stats_list: Sequence[Row | list[Any]],
     table_duration_seconds: float,
     convert: Callable | None,
     start_ts_idx: int,
@@ -2032,8 +2353,19 @@ def _sorted_statistics_to_dict(  # noqa: C901
     start_time: datetime | None,
     units: dict[str, str] | None,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    reduce_period_start_end: Callable[[float], tuple[float, float]] | None = None,
+    sums_before: dict[int, float | None] | None = None,
+    include_sum: bool = True,
 ) -> dict[str, list[StatisticsRow]]:
-    """Convert SQL results into JSON friendly data structure."""
+    """Convert SQL results into JSON friendly data structure.
+
+    If reduce_period_start_end is set, the rows are reduced to the periods it
+    returns before they are converted.
+
+    If sums_before is set, the change of the sum from the previous row, or
+    from the sum before the first row, is added. The sum is only kept if
+    include_sum is set.
+    """
     assert stats, "stats must not be empty"  # Guard against implementation error
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     metadata = dict(_metadata.values())
@@ -2045,7 +2377,7 @@ def _sorted_statistics_to_dict(  # noqa: C901
     seen_statistic_ids: set[str] = set()
     key_func = itemgetter(metadata_id_idx)
     for meta_id, group in groupby(stats, key_func):
-        stats_list = stats_by_meta_id[meta_id] = list(group)
+        stats_by_meta_id[meta_id] = list(group)
         seen_statistic_ids.add(metadata[meta_id]["statistic_id"])
 
     # Set all statistic IDs to empty lists in result set to maintain the order
@@ -2066,10 +2398,25 @@ def _sorted_statistics_to_dict(  # noqa: C901
     last_reset_ts_idx = field_map["last_reset_ts"] if "last_reset" in types else None
     state_idx = field_map["state"] if "state" in types else None
     sum_idx = field_map["sum"] if "sum" in types else None
-    sum_only = len(types) == 1 and sum_idx is not None
+    sum_only = len(types) == 1 and sum_idx is not None and sums_before is None
     # Append all statistic entries, and optionally do unit conversion
     table_duration_seconds = table.duration.total_seconds()
-    for meta_id, stats_list in stats_by_meta_id.items():
+    for meta_id, db_states in stats_by_meta_id.items():
+        stats_list: Sequence[Row | list[Any]] = db_states
+        if reduce_period_start_end is not None:
+            # The unit converters are affine functions with a positive slope,
+            # so the mean of the converted values is the converted mean and
+            # min and max keep their order. State and sum are taken from the
+            # last row of the period. Reducing before converting gives the
+            # same result with far fewer conversions.
+            stats_list = _reduce_statistics(
+                db_states,
+                reduce_period_start_end,
+                start_ts_idx,
+                mean_idx,
+                min_idx,
+                max_idx,
+            )
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
         if convert_units:
@@ -2096,44 +2443,50 @@ def _sorted_statistics_to_dict(  # noqa: C901
             )
             continue
 
-        ent_results_append = result[statistic_id].append
-        #
-        # The below loop is a red hot path for energy, and every
-        # optimization counts in here.
         #
-        # Specifically, we want to avoid function calls,
-        # attribute lookups, and dict lookups as much as possible.
+        # The below is a red hot path for energy and statistics graphs,
+        # the rows are converted column by column so the conversions and
+        # the change are computed without looking up each value of each
+        # row, and the rows are built from the columns in one pass.
         #
-        for db_state in stats_list:
-            row: StatisticsRow = {
-                "start": (start_ts := db_state[start_ts_idx]),
-                "end": start_ts + table_duration_seconds,
-            }
-            if last_reset_ts_idx is not None:
-                row["last_reset"] = db_state[last_reset_ts_idx]
+        columns = list(zip(*stats_list))
+        starts = columns[start_ts_idx]
+        keys: list[str] = ["start", "end"]
+        values: list[Sequence[Any]] = [
+            starts,
+            [start_ts + table_duration_seconds for start_ts in starts],
+        ]
+        if last_reset_ts_idx is not None:
+            keys.append("last_reset")
+            values.append(columns[last_reset_ts_idx])
+        for key, idx in (
+            ("mean", mean_idx),
+            ("min", min_idx),
+            ("max", max_idx),
+            ("state", state_idx),
+            ("sum", sum_idx),
+        ):
+            if idx is None:
+                continue
+            column = columns[idx]
             if convert:
-                if mean_idx is not None:
-                    row["mean"] = convert(db_state[mean_idx])
-                if min_idx is not None:
-                    row["min"] = convert(db_state[min_idx])
-                if max_idx is not None:
-                    row["max"] = convert(db_state[max_idx])
-                if state_idx is not None:
-                    row["state"] = convert(db_state[state_idx])
-                if sum_idx is not None:
-                    row["sum"] = convert(db_state[sum_idx])
-            else:
-                if mean_idx is not None:
-                    row["mean"] = db_state[mean_idx]
-                if min_idx is not None:
-                    row["min"] = db_state[min_idx]
-                if max_idx is not None:
-                    row["max"] = db_state[max_idx]
-                if state_idx is not None:
-                    row["state"] = db_state[state_idx]
-                if sum_idx is not None:
-                    row["sum"] = db_state[sum_idx]
-            ent_results_append(row)
+                column = list(map(convert, column))
+            if key == "sum" and sums_before is not None:
+                if include_sum:
+                    keys.append(key)
+                    values.append(column)
+                prev_sum = sums_before.get(meta_id)
+                if convert and prev_sum is not None:
+                    prev_sum = convert(prev_sum)
+                keys.append("change")
+                values.append(_sum_changes(column, prev_sum or 0))
+                continue
+            keys.append(key)
+            values.append(column)
+        result[statistic_id] = cast(
+            list[StatisticsRow],
+            [dict(zip(keys, row_values)) for row_values in zip(*values)],
+        )
 
     return result
 
@@ -2298,13 +2651,16 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_times_ts: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_times_ts.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        _update_statistics_rollups(session, [metadata_id], start_times_ts)
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2432,6 +2788,13 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _adjust_sum_statistics_rollups(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0),
+            sum_adjustment,
+        )
+
     return True
 
 
@@ -2492,6 +2855,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
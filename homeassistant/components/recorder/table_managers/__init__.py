@@ -1,9 +1,14 @@
 """Managers for each table."""
 
+from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from lru import LRU  # pylint: disable=no-name-in-module
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from ..util import chunked, execute_stmt_lambda_element
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -52,7 +57,7 @@ class BaseTableManager(Generic[_DataT]):
         self._pending.clear()
 
 
-class BaseLRUTableManager(BaseTableManager[_DataT]):
+class BaseLRUTableManager(BaseTableManager[_DataT], ABC):
     """Base class for LRU table managers."""
 
     def __init__(self, recorder: "Recorder", lru_size: int) -> None:
@@ -73,3 +78,37 @@ class BaseLRUTableManager(BaseTableManager[_DataT]):
         lru: LRU = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+    def get_cached_ids(self) -> list[int]:
+        """Return the cached ids from the least to the most recently used.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        lru: LRU = self._id_map
+        return list(reversed(lru.values()))
+
+    def load_ids(self, ids: list[int], session: Session) -> None:
+        """Load the cache from ids ordered from the least to the most recently used.
+
+        The data is read from the database by id, so ids that
+        no longer exist are skipped.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        data_by_id: dict[int, str] = {}
+        with session.no_autoflush:
+            for ids_chunk in chunked(ids, self.recorder.max_bind_vars):
+                for id_, data in execute_stmt_lambda_element(
+                    session, self._find_by_ids(ids_chunk), orm_rows=False
+                ):
+                    data_by_id[id_] = data
+        id_map = self._id_map
+        for id_ in ids:
+            if (data := data_by_id.get(id_)) is not None:
+                id_map[data] = id_
+
+    @abstractmethod
+    def _find_by_ids(self, ids: list[int]) -> StatementLambdaElement:
+        """Return the statement to find the data by ids."""
@@ -6,12 +6,13 @@ import logging
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import get_shared_event_datas, get_shared_event_datas_by_ids
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -137,3 +138,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         # Evict any purged data from the cache
         for purged_data_id in data_ids.intersection(event_data_ids_reversed):
             id_map.pop(event_data_ids_reversed[purged_data_id], None)
+
+    def _find_by_ids(self, ids: list[int]) -> StatementLambdaElement:
+        """Return the statement to find the data by ids."""
+        return get_shared_event_datas_by_ids(ids)
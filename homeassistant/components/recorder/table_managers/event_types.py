@@ -6,11 +6,12 @@ from typing import TYPE_CHECKING, cast
 
 from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import Event
 
 from ..db_schema import EventTypes
-from ..queries import find_event_type_ids
+from ..queries import find_event_type_ids, find_event_types_by_ids
 from ..tasks import RefreshEventTypesTask
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
@@ -138,3 +139,7 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
         """
         for event_type in event_types:
             self._id_map.pop(event_type, None)
+
+    def _find_by_ids(self, ids: list[int]) -> StatementLambdaElement:
+        """Return the statement to find the data by ids."""
+        return find_event_types_by_ids(ids)
@@ -6,13 +6,18 @@ import logging
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import Event
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import (
+    get_latest_shared_attributes,
+    get_shared_attributes,
+    get_shared_attributes_by_ids,
+)
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -117,6 +122,23 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
 
         return results
 
+    def load_latest(self, metadata_ids: list[int], session: Session) -> None:
+        """Load the attributes_ids of the latest state of each metadata_id into memory.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            for metadata_ids_chunk in chunked(
+                metadata_ids, self.recorder.max_bind_vars
+            ):
+                for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                    session,
+                    get_latest_shared_attributes(metadata_ids_chunk),
+                    orm_rows=False,
+                ):
+                    self._id_map[shared_attrs] = attributes_id
+
     def add_pending(self, db_state_attributes: StateAttributes) -> None:
         """Add a pending StateAttributes that will be committed at the next interval.
 
@@ -153,3 +175,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+
+    def _find_by_ids(self, ids: list[int]) -> StatementLambdaElement:
+        """Return the statement to find the data by ids."""
+        return get_shared_attributes_by_ids(ids)
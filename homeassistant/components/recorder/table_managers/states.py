@@ -80,6 +80,20 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def committed_state_ids_in_range(
+        self, start_state_id: int, end_state_id: int
+    ) -> set[int]:
+        """Return the committed state_ids in a range of state_ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return {
+            state_id
+            for state_id in self._last_committed_id.values()
+            if start_state_id <= state_id < end_state_id
+        }
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -5,11 +5,16 @@ from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, cast
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import Event
 
 from ..db_schema import StatesMeta
-from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
+from ..queries import (
+    find_all_states_metadata_ids,
+    find_states_metadata_by_ids,
+    find_states_metadata_ids,
+)
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -160,3 +165,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         )
         self._id_map.pop(entity_id, None)
         return True
+
+    def _find_by_ids(self, ids: list[int]) -> StatementLambdaElement:
+        """Return the statement to find the data by ids."""
+        return find_states_metadata_by_ids(ids)
@@ -180,6 +180,18 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupTask(RecorderTask):
+    """An object to insert into the recorder queue to update the statistics rollups."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to rebuild the statistics rollups if needed."""
+        if statistics.update_statistics_rollups(instance):
+            return
+        # Schedule a new statistics rollup task if this one didn't finish
+        instance.queue_task(StatisticsRollupTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
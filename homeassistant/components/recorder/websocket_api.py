@@ -166,13 +166,13 @@ def _ws_get_statistics_during_period(
         units,
         types,
     )
-    for statistic_id in result:
-        for item in result[statistic_id]:
-            if (start := item.get("start")) is not None:
-                item["start"] = int(start * 1000)
-            if (end := item.get("end")) is not None:
-                item["end"] = int(end * 1000)
-            if (last_reset := item.get("last_reset")) is not None:
+    # Every row has a start and an end, only look for last_reset if requested
+    convert_last_reset = "last_reset" in types
+    for statistic_rows in result.values():
+        for item in statistic_rows:
+            item["start"] = int(item["start"] * 1000)
+            item["end"] = int(item["end"] * 1000)
+            if convert_last_reset and (last_reset := item.get("last_reset")):
                 item["last_reset"] = int(last_reset * 1000)
     return JSON_DUMP(messages.result_message(msg_id, result))
 
@@ -18,6 +18,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.models import (
+    LazyState,
     StatisticData,
     StatisticMetaData,
     StatisticResult,
@@ -125,9 +126,16 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _state_attribute(state: State, key: str) -> Any:
+    """Return an attribute of a state, decoding as little as possible."""
+    if isinstance(state, LazyState):
+        return state.attribute(key)
+    return state.attributes.get(key)
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
+    return {_state_attribute(item[1], ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
 
 
 def _equivalent_units(units: set[str | None]) -> bool:
@@ -140,20 +148,11 @@ def _equivalent_units(units: set[str | None]) -> bool:
     return len(units) == 1
 
 
-def _parse_float(state: str) -> float:
-    """Parse a float string, throw on inf or nan."""
-    fstate = float(state)
-    if not math.isfinite(fstate):
-        raise ValueError
-    return fstate
-
-
-def _float_or_none(state: str) -> float | None:
-    """Return a float or None."""
-    try:
-        return _parse_float(state)
-    except (ValueError, TypeError):
+def _float_or_none(state: State) -> float | None:
+    """Return the state as a float, or None if it is not a finite number."""
+    if (fstate := state.as_float) is None or not math.isfinite(fstate):
         return None
+    return fstate
 
 
 def _entity_history_to_float_and_state(
@@ -163,7 +162,7 @@ def _entity_history_to_float_and_state(
     return [
         (fstate, state)
         for state in entity_history
-        if (fstate := _float_or_none(state.state)) is not None
+        if (fstate := _float_or_none(state)) is not None
     ]
 
 
@@ -222,7 +221,7 @@ def _normalize_states(
     last_unit: str | None | object = object()
 
     for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        state_unit = _state_attribute(state, ATTR_UNIT_OF_MEASUREMENT)
         # Exclude states with unsupported unit from statistics
         if state_unit not in converter.VALID_UNITS:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -536,7 +535,7 @@ def compile_statistics(  # noqa: C901
                     state_class != SensorStateClass.TOTAL_INCREASING
                     and (
                         last_reset := _last_reset_as_utc_isoformat(
-                            state.attributes.get("last_reset"), entity_id
+                            _state_attribute(state, ATTR_LAST_RESET), entity_id
                         )
                     )
                     != old_last_reset
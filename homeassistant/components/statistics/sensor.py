@@ -39,11 +39,11 @@ from homeassistant.core import (
     split_entity_id,
 )
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.derived_sensor import async_track_derived_state_change_event
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import (
     EventStateChangedData,
     async_track_point_in_utc_time,
-    async_track_state_change_event,
 )
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.start import async_at_start
@@ -331,7 +331,7 @@ class StatisticsSensor(SensorEntity):
             _LOGGER.debug("Startup for %s", self.entity_id)
 
             self.async_on_remove(
-                async_track_state_change_event(
+                async_track_derived_state_change_event(
                     self.hass,
                     [self._source_entity_id],
                     async_stats_sensor_state_listener,
@@ -353,15 +353,12 @@ class StatisticsSensor(SensorEntity):
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
             return
 
-        try:
-            if self.is_binary:
-                assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
-            else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
-            self.attributes[STAT_SOURCE_VALUE_VALID] = True
-        except ValueError:
+        if self.is_binary:
+            assert new_state.state in ("on", "off")
+            self.states.append(new_state.state == "on")
+        elif (value := new_state.as_float) is not None:
+            self.states.append(value)
+        else:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
             _LOGGER.error(
                 "%s: parsing error. Expected number or binary state, but received '%s'",
@@ -369,6 +366,8 @@ class StatisticsSensor(SensorEntity):
                 new_state.state,
             )
             return
+        self.ages.append(new_state.last_updated)
+        self.attributes[STAT_SOURCE_VALUE_VALID] = True
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
@@ -12,8 +12,9 @@ import io
 import logging
 import mimetypes
 import os
+from pathlib import Path
 import re
-from typing import Any, TypedDict, final
+from typing import Any, final
 
 from aiohttp import web
 import mutagen
@@ -47,6 +48,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
+from .cache import MemoryCache, TTSCache
 from .const import (
     ATTR_CACHE,
     ATTR_LANGUAGE,
@@ -58,6 +60,7 @@ from .const import (
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_MEMORY_CACHE_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
     TtsAudioType,
@@ -104,14 +107,6 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 
-class TTSCache(TypedDict):
-    """Cached TTS file."""
-
-    filename: str
-    voice: bytes
-    pending: asyncio.Task | None
-
-
 @callback
 def async_default_engine(hass: HomeAssistant) -> str | None:
     """Return the domain or entity id of the default engine.
@@ -411,7 +406,9 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        self.mem_cache = MemoryCache(DEFAULT_MEMORY_CACHE_SIZE)
+        # Speech being generated by cache key
+        self._generating: dict[str, asyncio.Task[TTSCache]] = {}
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
@@ -434,7 +431,7 @@ class SpeechManager:
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache.clear()
 
         def remove_files() -> None:
             """Remove files from filesystem."""
@@ -511,15 +508,14 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
-        # Is file store in file cache
+        if cached := self.mem_cache.get(cache_key):
+            filename = cached["filename"]
+        # Is file store in file cache, it is streamed from disk when played
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
-            filename = await self._async_get_tts_audio(
+            cached = await self._async_get_tts_audio(
                 engine_instance,
                 cache_key,
                 message,
@@ -527,6 +523,7 @@ class SpeechManager:
                 language,
                 options,
             )
+            filename = cached["filename"]
 
         return f"/api/tts_proxy/{filename}"
 
@@ -547,19 +544,17 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
+        if (cached := self.mem_cache.get(cache_key)) is None:
             if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
+                cached = await self._async_file_to_mem(cache_key)
             else:
-                await self._async_get_tts_audio(
+                cached = await self._async_get_tts_audio(
                     engine_instance, cache_key, message, use_cache, language, options
                 )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        if pending := cached["pending"]:
+            cached = await asyncio.shield(pending)
         return extension, cached["voice"]
 
     @callback
@@ -585,8 +580,10 @@ class SpeechManager:
         cache: bool,
         language: str,
         options: dict[str, Any],
-    ) -> str:
-        """Receive TTS, store for view in cache and return filename.
+    ) -> TTSCache:
+        """Receive TTS, store for view in cache and return the cached speech.
+
+        Concurrent requests for the same speech share the generation.
 
         This method is a coroutine.
         """
@@ -595,7 +592,7 @@ class SpeechManager:
         else:
             expected_extension = None
 
-        async def get_tts_data() -> str:
+        async def get_tts_data() -> TTSCache:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
@@ -630,34 +627,45 @@ class SpeechManager:
                 data = self.write_tags(
                     filename, data, engine_instance.name, message, language, options
                 )
-            self._async_store_to_memcache(cache_key, filename, data)
+            cached = self._async_store_to_memcache(cache_key, filename, data)
 
             if cache:
                 self.hass.async_create_task(
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
+            return cached
 
-        audio_task = self.hass.async_create_task(get_tts_data())
+        if (audio_task := self._generating.get(cache_key)) is None:
+            audio_task = self._generating[cache_key] = self.hass.async_create_task(
+                get_tts_data()
+            )
 
-        if expected_extension is None:
-            return await audio_task
+            def handle_done(_future: asyncio.Future) -> None:
+                """Handle generation done."""
+                del self._generating[cache_key]
+                if (
+                    not audio_task.cancelled()
+                    and audio_task.exception()
+                    and (pending := self.mem_cache.peek(cache_key))
+                    and pending["pending"] is audio_task
+                ):
+                    self.mem_cache.pop(cache_key)
 
-        def handle_error(_future: asyncio.Future) -> None:
-            """Handle error."""
-            if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+            audio_task.add_done_callback(handle_done)
 
-        audio_task.add_done_callback(handle_error)
+        if expected_extension is None:
+            # Waiters of the same speech must not cancel the generation
+            return await asyncio.shield(audio_task)
 
-        filename = f"{cache_key}.{expected_extension}".lower()
-        self.mem_cache[cache_key] = {
-            "filename": filename,
+        cached: TTSCache = {
+            "filename": f"{cache_key}.{expected_extension}".lower(),
             "voice": b"",
             "pending": audio_task,
         }
-        return filename
+        if not audio_task.done():
+            self.mem_cache.set(cache_key, cached)
+        return cached
 
     async def _async_save_tts_audio(
         self, cache_key: str, filename: str, data: bytes
@@ -679,7 +687,7 @@ class SpeechManager:
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
 
-    async def _async_file_to_mem(self, cache_key: str) -> None:
+    async def _async_file_to_mem(self, cache_key: str) -> TTSCache:
         """Load voice from file cache into memory.
 
         This method is a coroutine.
@@ -700,23 +708,25 @@ class SpeechManager:
             del self.file_cache[cache_key]
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
-        self._async_store_to_memcache(cache_key, filename, data)
+        return self._async_store_to_memcache(cache_key, filename, data)
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
-    ) -> None:
+    ) -> TTSCache:
         """Store data to memcache and set timer to remove it."""
-        self.mem_cache[cache_key] = {
+        cached: TTSCache = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self.mem_cache.set(cache_key, cached)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            if self.mem_cache.peek(cache_key) is cached:
+                self.mem_cache.pop(cache_key)
 
         async_call_later(
             self.hass,
@@ -727,31 +737,36 @@ class SpeechManager:
                 cancel_on_shutdown=True,
             ),
         )
+        return cached
 
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
+        content, data = await self.async_stream_tts(filename)
+        if isinstance(data, Path):
+            data = (await self._async_file_to_mem(_cache_key(filename)))["voice"]
+        return content, data
 
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+    async def async_stream_tts(self, filename: str) -> tuple[str | None, bytes | Path]:
+        """Return a voice from memory or the path of its file in the file cache.
 
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
-                raise HomeAssistantError(f"{cache_key} not in cache!")
-            await self._async_file_to_mem(cache_key)
+        Voices that are not in memory are not loaded, they can be
+        streamed from the file instead.
 
+        This method is a coroutine.
+        """
+        cache_key = _cache_key(filename)
         content, _ = mimetypes.guess_type(filename)
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+
+        if (cached := self.mem_cache.get(cache_key)) is None:
+            if (cached_file := self.file_cache.get(cache_key)) is None:
+                raise HomeAssistantError(f"{cache_key} not in cache!")
+            return content, Path(self.cache_dir, cached_file)
+
+        if pending := cached["pending"]:
+            cached = await asyncio.shield(pending)
         return content, cached["voice"]
 
     @staticmethod
@@ -807,6 +822,18 @@ class SpeechManager:
         return data_bytes.getvalue()
 
 
+def _cache_key(filename: str) -> str:
+    """Return the cache key of a voice file."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
 def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     """Init cache folder."""
     if not os.path.isabs(cache_dir):
@@ -890,14 +917,17 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
-            content, data = await self.tts.async_read_tts(filename)
+            content, data = await self.tts.async_stream_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
+        if isinstance(data, Path):
+            # Stream the file in chunks instead of reading it into memory
+            return web.FileResponse(data)
         return web.Response(body=data, content_type=content)
 
 
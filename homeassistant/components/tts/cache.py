@@ -0,0 +1,86 @@
+"""Memory cache of generated speech."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, TypedDict
+
+
+class TTSCache(TypedDict):
+    """Cached TTS file."""
+
+    filename: str
+    voice: bytes
+    pending: asyncio.Task[TTSCache] | None
+
+
+class MemoryCache:
+    """Least recently used cache of speech with a budget in bytes.
+
+    When storing speech exceeds the budget, the least recently used
+    entries are evicted. The entry that was just stored is always kept,
+    even if it exceeds the budget on its own, so it can be served.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the memory cache."""
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, TTSCache] = OrderedDict()
+
+    def __contains__(self, cache_key: str) -> bool:
+        """Return if the cache contains the key."""
+        return cache_key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, cache_key: str) -> TTSCache | None:
+        """Return an entry and mark it as recently used."""
+        if (entry := self._entries.get(cache_key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(cache_key)
+        return entry
+
+    def peek(self, cache_key: str) -> TTSCache | None:
+        """Return an entry without marking it as used."""
+        return self._entries.get(cache_key)
+
+    def set(self, cache_key: str, entry: TTSCache) -> None:
+        """Store an entry and evict entries exceeding the budget."""
+        self.pop(cache_key)
+        self._entries[cache_key] = entry
+        self.size += len(entry["voice"])
+        entries = self._entries
+        while self.size > self.max_size and len(entries) > 1:
+            _, evicted = entries.popitem(last=False)
+            self.size -= len(evicted["voice"])
+            self.evictions += 1
+
+    def pop(self, cache_key: str) -> TTSCache | None:
+        """Remove an entry."""
+        if (entry := self._entries.pop(cache_key, None)) is not None:
+            self.size -= len(entry["voice"])
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+    def statistics(self) -> dict[str, Any]:
+        """Return the usage statistics of the cache."""
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
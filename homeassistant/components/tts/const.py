@@ -12,6 +12,8 @@ CONF_TIME_MEMORY = "time_memory"
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
+# Budget in bytes of speech kept in memory
+DEFAULT_MEMORY_CACHE_SIZE = 32 * 1024 * 1024
 
 DOMAIN = "tts"
 
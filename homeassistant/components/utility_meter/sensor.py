@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from decimal import Decimal, DecimalException, InvalidOperation
+from decimal import Decimal, InvalidOperation
 import logging
 from typing import Any, Self
 
@@ -33,6 +33,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry as er,
 )
+from homeassistant.helpers.derived_sensor import async_track_derived_state_change_event
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -411,15 +412,10 @@ class UtilityMeterSensor(RestoreSensor):
 
     @staticmethod
     def _validate_state(state: State | None) -> Decimal | None:
-        """Parse the state as a Decimal if available. Throws DecimalException if the state is not a number."""
-        try:
-            return (
-                None
-                if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]
-                else Decimal(state.state)
-            )
-        except DecimalException:
+        """Parse the state as a Decimal if available, None if it is not a number."""
+        if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]:
             return None
+        return state.as_decimal
 
     def calculate_adjustment(
         self, old_state: State | None, new_state: State
@@ -512,7 +508,7 @@ class UtilityMeterSensor(RestoreSensor):
 
     def _change_status(self, tariff: str) -> None:
         if self._tariff == tariff:
-            self._collecting = async_track_state_change_event(
+            self._collecting = async_track_derived_state_change_event(
                 self.hass, [self._sensor_source_id], self.async_reading
             )
         else:
@@ -652,7 +648,7 @@ class UtilityMeterSensor(RestoreSensor):
                 self._unit_of_measurement,
                 self._sensor_source_id,
             )
-            self._collecting = async_track_state_change_event(
+            self._collecting = async_track_derived_state_change_event(
                 self.hass, [self._sensor_source_id], self.async_reading
             )
 
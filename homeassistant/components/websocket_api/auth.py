@@ -1,6 +1,7 @@
 """Handle the auth of a connection."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Final
 
@@ -57,7 +58,9 @@ class AuthPhase:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[
+            [str | dict[str, Any] | Callable[[], str] | asyncio.Future[str]], None
+        ],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
     ) -> None:
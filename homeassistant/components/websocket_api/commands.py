@@ -1,6 +1,7 @@
 """Commands part of Websocket API."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import datetime as dt
 from functools import lru_cache, partial
@@ -52,10 +53,14 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entities import async_get_entity_subscription_hub
 from .messages import construct_event_message, construct_result_message
+from .snapshots import SerializedSnapshotCache, async_render_snapshot
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+_LOGGER = logging.getLogger(__name__)
+
 
 @callback
 def async_register_commands(
@@ -261,65 +266,70 @@ def _async_get_allowed_states(
     ]
 
 
-@callback
-@decorators.websocket_command({vol.Required("type"): "get_states"})
-def handle_get_states(
-    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
-) -> None:
-    """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
-
-    try:
-        serialized_states = [state.as_dict_json for state in states]
-    except (ValueError, TypeError):
-        pass
-    else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
-        return
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized_states = []
+def _serialize_states(states: list[State]) -> str:
+    """Serialize states, leaving out states that cannot be serialized."""
+    serialized_states: list[str] = []
     for state in states:
         try:
             serialized_states.append(state.as_dict_json)
         except (ValueError, TypeError):
-            connection.logger.error(
+            _LOGGER.error(
                 "Unable to serialize to JSON. Bad data found at %s",
                 format_unserializable_data(
                     find_paths_unserializable_data(state, dump=JSON_DUMP)
                 ),
             )
-
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
+    joined_states = ",".join(serialized_states)
+    return f"[{joined_states}]"
 
 
-def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
-) -> None:
-    """Send handle get states response."""
+def _serialize_compressed_states(states: list[State]) -> str:
+    """Serialize compressed states, leaving out states that cannot be serialized."""
+    serialized_states: list[str] = []
+    for state in states:
+        try:
+            serialized_states.append(state.as_compressed_state_json)
+        except (ValueError, TypeError):
+            _LOGGER.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
     joined_states = ",".join(serialized_states)
-    connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
+    return f'{{"a":{{{joined_states}}}}}'
 
 
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
+@callback
+def _async_get_snapshot_cache(
+    hass: HomeAssistant, key: str, serialize: Callable[[list[State]], str]
+) -> SerializedSnapshotCache[State]:
+    """Return a cache of serialized states, creating it if needed."""
+    if (cache := hass.data.get(key)) is None:
+        cache = hass.data[key] = SerializedSnapshotCache(hass, serialize)
+    return cast(SerializedSnapshotCache[State], cache)
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_states"})
+def handle_get_states(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    """Handle get states command."""
+    states = _async_get_allowed_states(hass, connection)
+    payload: str | asyncio.Future[str]
+    if connection.user.permissions.access_all_entities(POLICY_READ):
+        # All admins share the serialization of the same states
+        payload = _async_get_snapshot_cache(
+            hass, const.DATA_STATES_SNAPSHOT, _serialize_states
+        ).async_get(states)
+    else:
+        payload = _serialize_states(states)
+    connection.send_message(
+        async_render_snapshot(
+            hass, msg["id"], payload, partial(construct_result_message, msg["id"])
+        )
+    )
 
 
 @callback
@@ -338,58 +348,31 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
-            partial(
-                _forward_entity_changes,
-                connection.send_message,
-                entity_ids,
-                connection.user,
-                msg["id"],
-            )
-        ),
-        run_immediately=True,
-    )
+    connection.subscriptions[msg["id"]] = async_get_entity_subscription_hub(
+        hass
+    ).async_subscribe(connection.send_message, connection.user, msg["id"], entity_ids)
     connection.send_result(msg["id"])
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    try:
-        serialized_states = [
-            state.as_compressed_state_json
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        ]
-    except (ValueError, TypeError):
-        pass
+    # Serialization leaves out unserializable states, so this command
+    # succeeds even if the state machine contains unserializable data.
+    # This command is required to succeed for the UI to show.
+    payload: str | asyncio.Future[str]
+    if entity_ids:
+        payload = _serialize_compressed_states(
+            [state for state in states if state.entity_id in entity_ids]
+        )
+    elif connection.user.permissions.access_all_entities(POLICY_READ):
+        payload = _async_get_snapshot_cache(
+            hass, const.DATA_COMPRESSED_STATES_SNAPSHOT, _serialize_compressed_states
+        ).async_get(states)
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
-        return
-
-    serialized_states = []
-    for state in states:
-        try:
-            serialized_states.append(state.as_compressed_state_json)
-        except (ValueError, TypeError):
-            connection.logger.error(
-                "Unable to serialize to JSON. Bad data found at %s",
-                format_unserializable_data(
-                    find_paths_unserializable_data(state, dump=JSON_DUMP)
-                ),
-            )
-
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
-
-
-def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
-) -> None:
-    """Send handle entities init response."""
-    joined_states = ",".join(serialized_states)
+        payload = _serialize_compressed_states(states)
+    # The message is queued before any state change of the subscription,
+    # so the writer sends it first even if it is serialized in the executor
     connection.send_message(
-        construct_event_message(msg_id, f'{{"a":{{{joined_states}}}}}')
+        async_render_snapshot(
+            hass, msg["id"], payload, partial(construct_event_message, msg["id"])
+        )
     )
 
 
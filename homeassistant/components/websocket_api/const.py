@@ -48,4 +48,18 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the shared subscribe_entities hub
+DATA_ENTITY_SUBSCRIPTIONS: Final = f"{DOMAIN}.entity_subscriptions"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_DEFLATE_MESSAGES = "deflate_messages"
+
+# Messages larger than this are compressed in the executor
+DEFLATE_EXECUTOR_SIZE: Final = 65536
+
+# Snapshots with more items than this are serialized in the executor
+SERIALIZE_EXECUTOR_ITEMS: Final = 500
+
+# Data used to store the serialized snapshots of get_states and subscribe_entities
+DATA_STATES_SNAPSHOT: Final = f"{DOMAIN}.states_snapshot"
+DATA_COMPRESSED_STATES_SNAPSHOT: Final = f"{DOMAIN}.compressed_states_snapshot"
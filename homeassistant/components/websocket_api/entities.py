@@ -0,0 +1,328 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import Any, Final
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import JSON_DUMP, find_paths_unserializable_data
+from homeassistant.util.json import format_unserializable_data
+
+from . import const, messages
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Old and new state per entity_id
+_EntityStates = dict[str, tuple[State | None, State | None]]
+# Serialized changes per entity_id, None if the change cannot be serialized
+_EntityChanges = dict[str, tuple[str, str] | None]
+
+
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("send_message", "user", "msg_id", "entity_ids", "pending")
+
+    def __init__(
+        self,
+        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+        user: User,
+        msg_id: int,
+        entity_ids: set[str],
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.user = user
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids
+        self.pending: _PendingEntityChanges | None = None
+
+
+class _PendingEntityChanges:
+    """Entity changes of a subscription that are queued but not yet written.
+
+    When the client cannot keep up, the changes of later loop iterations
+    are merged in instead of queueing another message. The client then
+    gets the latest state of each entity in a single message once the
+    socket drains, instead of every intermediate change.
+    """
+
+    __slots__ = ("subscription", "message", "states")
+
+    def __init__(
+        self, subscription: _EntitySubscription, message: str, states: _EntityStates
+    ) -> None:
+        """Initialize the pending changes."""
+        self.subscription = subscription
+        self.message: str | None = message
+        self.states = states
+
+    @callback
+    def async_merge(self, states: _EntityStates) -> None:
+        """Merge the changes of a later loop iteration."""
+        merged = self.states
+        for entity_id, (old_state, new_state) in states.items():
+            if (pending := merged.get(entity_id)) is not None:
+                old_state = pending[0]
+            merged[entity_id] = (old_state, new_state)
+        self.message = None
+
+    @callback
+    def async_render(self) -> str:
+        """Render the message when the socket is ready to write it."""
+        subscription = self.subscription
+        subscription.pending = None
+        if self.message is not None:
+            return self.message
+        changes = _async_serialize_changes(self.states)
+        message, unserializable = _async_construct_message(
+            subscription, changes, list(changes)
+        )
+        if unserializable:
+            _async_send_unserializable_error(subscription)
+        return message or messages.construct_entities_event_message(
+            subscription.msg_id, {}
+        )
+
+
+class EntitySubscriptionHub:
+    """Fan out state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener collects the state changes of an
+    event loop iteration. The changes are then merged per entity,
+    serialized once and sent to each subscription as one message
+    containing the entities the subscription is interested in and the
+    user is allowed to read.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        # Subscriptions to all entities
+        self._subscriptions: set[_EntitySubscription] = set()
+        # Subscriptions to specific entities, by entity_id
+        self._entity_subscriptions: dict[str, set[_EntitySubscription]] = {}
+        self._subscription_count = 0
+        self._events: list[Event] = []
+        # Offset in events of subscriptions added after the first event
+        # of the loop iteration, their initial states already contain
+        # the earlier changes
+        self._event_offsets: dict[_EntitySubscription, int] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+        user: User,
+        msg_id: int,
+        entity_ids: set[str],
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entities, all entities if none given."""
+        subscription = _EntitySubscription(send_message, user, msg_id, entity_ids)
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._entity_subscriptions.setdefault(entity_id, set()).add(
+                    subscription
+                )
+        else:
+            self._subscriptions.add(subscription)
+        if self._events:
+            self._event_offsets[subscription] = len(self._events)
+        self._subscription_count += 1
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            if entity_ids:
+                for entity_id in entity_ids:
+                    subscriptions = self._entity_subscriptions[entity_id]
+                    subscriptions.discard(subscription)
+                    if not subscriptions:
+                        del self._entity_subscriptions[entity_id]
+            else:
+                self._subscriptions.discard(subscription)
+            self._event_offsets.pop(subscription, None)
+            self._subscription_count -= 1
+            if not self._subscription_count and self._unsub_state_changed:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Queue a state change to be sent at the end of the loop iteration."""
+        if (
+            not self._subscriptions
+            and event.data["entity_id"] not in self._entity_subscriptions
+        ):
+            return
+        if not self._events:
+            self.hass.loop.call_soon(self._async_send_changes)
+        self._events.append(event)
+
+    @callback
+    def _async_send_changes(self) -> None:
+        """Send the queued state changes to the subscriptions."""
+        events = self._events
+        event_offsets = self._event_offsets
+        self._events = []
+        self._event_offsets = {}
+
+        subscriptions = set(self._subscriptions)
+        entity_subscriptions = self._entity_subscriptions
+        for event in events:
+            if matching := entity_subscriptions.get(event.data["entity_id"]):
+                subscriptions |= matching
+
+        states_by_offset: dict[int, _EntityStates] = {}
+        changes_by_offset: dict[int, _EntityChanges] = {}
+        allowed_by_user: dict[str, Callable[[str], bool]] = {}
+        for subscription in subscriptions:
+            offset = event_offsets.get(subscription, 0)
+            if (states := states_by_offset.get(offset)) is None:
+                states = states_by_offset[offset] = _async_merge_events(events[offset:])
+            if (allowed := allowed_by_user.get(subscription.user.id)) is None:
+                allowed = allowed_by_user[subscription.user.id] = _async_read_check(
+                    subscription.user
+                )
+            entity_ids = subscription.entity_ids
+            if not (
+                visible := [
+                    entity_id
+                    for entity_id in states
+                    if (not entity_ids or entity_id in entity_ids)
+                    and allowed(entity_id)
+                ]
+            ):
+                continue
+            if (pending := subscription.pending) is not None:
+                # The previous message is still queued, the client is not
+                # keeping up so merge the changes into it
+                pending.async_merge(
+                    {entity_id: states[entity_id] for entity_id in visible}
+                )
+                continue
+            if (changes := changes_by_offset.get(offset)) is None:
+                changes = changes_by_offset[offset] = _async_serialize_changes(states)
+            message, unserializable = _async_construct_message(
+                subscription, changes, visible
+            )
+            if message is not None:
+                pending = subscription.pending = _PendingEntityChanges(
+                    subscription,
+                    message,
+                    {entity_id: states[entity_id] for entity_id in visible},
+                )
+                subscription.send_message(pending.async_render)
+            if unserializable:
+                _async_send_unserializable_error(subscription)
+
+
+def _async_read_check(user: User) -> Callable[[str], bool]:
+    """Return a function that checks if the user can read an entity.
+
+    We have to lookup the permissions again because the user might have
+    changed since the subscription was created, the results are only
+    cached until the changes of the loop iteration are sent.
+    """
+    permissions = user.permissions
+    if permissions.access_all_entities(POLICY_READ):
+        return lambda entity_id: True
+    results: dict[str, bool] = {}
+
+    def _allowed(entity_id: str) -> bool:
+        if (allowed := results.get(entity_id)) is None:
+            allowed = results[entity_id] = permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        return allowed
+
+    return _allowed
+
+
+def _async_merge_events(events: list[Event]) -> _EntityStates:
+    """Merge state changed events to the old and new state per entity."""
+    states: _EntityStates = {}
+    for event in events:
+        data = event.data
+        entity_id: str = data["entity_id"]
+        if (merged := states.get(entity_id)) is None:
+            states[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            states[entity_id] = (merged[0], data["new_state"])
+    return states
+
+
+def _async_serialize_changes(states: _EntityStates) -> _EntityChanges:
+    """Serialize the net change per entity."""
+    changes: _EntityChanges = {}
+    for entity_id, (old_state, new_state) in states.items():
+        try:
+            if change := messages.entity_change_json(entity_id, old_state, new_state):
+                changes[entity_id] = change
+        except (ValueError, TypeError):
+            _LOGGER.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(new_state, dump=JSON_DUMP)
+                ),
+            )
+            changes[entity_id] = None
+    return changes
+
+
+def _async_construct_message(
+    subscription: _EntitySubscription,
+    changes: _EntityChanges,
+    entity_ids: list[str],
+) -> tuple[str | None, bool]:
+    """Construct the message with the changes of the entities.
+
+    Returns the message, None if there are no changes, and if any of
+    the changes could not be serialized.
+    """
+    serialized: dict[str, list[str]] = {}
+    unserializable = False
+    for entity_id in entity_ids:
+        if entity_id not in changes:
+            continue
+        if (change := changes[entity_id]) is None:
+            unserializable = True
+            continue
+        key, change_json = change
+        serialized.setdefault(key, []).append(change_json)
+    if not serialized:
+        return None, unserializable
+    return (
+        messages.construct_entities_event_message(subscription.msg_id, serialized),
+        unserializable,
+    )
+
+
+def _async_send_unserializable_error(subscription: _EntitySubscription) -> None:
+    """Send an error for changes that could not be serialized."""
+    subscription.send_message(
+        messages.error_message(
+            subscription.msg_id,
+            const.ERR_UNKNOWN_ERROR,
+            "Invalid JSON in response",
+        )
+    )
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the shared subscribe_entities hub."""
+    if (hub := hass.data.get(const.DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        hub = hass.data[const.DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptionHub(hass)
+    return hub
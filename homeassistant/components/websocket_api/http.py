@@ -7,6 +7,7 @@ from collections.abc import Callable
 import datetime as dt
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 
@@ -20,6 +21,7 @@ from homeassistant.util.json import json_loads
 from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
+    DEFLATE_EXECUTOR_SIZE,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -38,6 +40,11 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+def _deflate(compressor: zlib._Compress, data: bytes) -> bytes:
+    """Compress a message and flush it to a byte boundary."""
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -75,6 +82,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_compressor",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -93,9 +101,15 @@ class WebSocketHandler:
         # The WebSocketHandler has a single consumer and path
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
-        # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        # an asyncio.Queue. A callable message is rendered when it is
+        # written, which allows it to be updated while it is queued. A
+        # future message is awaited when it is written, so it keeps its
+        # place in the queue while it is serialized in the executor.
+        self._message_queue: deque[
+            str | Callable[[], str] | asyncio.Future[str] | None
+        ] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        self._compressor: zlib._Compress | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -138,17 +152,34 @@ class WebSocketHandler:
                 if (message := message_queue.popleft()) is None:
                     return
 
+                if not isinstance(message, str):
+                    message = (
+                        await message
+                        if isinstance(message, asyncio.Future)
+                        else message()
+                    )
+
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
+                # Skip deflating messages if the client negotiated
+                # permessage-deflate during the handshake
+                deflate = (
+                    (connection := self._connection) is not None
+                    and connection.can_deflate
+                    and not wsock.compress
+                )
 
                 if (
                     not messages_remaining
-                    or not (connection := self._connection)
+                    or connection is None
                     or not connection.can_coalesce
                 ):
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    if deflate:
+                        await self._async_send_deflated(message)
+                    else:
+                        await send_str(message)
                     continue
 
                 messages: list[str] = [message]
@@ -156,6 +187,12 @@ class WebSocketHandler:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
+                    if not isinstance(message, str):
+                        message = (
+                            await message
+                            if isinstance(message, asyncio.Future)
+                            else message()
+                        )
                     messages.append(message)
                     messages_remaining -= 1
 
@@ -163,7 +200,10 @@ class WebSocketHandler:
                 coalesced_messages = f"[{joined_messages}]"
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                if deflate:
+                    await self._async_send_deflated(coalesced_messages)
+                else:
+                    await send_str(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -174,6 +214,28 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _async_send_deflated(self, message: str) -> None:
+        """Send a message as a binary frame compressed with deflate.
+
+        All messages of the connection share one compression context and
+        each message ends with a sync flush, so the client can inflate
+        the frames as one raw deflate stream.
+        """
+        if (compressor := self._compressor) is None:
+            compressor = self._compressor = zlib.compressobj(
+                zlib.Z_BEST_SPEED, zlib.DEFLATED, -zlib.MAX_WBITS
+            )
+        data = message.encode("utf-8")
+        if len(data) > DEFLATE_EXECUTOR_SIZE:
+            # The writer sends one message at a time so the compression
+            # context is never used concurrently
+            compressed = await self._hass.async_add_executor_job(
+                _deflate, compressor, data
+            )
+        else:
+            compressed = _deflate(compressor, data)
+        await self._wsock.send_bytes(compressed)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -182,9 +244,14 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | dict[str, Any] | Callable[[], str] | asyncio.Future[str]
+    ) -> None:
         """Send a message to the client.
 
+        A callable message is called to render the message when it is
+        written to the client, and a future message is awaited.
+
         Closes connection if the client is not reading the messages.
 
         Async friendly.
@@ -189,6 +189,43 @@ def _state_diff(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
+def entity_change_json(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> tuple[str, str] | None:
+    """Serialize the net change of an entity for an entities event.
+
+    Returns the key of the entities event the change belongs to and
+    the JSON of the change, or None if the entity did not change.
+    """
+    if new_state is None:
+        if old_state is None:
+            return None
+        return ENTITY_EVENT_REMOVE, JSON_DUMP(entity_id)
+    if old_state is None:
+        return (
+            ENTITY_EVENT_ADD,
+            JSON_DUMP({entity_id: new_state.as_compressed_state})[1:-1],
+        )
+    diff = _state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE]
+    if not diff[entity_id][STATE_DIFF_ADDITIONS] and (
+        STATE_DIFF_REMOVALS not in diff[entity_id]
+    ):
+        return None
+    return ENTITY_EVENT_CHANGE, JSON_DUMP(diff)[1:-1]
+
+
+def construct_entities_event_message(iden: int, changes: dict[str, list[str]]) -> str:
+    """Construct an entities event message JSON from serialized changes."""
+    parts = []
+    if added := changes.get(ENTITY_EVENT_ADD):
+        parts.append(f'"{ENTITY_EVENT_ADD}":{{{",".join(added)}}}')
+    if removed := changes.get(ENTITY_EVENT_REMOVE):
+        parts.append(f'"{ENTITY_EVENT_REMOVE}":[{",".join(removed)}]')
+    if changed := changes.get(ENTITY_EVENT_CHANGE):
+        parts.append(f'"{ENTITY_EVENT_CHANGE}":{{{",".join(changed)}}}')
+    return construct_event_message(iden, f'{{{",".join(parts)}}}')
+
+
 def message_to_json(message: dict[str, Any]) -> str:
     """Serialize a websocket message to json."""
     try:
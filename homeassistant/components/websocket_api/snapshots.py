@@ -0,0 +1,108 @@
+"""Serialize snapshots of large payloads once for all connections."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from operator import is_
+from typing import Generic, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from . import messages
+from .const import ERR_UNKNOWN_ERROR, SERIALIZE_EXECUTOR_ITEMS
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class SerializedSnapshotCache(Generic[_T]):
+    """Cache the serialization of the latest snapshot of a payload.
+
+    A snapshot is a list of immutable items, like states or registry
+    entries, that are replaced instead of modified when they change. The
+    identity of the items is the version of the content, so requests for
+    the same items share the serialization of the previous request.
+
+    Large snapshots are serialized in the executor, so the event loop only
+    sends the finished message.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, serialize: Callable[[list[_T]], str]
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._serialize = serialize
+        self._items: list[_T] = []
+        self._payload: str | asyncio.Future[str] | None = None
+
+    @callback
+    def async_get(self, items: list[_T]) -> str | asyncio.Future[str]:
+        """Return the serialized items, or a future if they are serialized."""
+        if (
+            (payload := self._payload) is not None
+            and len(items) == len(self._items)
+            and all(map(is_, items, self._items))
+        ):
+            return payload
+        self._items = items
+        if len(items) < SERIALIZE_EXECUTOR_ITEMS:
+            payload = self._payload = self._serialize(items)
+            return payload
+        future = self._payload = self.hass.async_add_executor_job(
+            self._serialize, items
+        )
+        future.add_done_callback(self._async_payload_done)
+        return future
+
+    @callback
+    def _async_payload_done(self, future: asyncio.Future[str]) -> None:
+        """Forget a serialization that failed."""
+        if future is self._payload and (
+            future.cancelled() or future.exception() is not None
+        ):
+            self._items = []
+            self._payload = None
+
+
+@callback
+def async_render_snapshot(
+    hass: HomeAssistant,
+    msg_id: int,
+    payload: str | asyncio.Future[str],
+    render: Callable[[str], str],
+) -> str | asyncio.Future[str]:
+    """Render the message of a connection from a serialized snapshot.
+
+    The future of a snapshot is shared by all connections, so each
+    connection gets its own future to wait for the message. A snapshot
+    that could not be serialized is sent as an error message, so the
+    writer of the connection never sees the failure.
+    """
+    if isinstance(payload, str):
+        return render(payload)
+    message: asyncio.Future[str] = hass.loop.create_future()
+
+    @callback
+    def _async_payload_done(payload: asyncio.Future[str]) -> None:
+        """Render the message once the snapshot is serialized."""
+        if message.done():
+            return
+        if payload.cancelled():
+            error = "Serialization was cancelled"
+        elif (err := payload.exception()) is not None:
+            _LOGGER.error("Error serializing snapshot: %s", err, exc_info=err)
+            error = "Unable to serialize the response"
+        else:
+            message.set_result(render(payload.result()))
+            return
+        message.set_result(
+            messages.message_to_json(
+                messages.error_message(msg_id, ERR_UNKNOWN_ERROR, error)
+            )
+        )
+
+    payload.add_done_callback(_async_payload_done)
+    return message
@@ -19,6 +19,7 @@ from collections.abc import (
 import concurrent.futures
 from contextlib import suppress
 import datetime
+from decimal import Decimal, DecimalException
 import enum
 import functools
 import logging
@@ -1334,6 +1335,25 @@ class State:
         """Return a JSON string of the State."""
         return json_dumps(self.as_dict())
 
+    @cached_property
+    def as_float(self) -> float | None:
+        """Return the state as a float, or None if it is not a number.
+
+        The state is parsed once and shared by all consumers of the state.
+        """
+        try:
+            return float(self.state)
+        except (ValueError, TypeError):
+            return None
+
+    @cached_property
+    def as_decimal(self) -> Decimal | None:
+        """Return the state as a Decimal, or None if it is not a number."""
+        try:
+            return Decimal(self.state)
+        except (DecimalException, TypeError):
+            return None
+
     @cached_property
     def as_compressed_state(self) -> dict[str, Any]:
         """Build a compressed dict of a state for adds.
@@ -413,13 +413,19 @@ def async_numeric_state(  # noqa: C901
         )
         return False
 
-    try:
-        fvalue = float(value)
-    except (ValueError, TypeError) as ex:
+    fvalue: float | None
+    if value_template is None and attribute is None:
+        fvalue = entity.as_float
+    else:
+        try:
+            fvalue = float(value)
+        except (ValueError, TypeError):
+            fvalue = None
+    if fvalue is None:
         raise ConditionErrorMessage(
             "numeric_state",
             f"entity {entity_id} state '{value}' cannot be processed as a number",
-        ) from ex
+        )
 
     if below is not None:
         if isinstance(below, str):
@@ -432,22 +438,19 @@ def async_numeric_state(  # noqa: C901
                 STATE_UNKNOWN,
             ):
                 return False
-            try:
-                if fvalue >= float(below_entity.state):
-                    condition_trace_set_result(
-                        False,
-                        state=fvalue,
-                        wanted_state_below=float(below_entity.state),
-                    )
-                    return False
-            except (ValueError, TypeError) as ex:
+            if (below_value := below_entity.as_float) is None:
                 raise ConditionErrorMessage(
                     "numeric_state",
                     (
                         f"the 'below' entity {below} state '{below_entity.state}'"
                         " cannot be processed as a number"
                     ),
-                ) from ex
+                )
+            if fvalue >= below_value:
+                condition_trace_set_result(
+                    False, state=fvalue, wanted_state_below=below_value
+                )
+                return False
         elif fvalue >= below:
             condition_trace_set_result(False, state=fvalue, wanted_state_below=below)
             return False
@@ -463,22 +466,19 @@ def async_numeric_state(  # noqa: C901
                 STATE_UNKNOWN,
             ):
                 return False
-            try:
-                if fvalue <= float(above_entity.state):
-                    condition_trace_set_result(
-                        False,
-                        state=fvalue,
-                        wanted_state_above=float(above_entity.state),
-                    )
-                    return False
-            except (ValueError, TypeError) as ex:
+            if (above_value := above_entity.as_float) is None:
                 raise ConditionErrorMessage(
                     "numeric_state",
                     (
                         f"the 'above' entity {above} state '{above_entity.state}'"
                         " cannot be processed as a number"
                     ),
-                ) from ex
+                )
+            if fvalue <= above_value:
+                condition_trace_set_result(
+                    False, state=fvalue, wanted_state_above=above_value
+                )
+                return False
         elif fvalue <= above:
             condition_trace_set_result(False, state=fvalue, wanted_state_above=above)
             return False
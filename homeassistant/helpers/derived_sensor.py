@@ -0,0 +1,153 @@
+"""Evaluate sensors derived from the state of other entities as one graph.
+
+Sensors like integration, derivative or utility_meter compute their state
+from a single source entity. When they listen to their source with
+async_track_state_change_event, every link of a chain like
+power -> integration -> utility_meter runs in its own loop iteration.
+
+Derived sensors register their source with the graph instead. Writes of
+the tracked sources are queued as they are fired, and the queue is
+drained in a single callback, so a change of the first source is
+propagated through the whole chain in order before the loop moves on.
+Since each derived sensor has a single source, the graph is a forest and
+draining the queue in order evaluates it in topological order.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.loader import bind_hass
+
+from .event import EventStateChangedData
+from .typing import EventType
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_DERIVED_SENSOR_GRAPH = "derived_sensor_graph"
+
+# Chains longer than this continue in the next loop iteration, which keeps
+# the loop responsive if derived sensors feed each other in a cycle
+MAX_CASCADE_DEPTH = 16
+
+_StateChangeJob = HassJob[[EventType[EventStateChangedData]], Any]
+
+
+class DerivedSensorGraph:
+    """Propagate source state changes through chains of derived sensors."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the graph."""
+        self.hass = hass
+        self._jobs: dict[str, list[_StateChangeJob]] = {}
+        self._pending: deque[tuple[Event, int]] = deque()
+        self._depth: int | None = None
+        self._drain_scheduled = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_track(
+        self,
+        entity_ids: Iterable[str],
+        action: Callable[[EventType[EventStateChangedData]], Any],
+    ) -> CALLBACK_TYPE:
+        """Call action with the state change events of the entities."""
+        job = HassJob(action, f"derived sensor {entity_ids}")
+        jobs = self._jobs
+        for entity_id in entity_ids:
+            jobs.setdefault(entity_id, []).append(job)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_queue_event,
+                event_filter=self._async_filter_event,
+                run_immediately=True,
+            )
+
+        @callback
+        def remove_listener() -> None:
+            """Stop calling action."""
+            for entity_id in entity_ids:
+                jobs[entity_id].remove(job)
+                if not jobs[entity_id]:
+                    del jobs[entity_id]
+            if not jobs and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return remove_listener
+
+    @callback
+    def _async_filter_event(self, event: Event) -> bool:
+        """Return if the event is for a source of a derived sensor."""
+        return event.data["entity_id"] in self._jobs
+
+    @callback
+    def _async_queue_event(self, event: Event) -> None:
+        """Queue a state change of a source."""
+        depth = 0 if self._depth is None else self._depth + 1
+        self._pending.append((event, depth))
+        if self._depth is None and not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.hass.loop.call_soon(self._async_drain)
+
+    @callback
+    def _async_drain(self) -> None:
+        """Call the derived sensors of all queued source state changes."""
+        self._drain_scheduled = False
+        pending = self._pending
+        deferred: list[tuple[Event, int]] = []
+        while pending:
+            event, depth = pending.popleft()
+            if depth >= MAX_CASCADE_DEPTH:
+                deferred.append((event, 0))
+                continue
+            if not (jobs := self._jobs.get(event.data["entity_id"])):
+                continue
+            self._depth = depth
+            try:
+                for job in jobs[:]:
+                    try:
+                        self.hass.async_run_hass_job(job, event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error while dispatching event for %s to %s",
+                            event.data["entity_id"],
+                            job,
+                        )
+            finally:
+                self._depth = None
+        if deferred:
+            pending.extend(deferred)
+            self._drain_scheduled = True
+            self.hass.loop.call_soon(self._async_drain)
+
+
+@callback
+def _async_get_graph(hass: HomeAssistant) -> DerivedSensorGraph:
+    """Return the derived sensor graph, creating it if needed."""
+    if (graph := hass.data.get(DATA_DERIVED_SENSOR_GRAPH)) is None:
+        graph = hass.data[DATA_DERIVED_SENSOR_GRAPH] = DerivedSensorGraph(hass)
+    return graph
+
+
+@bind_hass
+@callback
+def async_track_derived_state_change_event(
+    hass: HomeAssistant,
+    entity_ids: str | Iterable[str],
+    action: Callable[[EventType[EventStateChangedData]], Any],
+) -> CALLBACK_TYPE:
+    """Track the state changes of the sources of a derived sensor.
+
+    Like async_track_state_change_event, but state changes written while
+    other derived sensors are evaluated are handled in the same callback.
+    """
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    entity_ids = [entity_id.lower() for entity_id in entity_ids]
+    return _async_get_graph(hass).async_track(entity_ids, action)
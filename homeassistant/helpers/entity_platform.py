@@ -13,6 +13,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import (
     ATTR_RESTORED,
+    CONF_HOST,
     DEVICE_DEFAULT_NAME,
     EVENT_HOMEASSISTANT_STARTED,
 )
@@ -41,6 +42,7 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later, async_track_time_interval
 from .issue_registry import IssueSeverity, async_create_issue
+from .polling import POLL_TIMEOUT, async_get_poll_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -134,6 +136,7 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        self._waiting_for_poll = False
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -847,7 +850,8 @@ class EntityPlatform:
         """Update the states of all the polling entities.
 
         To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        in parallel and other entities sequential. The poll scheduler limits
+        how many platforms and coordinators poll at the same time.
 
         This method must be run in the event loop.
         """
@@ -861,25 +865,58 @@ class EntityPlatform:
                 self.scan_interval,
             )
             return
+        if self._waiting_for_poll:
+            # The previous update has not started yet because all poll
+            # slots are in use, it will poll the entities when it does.
+            self.logger.debug(
+                "Updating %s %s is still waiting for a free poll slot",
+                self.platform_name,
+                self.domain,
+            )
+            return
 
-        async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+        host = self.config_entry.data.get(CONF_HOST) if self.config_entry else None
+        executor = any(
+            entity.should_poll and hasattr(entity, "update")
+            for entity in self.entities.values()
+        )
+        self._waiting_for_poll = True
+        try:
+            async with async_get_poll_scheduler(self.hass).async_poll(
+                self.platform_name, host, executor
+            ):
+                self._waiting_for_poll = False
+                async with self._process_updates:
+                    await self._async_update_polling_entities()
+        except TimeoutError:
+            self.logger.warning(
+                "Updating %s %s took longer than %s seconds and was cancelled",
+                self.platform_name,
+                self.domain,
+                POLL_TIMEOUT,
+            )
+        finally:
+            self._waiting_for_poll = False
+
+    async def _async_update_polling_entities(self) -> None:
+        """Update the states of all the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
 
-            if tasks := [
-                entity.async_update_ha_state(True)
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+        if tasks := [
+            entity.async_update_ha_state(True)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
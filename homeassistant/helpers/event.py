@@ -1,12 +1,14 @@
 """Helpers for listening to events."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 from random import randint
 import time
@@ -62,6 +64,8 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+_TIMER_WHEEL = "timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1497,6 +1501,21 @@ def async_track_time_interval(
     interval_listener_job: HassJob[[datetime], None]
     interval_seconds = interval.total_seconds()
 
+    if name:
+        job_name = f"{name}: track time interval {interval} {action}"
+    else:
+        job_name = f"track time interval {interval} {action}"
+
+    if (
+        not cancel_on_shutdown
+        and interval_seconds >= 1
+        and interval_seconds.is_integer()
+    ):
+        # Whole second intervals are dispatched by the shared timer wheel
+        tracker = _IntervalTracker(hass, HassJob(action, job_name), interval_seconds)
+        tracker.async_start()
+        return tracker.async_remove
+
     job = HassJob(
         action, f"track time interval {interval}", cancel_on_shutdown=cancel_on_shutdown
     )
@@ -1510,11 +1529,6 @@ def async_track_time_interval(
         remove = async_call_later(hass, interval_seconds, interval_listener_job)
         hass.async_run_hass_job(job, now)
 
-    if name:
-        job_name = f"{name}: track time interval {interval} {action}"
-    else:
-        job_name = f"track time interval {interval} {action}"
-
     interval_listener_job = HassJob(
         interval_listener, job_name, cancel_on_shutdown=cancel_on_shutdown
     )
@@ -1651,55 +1665,273 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+    key = (
+        tuple(matching_seconds),
+        tuple(matching_minutes),
+        tuple(matching_hours),
+        local,
+    )
+    # Trackers with the same pattern share the next fire time calculation
+    wheel = _async_get_timer_wheel(hass)
+    if (pattern := wheel.patterns.get(key)) is None:
+        pattern = wheel.patterns[key] = _TimePatternTracker(
+            hass, key, matching_seconds, matching_minutes, matching_hours, local
+        )
+    return pattern.async_add_job(job)
+
+
+track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel for this instance."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
 
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        ).replace(microsecond=microsecond)
 
-    time_listener: CALLBACK_TYPE | None = None
-    pattern_time_change_listener_job: HassJob[[datetime], Any] | None = None
+class _TimerWheel:
+    """Dispatch time pattern and interval trackers from a single loop timer.
+
+    Trackers are grouped into buckets by the second they fire next, and
+    only the earliest bucket has a timer scheduled on the event loop.
+    All trackers in due buckets are dispatched from the same callback.
+
+    Every bucket fires at the same random fraction of its second to
+    avoid aligning all instances to the start of the second.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self.patterns: dict[tuple[Any, ...], _TimePatternTracker] = {}
+        self._offset = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX) / 1e6
+        self._buckets: dict[int, dict[_WheelTracker, None]] = {}
+        self._seconds: list[int] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_second: int | None = None
+
+    def fire_timestamp(self, second: int) -> float:
+        """Return the timestamp a bucket fires at."""
+        return second + self._offset
+
+    def nearest_second(self, timestamp: float) -> int:
+        """Return the bucket that fires closest to a timestamp."""
+        return round(timestamp - self._offset)
+
+    @callback
+    def async_schedule(self, tracker: _WheelTracker, second: int) -> None:
+        """Schedule a tracker to fire in the bucket for a second."""
+        tracker.second = second
+        if (bucket := self._buckets.get(second)) is None:
+            bucket = self._buckets[second] = {}
+            heapq.heappush(self._seconds, second)
+        bucket[tracker] = None
+        if self._timer_second is None or second < self._timer_second:
+            self._async_arm()
+
+    @callback
+    def async_unschedule(self, tracker: _WheelTracker) -> None:
+        """Remove a tracker from the bucket it is scheduled in."""
+        if (second := tracker.second) is None:
+            return
+        tracker.second = None
+        if (bucket := self._buckets.get(second)) is None:
+            # The bucket is being dispatched
+            return
+        del bucket[tracker]
+        if not bucket:
+            # The heap is cleaned up lazily when the timer is armed
+            del self._buckets[second]
+            if not self._buckets:
+                self._async_cancel_timer()
 
     @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-        nonlocal pattern_time_change_listener_job
+    def _async_cancel_timer(self) -> None:
+        """Cancel the loop timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+            self._timer_second = None
 
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-        assert pattern_time_change_listener_job is not None
+    @callback
+    def _async_arm(self) -> None:
+        """Schedule the loop timer for the earliest bucket."""
+        seconds = self._seconds
+        while seconds and seconds[0] not in self._buckets:
+            heapq.heappop(seconds)
+        if not seconds:
+            self._async_cancel_timer()
+            return
+        if (second := seconds[0]) == self._timer_second:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        loop = self.hass.loop
+        delta = self.fire_timestamp(second) - time.time()
+        self._timer = loop.call_at(loop.time() + delta, self._async_run)
+        self._timer_second = second
 
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener_job,
-            calculate_next(now + timedelta(seconds=1)),
+    @callback
+    def _async_run(self) -> None:
+        """Dispatch all trackers in due buckets."""
+        self._timer = None
+        self._timer_second = None
+        # Depending on the available clock support it can happen that we
+        # fire a little bit too early as measured by utcnow(), the timer
+        # is rearmed for the remaining time if nothing is due yet.
+        now_timestamp = time_tracker_timestamp()
+        seconds = self._seconds
+        due: list[tuple[int, dict[_WheelTracker, None]]] = []
+        while seconds and self.fire_timestamp(seconds[0]) <= now_timestamp:
+            second = heapq.heappop(seconds)
+            if bucket := self._buckets.pop(second, None):
+                due.append((second, bucket))
+        try:
+            if due:
+                now = time_tracker_utcnow()
+                for second, bucket in due:
+                    for tracker in bucket:
+                        # A listener that fired before may have removed it
+                        if tracker.second != second:
+                            continue
+                        tracker.second = None
+                        try:
+                            tracker.async_fire(now)
+                        except Exception:  # pylint: disable=broad-except
+                            _LOGGER.exception("Error while firing timer %s", tracker)
+        finally:
+            self._async_arm()
+
+
+class _WheelTracker(ABC):
+    """A tracker dispatched by the timer wheel.
+
+    Trackers must schedule their next fire before running any jobs
+    so a failing job cannot stop the tracker.
+    """
+
+    __slots__ = ("hass", "wheel", "second")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.wheel = _async_get_timer_wheel(hass)
+        self.second: int | None = None
+
+    @abstractmethod
+    @callback
+    def async_fire(self, now: datetime) -> None:
+        """Run the tracker and schedule the next fire."""
+
+
+class _IntervalTracker(_WheelTracker):
+    """Track a whole second interval on the timer wheel."""
+
+    __slots__ = ("job", "interval_seconds")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+        interval_seconds: float,
+    ) -> None:
+        """Initialize the interval tracker."""
+        super().__init__(hass)
+        self.job = job
+        self.interval_seconds = interval_seconds
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first interval."""
+        self._async_schedule_next(time.time())
+
+    @callback
+    def _async_schedule_next(self, timestamp: float) -> None:
+        """Schedule the bucket nearest to one interval after a timestamp."""
+        wheel = self.wheel
+        wheel.async_schedule(
+            self, wheel.nearest_second(timestamp + self.interval_seconds)
         )
 
-    pattern_time_change_listener_job = HassJob(
-        pattern_time_change_listener,
-        f"time change listener {hour}:{minute}:{second} {action}",
-    )
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener_job, calculate_next(dt_util.utcnow())
-    )
+    @callback
+    def async_fire(self, now: datetime) -> None:
+        """Run the job and schedule the next interval."""
+        self._async_schedule_next(time.time())
+        self.hass.async_run_hass_job(self.job, now)
 
     @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
+    def async_remove(self) -> None:
+        """Remove the interval tracker."""
+        self.wheel.async_unschedule(self)
 
-    return unsub_pattern_time_change_listener
 
+class _TimePatternTracker(_WheelTracker):
+    """Track all listeners of a time pattern on the timer wheel."""
 
-track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
+    __slots__ = ("key", "matching", "local", "jobs")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: tuple[Any, ...],
+        matching_seconds: list[int],
+        matching_minutes: list[int],
+        matching_hours: list[int],
+        local: bool,
+    ) -> None:
+        """Initialize the time pattern tracker."""
+        super().__init__(hass)
+        self.key = key
+        self.matching = (matching_seconds, matching_minutes, matching_hours)
+        self.local = local
+        self.jobs: dict[
+            object, HassJob[[datetime], Coroutine[Any, Any, None] | None]
+        ] = {}
+
+    def _next_second(self, now: datetime) -> int:
+        """Return the bucket of the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        next_time = dt_util.find_next_time_expression_time(
+            localized_now, *self.matching
+        )
+        return int(next_time.timestamp())
+
+    @callback
+    def async_add_job(
+        self, job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    ) -> CALLBACK_TYPE:
+        """Add a listener for the pattern."""
+        token = object()
+        self.jobs[token] = job
+        if self.second is None:
+            self.wheel.async_schedule(self, self._next_second(dt_util.utcnow()))
+
+        @callback
+        def unsub_pattern_time_change_listener() -> None:
+            """Remove the listener."""
+            self.jobs.pop(token, None)
+            if not self.jobs:
+                self.wheel.async_unschedule(self)
+                self.wheel.patterns.pop(self.key, None)
+
+        return unsub_pattern_time_change_listener
+
+    @callback
+    def async_fire(self, now: datetime) -> None:
+        """Run all listeners and schedule the next match."""
+        self.wheel.async_schedule(self, self._next_second(now + timedelta(seconds=1)))
+        fire_time = dt_util.as_local(now) if self.local else now
+        jobs = self.jobs
+        for token, job in list(jobs.items()):
+            # A listener that ran before may have removed it
+            if token not in jobs:
+                continue
+            try:
+                self.hass.async_run_hass_job(job, fire_time)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while dispatching time change to %s", job)
 
 
 @callback
@@ -1776,13 +2008,16 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
+
+    if old_state is not None and new_state is not None:
+        # Only re-render if a field the template read has changed
+        return info.filter(entity_id) and info.filter_state_change(old_state, new_state)
 
     if info.filter(entity_id):
         return True
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
-        return False
-
     return bool(info.filter_lifecycle(entity_id))
 
 
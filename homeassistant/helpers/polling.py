@@ -0,0 +1,156 @@
+"""Central scheduler for polling entity platforms and data update coordinators."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .singleton import singleton
+
+DATA_POLL_SCHEDULER = "poll_scheduler"
+
+# Polls running at the same time across all integrations
+MAX_CONCURRENT_POLLS = 32
+# Polls of entities with a sync update method, these run in the executor
+MAX_CONCURRENT_EXECUTOR_POLLS = 16
+# Polls of the same host
+MAX_CONCURRENT_HOST_POLLS = 2
+# Polls running longer than this many seconds are cancelled to free their slot
+POLL_TIMEOUT = 300
+
+# Consecutive failed polls before the interval starts to back off
+BACKOFF_FAILURES_THRESHOLD = 3
+# Consecutive polls without changed data before the interval starts to back off
+BACKOFF_UNCHANGED_THRESHOLD = 10
+# The interval is at most multiplied by 2**BACKOFF_MAX_EXPONENT
+BACKOFF_MAX_EXPONENT = 4
+# Backing off never stretches the interval beyond this many seconds
+BACKOFF_MAX_INTERVAL = 900
+
+# Upper bounds in seconds of the poll latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass(slots=True)
+class PollStatistics:
+    """Poll latency histogram of an integration."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    failures: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @callback
+    def async_record(self, duration: float, success: bool) -> None:
+        """Record the duration of a poll."""
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        if not success:
+            self.failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the histogram."""
+        return {
+            "buckets": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(LATENCY_BUCKETS, self.buckets)
+                },
+                "+Inf": self.buckets[-1],
+            },
+            "count": self.count,
+            "failures": self.failures,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+        }
+
+
+class PollScheduler:
+    """Limit concurrent polls and adapt poll intervals.
+
+    Scheduled polls of entity platforms and data update coordinators
+    are run through the scheduler which caps how many of them run at
+    the same time globally, in the executor and per host, so polls that
+    are due at the same time are spread out instead of running as one
+    burst. Polls that do not finish within POLL_TIMEOUT are cancelled and
+    raise TimeoutError so a hung poll cannot hold its slot forever. The
+    duration of every poll is recorded per integration.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the poll scheduler."""
+        self.hass = hass
+        self._polls = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._executor_polls = asyncio.Semaphore(MAX_CONCURRENT_EXECUTOR_POLLS)
+        self._host_polls: dict[str, asyncio.Semaphore] = {}
+        self.statistics: dict[str, PollStatistics] = {}
+
+    @asynccontextmanager
+    async def async_poll(
+        self, domain: str, host: str | None = None, executor: bool = False
+    ) -> AsyncIterator[PollResult]:
+        """Wait for a free poll slot and record the duration of the poll."""
+        async with AsyncExitStack() as stack:
+            if host is not None:
+                if (host_polls := self._host_polls.get(host)) is None:
+                    host_polls = self._host_polls[host] = asyncio.Semaphore(
+                        MAX_CONCURRENT_HOST_POLLS
+                    )
+                await stack.enter_async_context(host_polls)
+            if executor:
+                await stack.enter_async_context(self._executor_polls)
+            await stack.enter_async_context(self._polls)
+            result = PollResult()
+            start = monotonic()
+            try:
+                async with asyncio.timeout(POLL_TIMEOUT):
+                    yield result
+            except TimeoutError:
+                result.success = False
+                raise
+            finally:
+                if (statistics := self.statistics.get(domain)) is None:
+                    statistics = self.statistics[domain] = PollStatistics()
+                statistics.async_record(monotonic() - start, result.success)
+
+    @callback
+    def async_statistics(self, domain: str) -> dict[str, Any] | None:
+        """Return the poll latency histogram of an integration."""
+        if (statistics := self.statistics.get(domain)) is None:
+            return None
+        return statistics.as_dict()
+
+
+@dataclass(slots=True)
+class PollResult:
+    """Outcome of a poll reported back to the scheduler."""
+
+    success: bool = True
+
+
+def backoff_interval(interval: float, failures: int, unchanged: int) -> float:
+    """Return the poll interval adapted to repeated failures or unchanged data."""
+    if failures > BACKOFF_FAILURES_THRESHOLD:
+        exponent = failures - BACKOFF_FAILURES_THRESHOLD
+    elif unchanged > BACKOFF_UNCHANGED_THRESHOLD:
+        exponent = unchanged - BACKOFF_UNCHANGED_THRESHOLD
+    else:
+        return interval
+    backoff = interval * 2.0 ** min(exponent, BACKOFF_MAX_EXPONENT)
+    return min(backoff, max(interval, BACKOFF_MAX_INTERVAL))
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler."""
+    return PollScheduler(hass)
@@ -92,4 +92,6 @@ def state_as_number(state: State) -> float:
     ):
         return 0
 
-    return float(state.state)
+    if (value := state.as_float) is None:
+        raise ValueError(f"could not convert string to float: {state.state!r}")
+    return value
@@ -10,8 +10,10 @@ from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -32,7 +34,6 @@ from typing import (
     overload,
 )
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
@@ -46,6 +47,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -55,6 +57,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -80,6 +83,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -102,6 +106,9 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 _GROUP_DOMAIN_PREFIX = "group."
 _ZONE_DOMAIN_PREFIX = "zone."
 
+# Reading this field of a state means any change to the state must re-render
+_ALL_STATE_FIELDS = "*"
+
 _COLLECTABLE_STATE_ATTRIBUTES = {
     "state",
     "attributes",
@@ -153,6 +160,26 @@ CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
 )
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# CACHED_TEMPLATE_CODE holds the compiled code of the most recently used
+# templates keyed by (environment flavor, source). Unlike a weak cache,
+# entries survive the Template objects that compiled them so templates
+# that are created over and over again (websocket render_template
+# subscriptions, reloads) do not have to be compiled again. The cache
+# is persisted at shutdown and loaded at startup by
+# async_load_bytecode_cache so restarts skip recompilation as well.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+CACHED_TEMPLATE_CODE: MutableMapping[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+# The persisted code is only valid for the exact same jinja, Home Assistant
+# and Python bytecode version that compiled it.
+BYTECODE_CACHE_VERSION = f"{jinja2.__version__}-{HA_VERSION}-{MAGIC_NUMBER.hex()}"
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+BYTECODE_SAVE_DELAY = 300
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -340,6 +367,8 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "state_fields",
+        "state_attributes",
         "rate_limit",
         "has_time",
     )
@@ -358,6 +387,8 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        self.state_fields: collections.abc.Set[str] = set()
+        self.state_attributes: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -370,6 +401,8 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" state_fields={self.state_fields}"
+            f" state_attributes={self.state_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -400,6 +433,42 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def filter_state_change(self, old_state: State, new_state: State) -> bool:
+        """Template should re-render if a field it read changed.
+
+        Only the fields and attributes of states read during the
+        last render are compared, changes to anything else cannot
+        change the result of the template.
+        """
+        fields = self.state_fields
+        if (
+            _ALL_STATE_FIELDS in fields
+            or "last_updated" in fields
+            or "context" in fields
+        ):
+            return True
+        if "state" in fields and old_state.state != new_state.state:
+            return True
+        if (
+            "last_changed" in fields
+            and old_state.last_changed != new_state.last_changed
+        ):
+            return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        if old_attributes is new_attributes:
+            return False
+        if "attributes" in fields:
+            return old_attributes != new_attributes
+        if "name" in fields and old_attributes.get(
+            ATTR_FRIENDLY_NAME
+        ) != new_attributes.get(ATTR_FRIENDLY_NAME):
+            return True
+        return any(
+            old_attributes.get(attribute) != new_attributes.get(attribute)
+            for attribute in self.state_attributes
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -415,8 +484,14 @@ class RenderInfo:
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
+        self.state_fields = frozenset(self.state_fields)
+        self.state_attributes = frozenset(self.state_attributes)
 
     def _freeze(self) -> None:
+        if self.exception:
+            # The render was aborted so we do not know which fields
+            # the template would have read
+            self.state_fields = {_ALL_STATE_FIELDS}
         self._freeze_sets()
 
         if self.rate_limit is None:
@@ -943,9 +1018,22 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
 
-    def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+    def _collect_state(self, field: str) -> None:
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.state_fields.add(field)  # type: ignore[attr-defined]
+
+    def _collect_state_attribute(self, attribute: str) -> None:
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.state_attributes.add(attribute)  # type: ignore[attr-defined]
+
+    def _get_attribute(self, attribute: str) -> Any:
+        """Return a single attribute, only collecting that attribute."""
+        self._collect_state_attribute(attribute)
+        return self._state.attributes.get(attribute)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -953,8 +1041,10 @@ class TemplateStateBase(State):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if render_info := _render_info.get():
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                render_info.state_fields.add(item)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -973,49 +1063,49 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state("domain")
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state("object_id")
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("name")
         return self._state.name
 
     @property
@@ -1032,7 +1122,8 @@ class TemplateStateBase(State):
             async_rounded_state,
         )
 
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state_attribute(ATTR_UNIT_OF_MEASUREMENT)
         if rounded and self._state.domain == SENSOR_DOMAIN:
             state = async_rounded_state(self._hass, self._entity_id, self._state)
         else:
@@ -1043,7 +1134,7 @@ class TemplateStateBase(State):
 
     def __eq__(self, other: Any) -> bool:
         """Ensure we collect on equality check."""
-        self._collect_state()
+        self._collect_state(_ALL_STATE_FIELDS)
         return self._state.__eq__(other)
 
 
@@ -1060,6 +1151,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state(_ALL_STATE_FIELDS)
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1591,7 +1683,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # pylint: disable=protected-access
     return None
 
 
@@ -2248,6 +2340,56 @@ def make_logging_undefined(
     return LoggingUndefined
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load persisted compiled template code and persist it again at shutdown."""
+    store = Store[dict[str, Any]](
+        hass, BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY, private=True
+    )
+    cached_code: dict[tuple[str, str], CodeType] = {}
+    data = await store.async_load()
+    if data and data.get("version") == BYTECODE_CACHE_VERSION:
+        cached_code = await hass.async_add_executor_job(
+            _decode_bytecode_cache, data["code"]
+        )
+    for key, code in cached_code.items():
+        if key not in CACHED_TEMPLATE_CODE:
+            CACHED_TEMPLATE_CODE[key] = code
+
+    @callback
+    def _async_data_to_save() -> dict[str, Any]:
+        """Return the compiled template code to persist."""
+        return {
+            "version": BYTECODE_CACHE_VERSION,
+            "code": [
+                [flavor, source, base64.b64encode(marshal.dumps(code)).decode()]
+                for (flavor, source), code in CACHED_TEMPLATE_CODE.items()
+            ],
+        }
+
+    @callback
+    def _async_save_at_stop(_: Any) -> None:
+        """Persist the compiled template code if it changed."""
+        if set(CACHED_TEMPLATE_CODE.keys()) != cached_code.keys():
+            store.async_delay_save(_async_data_to_save)
+
+    # Persist what was compiled during startup in case we do not shut down cleanly
+    store.async_delay_save(_async_data_to_save, BYTECODE_SAVE_DELAY)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_at_stop)
+
+
+def _decode_bytecode_cache(
+    encoded: list[list[str]],
+) -> dict[tuple[str, str], CodeType]:
+    """Decode persisted compiled template code."""
+    result: dict[tuple[str, str], CodeType] = {}
+    for flavor, source, code in encoded:
+        try:
+            result[(flavor, source)] = marshal.loads(base64.b64decode(code))
+        except (ValueError, EOFError, TypeError) as err:
+            _LOGGER.debug("Unable to decode cached template %s: %s", source, err)
+    return result
+
+
 async def async_load_custom_templates(hass: HomeAssistant) -> None:
     """Load all custom jinja files under 5MiB into memory."""
     custom_templates = await hass.async_add_executor_job(_load_custom_templates, hass)
@@ -2315,9 +2457,16 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | str | None
-        ] = weakref.WeakValueDictionary()
+        # Compiled code depends on the globals and filters of the environment
+        # so the shared code cache is keyed by the environment flavor
+        if hass is None:
+            self.template_cache_flavor = "no_hass"
+        elif limited:
+            self.template_cache_flavor = "limited"
+        elif strict:
+            self.template_cache_flavor = "strict"
+        else:
+            self.template_cache_flavor = "normal"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2601,8 +2750,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        if not isinstance(source, str):
+            return super().compile(source)
+
+        key = (self.template_cache_flavor, source)
+        if (cached := CACHED_TEMPLATE_CODE.get(key)) is None:
+            cached = CACHED_TEMPLATE_CODE[key] = super().compile(source)
 
         return cached
 
@@ -15,7 +15,7 @@ import aiohttp
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -26,6 +26,7 @@ from homeassistant.util.dt import utcnow
 
 from . import entity, event
 from .debounce import Debouncer
+from .polling import async_get_poll_scheduler, backoff_interval
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
@@ -59,6 +60,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`backoff_failures` to ``True`` will back off the refresh
+    interval after repeated failures. Setting :attr:`backoff_unchanged` to
+    ``True`` will back off when the data has not changed for a number of
+    refreshes.
     """
 
     def __init__(
@@ -71,6 +77,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        backoff_failures: bool = False,
+        backoff_unchanged: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -81,6 +89,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.backoff_failures = backoff_failures
+        self.backoff_unchanged = backoff_unchanged
+        self._poll_failures = 0
+        self._poll_unchanged = 0
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -220,7 +232,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         now = self.hass.loop.time()
 
         next_refresh = int(now) + self._microsecond
-        next_refresh += self.update_interval.total_seconds()
+        next_refresh += backoff_interval(
+            self.update_interval.total_seconds(),
+            self._poll_failures,
+            self._poll_unchanged,
+        )
         self._unsub_refresh = event.async_call_at(
             self.hass,
             self._job,
@@ -230,7 +246,22 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        domain = host = None
+        if entry := self.config_entry:
+            domain = entry.domain
+            host = entry.data.get(CONF_HOST)
+        try:
+            async with async_get_poll_scheduler(self.hass).async_poll(
+                domain or self.name, host
+            ) as poll:
+                await self._async_refresh(log_failures=True, scheduled=True)
+                poll.success = self.last_update_success
+        except TimeoutError as err:
+            self.last_exception = err
+            if self.last_update_success:
+                self.logger.error("Timeout fetching %s data", self.name)
+                self.last_update_success = False
+                self.async_update_listeners()
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -368,6 +399,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            if not self.last_update_success:
+                if self.backoff_failures:
+                    self._poll_failures += 1
+            else:
+                self._poll_failures = 0
+                if self.backoff_unchanged and previous_data == self.data:
+                    self._poll_unchanged += 1
+                else:
+                    self._poll_unchanged = 0
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
@@ -405,6 +445,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self.data = data
         self.last_update_success = True
+        self._poll_failures = self._poll_unchanged = 0
         self.logger.debug(
             "Manually updated %s data",
             self.name,
@@ -258,3 +258,33 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_index(hass: HomeAssistant) -> None:
+    """Test refresh tokens are looked up by id after changes and reloads."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Paulus")
+    other_user = await store.async_create_user("Other")
+    refresh_token = await store.async_create_refresh_token(user, "http://client")
+    other_token = await store.async_create_refresh_token(other_user, "http://client")
+    assert await store.async_get_refresh_token(refresh_token.id) is refresh_token
+
+    await store.async_remove_refresh_token(refresh_token)
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+    assert refresh_token.id not in user.refresh_tokens
+
+    refresh_token = await store.async_create_refresh_token(user, "http://client")
+    await store.async_remove_user(user)
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+
+    store._async_schedule_save()
+    await hass.async_block_till_done()
+    with patch(
+        "homeassistant.helpers.storage.Store.async_load",
+        return_value=store._data_to_save(),
+    ):
+        reloaded_store = auth_store.AuthStore(hass)
+        reloaded_token = await reloaded_store.async_get_refresh_token(other_token.id)
+    assert reloaded_token is not None
+    assert reloaded_token.user.id == other_user.id
+    assert await reloaded_store.async_get_refresh_token(refresh_token.id) is None
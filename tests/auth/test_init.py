@@ -1298,3 +1298,57 @@ async def test_access_token_from_the_future(mock_hass) -> None:
     with freeze_time(now + timedelta(days=365)):
         rt = await manager.async_validate_access_token(access_token)
         assert rt.id == refresh_token.id
+
+
+async def test_verified_access_token_cache(mock_hass) -> None:
+    """Test verified access tokens are cached."""
+    now = dt_util.utcnow()
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=auth.jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert len(mock_verify.mock_calls) == 1
+
+        # The token is verified again once the cache entry expires
+        with freeze_time(
+            now + auth_const.ACCESS_TOKEN_CACHE_TIME + timedelta(seconds=1)
+        ):
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+        assert len(mock_verify.mock_calls) == 2
+
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_verified_access_token_cache_size(mock_hass) -> None:
+    """Test the access token cache is bounded."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_tokens = []
+    for seconds in range(3):
+        with freeze_time(dt_util.utcnow() + timedelta(seconds=seconds)):
+            access_tokens.append(manager.async_create_access_token(refresh_token))
+
+    with patch.object(auth, "ACCESS_TOKEN_CACHE_SIZE", 2):
+        for access_token in access_tokens:
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+
+    assert list(manager._access_token_cache) == access_tokens[1:]
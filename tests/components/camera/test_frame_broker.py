@@ -0,0 +1,157 @@
+"""Test the camera frame broker."""
+import asyncio
+from unittest.mock import AsyncMock, call, patch
+
+import pytest
+
+from homeassistant.components import camera
+from homeassistant.components.camera import frame_broker
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .common import EMPTY_8_6_JPEG, mock_turbo_jpeg
+
+
+async def test_concurrent_requests_share_fetch(
+    hass: HomeAssistant, mock_camera
+) -> None:
+    """Test concurrent image requests share one fetch per interval."""
+    mock_image = AsyncMock(side_effect=[b"first", b"second"])
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_image,
+    ), patch(
+        "homeassistant.components.camera.frame_broker.monotonic", return_value=100
+    ) as mock_monotonic:
+        images = await asyncio.gather(
+            *(camera.async_get_image(hass, "camera.demo_camera") for _ in range(10))
+        )
+        assert {image.content for image in images} == {b"first"}
+        assert mock_image.call_count == 1
+
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"first"
+        assert mock_image.call_count == 1
+
+        # A new frame is fetched once the frame interval passed
+        mock_monotonic.return_value = 101
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"second"
+        assert mock_image.call_count == 2
+
+
+async def test_scaled_variants_cached(hass: HomeAssistant, mock_camera) -> None:
+    """Test a frame is scaled once per size."""
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=300, second_height=200
+    )
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ):
+        images = await asyncio.gather(
+            *(
+                camera.async_get_image(hass, "camera.demo_camera", width=4, height=3)
+                for _ in range(5)
+            )
+        )
+
+    assert {image.content for image in images} == {EMPTY_8_6_JPEG}
+    assert turbo_jpeg.scale_with_quality.call_count == 1
+
+
+async def test_sizes_fetched_once(hass: HomeAssistant, mock_camera) -> None:
+    """Test viewers asking for the same size share one fetch per size."""
+    mock_image = AsyncMock(return_value=b"image")
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_image,
+    ), patch(
+        "homeassistant.components.camera.frame_broker.scale_jpeg_camera_image",
+        side_effect=lambda image, width, height: f"{width}x{height}".encode(),
+    ) as mock_scale:
+        images = await asyncio.gather(
+            *(
+                camera.async_get_image(
+                    hass, "camera.demo_camera", width=size, height=size
+                )
+                for size in (1, 2) * 5
+            )
+        )
+
+    assert [image.content for image in images] == [b"1x1", b"2x2"] * 5
+    assert mock_image.call_args_list == [
+        call(width=1, height=1),
+        call(width=2, height=2),
+    ]
+    assert mock_scale.call_count == 2
+
+
+async def test_camera_scales_natively(hass: HomeAssistant, mock_camera) -> None:
+    """Test the size is passed to cameras that are not scaled by us."""
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    mock_image = AsyncMock(
+        side_effect=lambda width, height: f"{width}x{height}".encode()
+    )
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_image,
+    ), patch.object(entity, "content_type", "image/png"):
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        full_image = await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert image.content == b"4x3"
+    assert full_image.content == b"NonexNone"
+    assert len(entity.frame_broker._frames) == 2
+
+
+async def test_frames_bounded(hass: HomeAssistant, mock_camera) -> None:
+    """Test frames are only kept for the most recently fetched sizes."""
+    mock_image = AsyncMock(return_value=b"image")
+    entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_image,
+    ):
+        for size in range(1, 21):
+            await entity.frame_broker.async_get_frame(10, size, size)
+
+    assert len(entity.frame_broker._frames) == frame_broker.MAX_FRAME_SIZES
+
+
+async def test_hung_fetch_times_out(hass: HomeAssistant, mock_camera) -> None:
+    """Test a camera that hangs once does not block later viewers."""
+    hang = asyncio.Event()
+
+    async def _hang_once(width: int | None, height: int | None) -> bytes:
+        if not hang.is_set():
+            hang.set()
+            await asyncio.Event().wait()
+        return b"image"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_hang_once,
+    ), patch.object(frame_broker, "FRAME_FETCH_TIMEOUT", 0.01):
+        with pytest.raises(HomeAssistantError):
+            await camera.async_get_image(hass, "camera.demo_camera", timeout=5)
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert image.content == b"image"
+
+
+async def test_failed_fetch_not_cached(hass: HomeAssistant, mock_camera) -> None:
+    """Test a failed fetch is not cached."""
+    mock_image = AsyncMock(side_effect=[None, b"image"])
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        mock_image,
+    ):
+        entity = hass.data[camera.DOMAIN].get_entity("camera.demo_camera")
+        assert await entity.frame_broker.async_get_frame(10) is None
+        frame = await entity.frame_broker.async_get_frame(10)
+
+    assert frame is not None
+    assert frame.content == b"image"
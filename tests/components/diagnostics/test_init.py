@@ -7,6 +7,7 @@ import pytest
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import async_get
+from homeassistant.helpers.polling import async_get_poll_scheduler
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.setup import async_setup_component
 
@@ -124,6 +125,25 @@ async def test_download_diagnostics(
     }
 
 
+async def test_download_diagnostics_poll_statistics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test download diagnostics includes the poll statistics of the integration."""
+    config_entry = MockConfigEntry(domain="fake_integration")
+    config_entry.add_to_hass(hass)
+    scheduler = async_get_poll_scheduler(hass)
+    async with scheduler.async_poll("fake_integration"):
+        pass
+
+    diagnostics = await _get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+    assert diagnostics["poll_statistics"] == scheduler.async_statistics(
+        "fake_integration"
+    )
+    assert diagnostics["poll_statistics"]["count"] == 1
+
+
 async def test_failure_scenarios(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -4,6 +4,7 @@ from http import HTTPStatus
 from unittest.mock import patch
 
 import aiohttp
+from freezegun.api import FrozenDateTimeFactory
 import httpx
 import pytest
 import respx
@@ -33,7 +34,10 @@ from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 @respx.mock
 async def test_fetching_url(
-    hass: HomeAssistant, hass_client: ClientSessionGenerator, fakeimgbytes_png
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    fakeimgbytes_png,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test that it fetches the given url."""
     respx.get("http://example.com").respond(stream=fakeimgbytes_png)
@@ -63,6 +67,11 @@ async def test_fetching_url(
     body = await resp.read()
     assert body == fakeimgbytes_png
 
+    # The image is shared with requests during the frame interval
+    resp = await client.get("/api/camera_proxy/camera.config_test")
+    assert respx.calls.call_count == 1
+
+    freezer.tick(1)
     resp = await client.get("/api/camera_proxy/camera.config_test")
     assert respx.calls.call_count == 2
 
@@ -133,6 +142,7 @@ async def test_limit_refetch(
     hass_client: ClientSessionGenerator,
     fakeimgbytes_png,
     fakeimgbytes_jpg,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test that it fetches the given url."""
     respx.get("http://example.com/0a").respond(stream=fakeimgbytes_png)
@@ -163,6 +173,7 @@ async def test_limit_refetch(
 
     hass.states.async_set("sensor.temp", "5")
 
+    freezer.tick(1)
     with pytest.raises(aiohttp.ServerTimeoutError), patch(
         "asyncio.timeout", side_effect=asyncio.TimeoutError()
     ):
@@ -173,12 +184,14 @@ async def test_limit_refetch(
 
     hass.states.async_set("sensor.temp", "10")
 
+    freezer.tick(1)
     resp = await client.get("/api/camera_proxy/camera.config_test")
     assert respx.calls.call_count == 2
     assert resp.status == HTTPStatus.OK
     body = await resp.read()
     assert body == fakeimgbytes_png
 
+    freezer.tick(1)
     resp = await client.get("/api/camera_proxy/camera.config_test")
     assert respx.calls.call_count == 2
     assert resp.status == HTTPStatus.OK
@@ -188,6 +201,7 @@ async def test_limit_refetch(
     hass.states.async_set("sensor.temp", "15")
 
     # Url change = fetch new image
+    freezer.tick(1)
     resp = await client.get("/api/camera_proxy/camera.config_test")
     assert respx.calls.call_count == 3
     assert resp.status == HTTPStatus.OK
@@ -196,6 +210,7 @@ async def test_limit_refetch(
 
     # Cause a template render error
     hass.states.async_remove("sensor.temp")
+    freezer.tick(1)
     resp = await client.get("/api/camera_proxy/camera.config_test")
     assert respx.calls.call_count == 3
     assert resp.status == HTTPStatus.OK
@@ -453,6 +468,7 @@ async def test_timeout_cancelled(
     hass_client: ClientSessionGenerator,
     fakeimgbytes_png,
     fakeimgbytes_jpg,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test that timeouts and cancellations return last image."""
 
@@ -483,6 +499,7 @@ async def test_timeout_cancelled(
 
     respx.get("http://example.com").respond(stream=fakeimgbytes_jpg)
 
+    freezer.tick(1)
     with patch(
         "homeassistant.components.generic.camera.GenericCamera.async_camera_image",
         side_effect=asyncio.CancelledError(),
@@ -497,6 +514,7 @@ async def test_timeout_cancelled(
     ]
 
     for total_calls in range(2, 4):
+        freezer.tick(1)
         resp = await client.get("/api/camera_proxy/camera.config_test")
         assert respx.calls.call_count == total_calls
         assert resp.status == HTTPStatus.OK
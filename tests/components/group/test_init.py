@@ -359,6 +359,63 @@ async def test_expand_entity_ids_expands_nested_groups(hass: HomeAssistant) -> N
     ] == sorted(group.expand_entity_ids(hass, ["group.group_of_groups"]))
 
 
+async def test_expand_entity_ids_follows_member_changes(hass: HomeAssistant) -> None:
+    """Test expanded and reverse membership follow changes of nested groups."""
+    hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.one"]})
+    hass.states.async_set(
+        "group.outer", STATE_ON, {"entity_id": ["group.inner", "switch.one"]}
+    )
+    assert await async_setup_component(hass, "group", {})
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.one",
+        "switch.one",
+    ]
+    assert group.groups_with_entity(hass, "group.inner") == ["group.outer"]
+
+    hass.states.async_set(
+        "group.inner", STATE_ON, {"entity_id": ["light.two", "group.outer"]}
+    )
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.two",
+        "switch.one",
+    ]
+    assert group.groups_with_entity(hass, "light.one") == []
+    assert group.groups_with_entity(hass, "light.two") == ["group.inner"]
+
+    hass.states.async_remove("group.inner")
+    assert group.expand_entity_ids(hass, ["group.outer", "light.two"]) == [
+        "switch.one",
+        "light.two",
+    ]
+    assert group.groups_with_entity(hass, "light.two") == []
+
+
+async def test_expand_entity_ids_without_membership_graph(
+    hass: HomeAssistant,
+) -> None:
+    """Test expanding before setup and from a thread reads the group states."""
+    hass.states.async_set("group.inner", STATE_ON, {"entity_id": ["light.one"]})
+    hass.states.async_set(
+        "group.outer", STATE_ON, {"entity_id": ["group.inner", "switch.one"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.outer"]) == [
+        "light.one",
+        "switch.one",
+    ]
+    assert group.MEMBERSHIP_KEY not in hass.data
+
+    assert await async_setup_component(hass, "group", {})
+    membership = hass.data[group.MEMBERSHIP_KEY]
+
+    with patch.object(membership, "async_expand") as mock_expand:
+        assert await hass.loop.run_in_executor(
+            None, group.expand_entity_ids, hass, ["group.outer"]
+        ) == ["light.one", "switch.one"]
+    mock_expand.assert_not_called()
+
+
 async def test_set_assumed_state_based_on_tracked(hass: HomeAssistant) -> None:
     """Test assumed state."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -457,7 +514,8 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.second_group",
         "group.test_group",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    # The group state tracking and the group membership graph
+    assert hass.bus.async_listeners()["state_changed"] == 2
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
@@ -476,7 +534,7 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.all_tests",
         "group.hello",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    assert hass.bus.async_listeners()["state_changed"] == 2
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
     assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
@@ -32,6 +32,7 @@ from homeassistant.components.light import (
     SUPPORT_COLOR,
     SUPPORT_COLOR_TEMP,
     ColorMode,
+    LightEntityFeature,
 )
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -261,6 +262,73 @@ async def test_state_reporting_all(hass: HomeAssistant) -> None:
     assert hass.states.get("light.light_group").state == STATE_UNAVAILABLE
 
 
+async def test_aggregation_follows_member_changes(hass: HomeAssistant) -> None:
+    """Test aggregated attributes only account for the current member states."""
+    await async_setup_component(
+        hass,
+        LIGHT_DOMAIN,
+        {
+            LIGHT_DOMAIN: {
+                "platform": DOMAIN,
+                "entities": ["light.test1", "light.test2", "light.test3"],
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    for entity_id, brightness, effect in (
+        ("light.test1", 100, "rainbow"),
+        ("light.test2", 200, "colorloop"),
+        ("light.test3", 50, "colorloop"),
+    ):
+        hass.states.async_set(
+            entity_id,
+            STATE_ON,
+            {
+                ATTR_BRIGHTNESS: brightness,
+                ATTR_COLOR_MODE: ColorMode.COLOR_TEMP,
+                ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP],
+                ATTR_SUPPORTED_FEATURES: LightEntityFeature.EFFECT,
+                ATTR_EFFECT: effect,
+                ATTR_EFFECT_LIST: ["None", effect],
+                ATTR_MIN_COLOR_TEMP_KELVIN: brightness * 10,
+            },
+        )
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.attributes[ATTR_BRIGHTNESS] == 116
+    assert state.attributes[ATTR_EFFECT] == "colorloop"
+    assert state.attributes[ATTR_EFFECT_LIST] == ["None", "colorloop", "rainbow"]
+    assert state.attributes[ATTR_MIN_COLOR_TEMP_KELVIN] == 500
+
+    hass.states.async_set(
+        "light.test3",
+        STATE_OFF,
+        {
+            ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP],
+            ATTR_SUPPORTED_FEATURES: LightEntityFeature.EFFECT,
+            ATTR_EFFECT_LIST: ["None"],
+        },
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.attributes[ATTR_BRIGHTNESS] == 150
+    # Ties go to the first member
+    assert state.attributes[ATTR_EFFECT] == "rainbow"
+    assert state.attributes[ATTR_EFFECT_LIST] == ["None", "colorloop", "rainbow"]
+    assert state.attributes[ATTR_MIN_COLOR_TEMP_KELVIN] == 1000
+
+    hass.states.async_remove("light.test2")
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.attributes[ATTR_BRIGHTNESS] == 100
+    assert state.attributes[ATTR_EFFECT] == "rainbow"
+    assert state.attributes[ATTR_EFFECT_LIST] == ["None", "rainbow"]
+    assert state.attributes[ATTR_MIN_COLOR_TEMP_KELVIN] == 1000
+
+
 async def test_brightness(
     hass: HomeAssistant, enable_custom_integrations: None
 ) -> None:
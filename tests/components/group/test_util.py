@@ -0,0 +1,35 @@
+"""The tests for the group utility functions."""
+from homeassistant.components.group.util import (
+    MeanReducer,
+    TupleMeanReducer,
+    mean_int,
+    mean_tuple,
+)
+
+
+def test_mean_reducers_do_not_drift() -> None:
+    """Test the means match the current values after many member changes."""
+    mean = MeanReducer()
+    tuple_mean = TupleMeanReducer()
+    for step in range(100):
+        for idx in range(3):
+            mean.async_update(f"light.test{idx}", step * 0.1 + idx * 0.7)
+            tuple_mean.async_update(f"light.test{idx}", (step * 0.1 + idx * 0.7, 33.3))
+    for idx, value in enumerate((20, 30, 40)):
+        mean.async_update(f"light.test{idx}", value)
+        tuple_mean.async_update(f"light.test{idx}", (value, 50))
+
+    assert mean.result == mean_int(20, 30, 40) == 30
+    assert tuple_mean.result == mean_tuple((20, 50), (30, 50), (40, 50)) == (30, 50)
+
+
+def test_tuple_mean_reducer_reduces_common_columns() -> None:
+    """Test only the columns all values have are reduced, like mean_tuple."""
+    reducer = TupleMeanReducer(default=(0, 0))
+    assert reducer.result == (0, 0)
+    reducer.async_update("light.test1", (1, 2, 3))
+    assert reducer.result == (1, 2, 3)
+    reducer.async_update("light.test2", (3, 4))
+    assert reducer.result == (2, 3)
+    reducer.async_update("light.test2", None)
+    assert reducer.result == (1, 2, 3)
@@ -9,7 +9,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
-from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -171,6 +171,61 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_deduplicate_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends each distinct attribute set once."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.other", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "sensor.other"],
+            "significant_changes_only": False,
+            "deduplicate_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    attributes = result["attributes"]
+    assert [state["a"] for state in result["states"]["sensor.test"]] == [0, 0, 1, 0]
+    assert [state["a"] for state in result["states"]["sensor.other"]] == [2]
+    assert attributes == [{"any": "attr"}, {"any": "changed"}, {"any": "attr"}]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": dt_util.utcnow().isoformat(),
+            "end_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["sensor.test"],
+            "include_start_time_state": False,
+            "deduplicate_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"states": {}, "attributes": []}
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -983,6 +1038,52 @@ async def test_history_stream_live(
     }
 
 
+async def test_history_stream_live_deduplicate_attributes(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends each distinct attribute set once per message."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": now.isoformat(),
+            "significant_changes_only": False,
+            "deduplicate_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    event = response["event"]
+    assert event["end_time"] == sensor_one_last_updated.timestamp()
+    assert event["attributes"] == [{"any": "attr"}]
+    assert [state["a"] for state in event["states"]["sensor.one"]] == [0, 0]
+
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.one", "off", attributes={"diff": "attr"})
+    await async_recorder_block_till_done(hass)
+
+    response = await client.receive_json()
+    event = response["event"]
+    assert event["attributes"] == [{"any": "attr"}, {"diff": "attr"}]
+    assert [state["a"] for state in event["states"]["sensor.one"]] == [0, 0, 1]
+
+
 async def test_history_stream_live_minimal_response(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1908,3 +2009,50 @@ async def test_history_stream_historical_only_with_start_time_state_past(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_stream_tap_converts_state_changes_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test the stream tap converts each state change once for all streams."""
+    tap = websocket_api.HistoryStreamTap(hass)
+    init_listeners = hass.bus.async_listeners()
+    received: dict[str, list[websocket_api.HistoryStreamedState]] = {
+        "all": [],
+        "significant": [],
+        "no_attributes": [],
+    }
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+
+    unsubs = [
+        tap.async_subscribe(
+            ["sensor.One"],
+            websocket_api._HistoryStreamSubscriber(
+                received[name].append, significant_only, no_attributes
+            ),
+        )
+        for name, significant_only, no_attributes in (
+            ("all", False, False),
+            ("significant", True, False),
+            ("no_attributes", False, True),
+        )
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == (
+        init_listeners.get(EVENT_STATE_CHANGED, 0) + 1
+    )
+
+    hass.states.async_set("sensor.one", "on", attributes={"any": "changed"})
+    hass.states.async_set("sensor.one", "off", attributes={"any": "changed"})
+    hass.states.async_set("sensor.two", "off")
+
+    assert [item.compressed_state["s"] for item in received["all"]] == ["on", "off"]
+    assert received["significant"] == received["all"][1:]
+    assert received["significant"][0] is received["all"][1]
+    assert received["all"][1].compressed_state["a"] == {"any": "changed"}
+    assert "a" not in received["no_attributes"][1].compressed_state
+
+    for unsub in unsubs:
+        unsub()
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
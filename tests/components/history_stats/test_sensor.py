@@ -1,6 +1,6 @@
 """The test for the History Statistics sensor platform."""
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1230,6 +1230,90 @@ async def test_measure_sliding_window(
     assert hass.states.get("sensor.sensor4").state == "41.7"
 
 
+async def test_measure_sliding_window_without_database(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a sliding window only loads the history from the database once."""
+    start_time = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    window_start = start_time - timedelta(minutes=60)
+
+    # Window    t0                 Start     Off
+    # |--30min--|--------30min-----|--20min--|----
+    # |---off---|--------on--------|---on----|-off
+
+    fake_states = Mock(
+        return_value={
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "off", last_changed=window_start),
+                ha.State(
+                    "binary_sensor.test_id",
+                    "on",
+                    last_changed=window_start + timedelta(minutes=30),
+                ),
+            ]
+        }
+    )
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        fake_states,
+    ):
+        with freeze_time(start_time):
+            await async_setup_component(
+                hass,
+                "sensor",
+                {
+                    "sensor": [
+                        {
+                            "platform": "history_stats",
+                            "entity_id": "binary_sensor.test_id",
+                            "name": "sensor1",
+                            "state": "on",
+                            "end": "{{ utcnow() }}",
+                            "duration": {"hours": 1},
+                            "type": "time",
+                        },
+                        {
+                            "platform": "history_stats",
+                            "entity_id": "binary_sensor.test_id",
+                            "name": "sensor2",
+                            "state": "on",
+                            "end": "{{ utcnow() }}",
+                            "duration": {"hours": 1},
+                            "type": "count",
+                        },
+                    ]
+                },
+            )
+            await hass.async_block_till_done()
+
+        assert fake_states.call_count == 2
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+        assert hass.states.get("sensor.sensor2").state == "1"
+
+        for minutes, state, seconds_matched, match_count in (
+            (15, None, 45 * 60, 1),
+            (20, "off", 50 * 60, 1),
+            (45, None, 35 * 60, 1),
+            (50, "on", 30 * 60, 2),
+            (100, None, 50 * 60, 1),
+            (150, None, 60 * 60, 1),
+        ):
+            now = start_time + timedelta(minutes=minutes)
+            with freeze_time(now):
+                if state:
+                    hass.states.async_set("binary_sensor.test_id", state)
+                async_fire_time_changed(hass, now)
+                await hass.async_block_till_done()
+            assert hass.states.get("sensor.sensor1").state == str(
+                round(seconds_matched / 3600, 2)
+            )
+            assert hass.states.get("sensor.sensor2").state == str(match_count)
+
+    # The history was only loaded when the sensors were set up
+    assert fake_states.call_count == 2
+
+
 async def test_measure_from_end_going_backwards(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1934,3 +1934,135 @@ async def test_template_variable(hass: HomeAssistant, calls, multiplier) -> None
         assert len(calls) == 1
     else:
         assert len(calls) == 0
+
+
+async def test_thresholds_shared_by_triggers(hass: HomeAssistant, calls) -> None:
+    """Test many triggers on one entity only fire when crossing into range."""
+    hass.states.async_set("test.entity", 0)
+    ranges = [(None, 10), (5, None), (5, 15), (20, None), (None, -5)]
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        **({} if above is None else {"above": above}),
+                        **({} if below is None else {"below": below}),
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data": {"range": idx},
+                    },
+                }
+                for idx, (above, below) in enumerate(ranges)
+            ]
+        },
+    )
+
+    async def fired_after(value) -> list[int]:
+        calls.clear()
+        hass.states.async_set("test.entity", value)
+        await hass.async_block_till_done()
+        return sorted(call.data["range"] for call in calls)
+
+    assert list(hass.data[numeric_state_trigger.DATA_THRESHOLD_INDEXES]) == [
+        ("test.entity", None)
+    ]
+
+    # The entity started in range of the first trigger, so it is not armed
+    assert await fired_after(7) == [1, 2]
+    assert await fired_after(8) == []
+    assert await fired_after(25) == [3]
+    assert await fired_after(-10) == [0, 4]
+    assert await fired_after("unknown") == []
+    assert await fired_after(-10) == [0, 4]
+    assert await fired_after("not a number") == []
+    assert await fired_after(12) == [1, 2]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert not hass.data[numeric_state_trigger.DATA_THRESHOLD_INDEXES]
+    assert await fired_after(0) == []
+
+
+async def _async_attach_late_triggers(
+    hass: HomeAssistant, fired: list[str], **threshold
+) -> list:
+    """Attach an indexed and a per trigger matched numeric_state trigger."""
+    unsubs = []
+    for name, extra in (
+        ("index", {}),
+        ("listener", {"value_template": "{{ state.state }}"}),
+    ):
+        config = await numeric_state_trigger.async_validate_trigger_config(
+            hass,
+            {
+                "platform": "numeric_state",
+                "entity_id": "test.entity",
+                **threshold,
+                **extra,
+            },
+        )
+
+        async def action(run_variables, context=None, name=name):
+            fired.append(name)
+
+        unsubs.append(
+            await numeric_state_trigger.async_attach_trigger(
+                hass,
+                config,
+                action,
+                {"trigger_data": {}, "variables": {}, "name": name},
+            )
+        )
+    return unsubs
+
+
+async def test_threshold_added_after_invalid_state(hass: HomeAssistant) -> None:
+    """Test a threshold added after an invalid state is armed by the next number."""
+    fired: list[str] = []
+    hass.states.async_set("test.entity", 5)
+    unsubs = await _async_attach_late_triggers(hass, fired, below=0)
+    for value in (4, "abc"):
+        hass.states.async_set("test.entity", value)
+        await hass.async_block_till_done()
+
+    unsubs += await _async_attach_late_triggers(hass, fired, above=10)
+    for value in (3, 15):
+        hass.states.async_set("test.entity", value)
+        await hass.async_block_till_done()
+
+    assert sorted(fired) == ["index", "listener"]
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_nan_matches_every_threshold(hass: HomeAssistant) -> None:
+    """Test NaN is in every range, like for the numeric_state condition."""
+    fired: list[str] = []
+    hass.states.async_set("test.entity", 5)
+    unsubs = await _async_attach_late_triggers(hass, fired, above=10)
+    unsubs += await _async_attach_late_triggers(hass, fired, below=0)
+
+    hass.states.async_set("test.entity", "nan")
+    await hass.async_block_till_done()
+    assert sorted(fired) == ["index", "index", "listener", "listener"]
+
+    # Only the thresholds the next number is outside of are armed again
+    fired.clear()
+    hass.states.async_set("test.entity", 15)
+    await hass.async_block_till_done()
+    assert fired == []
+    hass.states.async_set("test.entity", -5)
+    await hass.async_block_till_done()
+    assert sorted(fired) == ["index", "listener"]
+
+    for unsub in unsubs:
+        unsub()
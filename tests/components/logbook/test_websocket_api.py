@@ -11,6 +11,7 @@ from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.helpers import LogbookStreamTap
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -426,6 +427,110 @@ async def test_get_events_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_get_events_paginated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events with pagination."""
+    now = dt_util.utcnow() - timedelta(minutes=1)
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    # Entries with the same time fired must not be sent twice or skipped
+    with freeze_time(now + timedelta(seconds=1)):
+        for light_state in (STATE_ON, STATE_OFF, STATE_ON):
+            hass.states.async_set("light.kitchen", light_state)
+            hass.states.async_set("light.living_room", light_state)
+        await hass.async_block_till_done()
+    context = core.Context(
+        id="01GTDGKBCH00GW0X276W5TEDDD",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        core.EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", "service": "turn_off"},
+        context=context,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 6
+    assert all_events[-1]["context_service"] == "turn_off"
+
+    msg_id = 2
+    for page_size in (1, 4, 6, 100):
+        events = []
+        continuation = None
+        pages = 0
+        while True:
+            request = {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "page_size": page_size,
+            }
+            if continuation:
+                request["continuation"] = continuation
+            await client.send_json(request)
+            response = await client.receive_json()
+            msg_id += 1
+            assert response["success"]
+            pages += 1
+            page = response["result"]
+            assert len(page["events"]) <= page_size
+            events.extend(page["events"])
+            if not (continuation := page["continuation"]):
+                break
+        assert events == all_events
+        assert pages == -(-len(all_events) // page_size)
+
+    # Only the most recent contexts are kept
+    with patch("homeassistant.components.logbook.processor.CONTEXT_WINDOW_SIZE", 2):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "page_size": 100,
+            }
+        )
+        response = await client.receive_json()
+        msg_id += 1
+    assert response["success"]
+    assert response["result"] == {"events": all_events, "continuation": None}
+
+    await client.send_json(
+        {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "page_size": 2,
+            "continuation": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_continuation"
+
+
 async def test_get_events_invalid_filters(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2963,3 +3068,40 @@ async def test_subscribe_all_entities_are_continuous_with_device(
     assert listeners_without_writes(
         hass.bus.async_listeners()
     ) == listeners_without_writes(init_listeners)
+
+
+async def test_logbook_stream_tap_converts_state_changes_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test the stream tap filters and converts each state change once."""
+    tap = LogbookStreamTap(hass)
+    init_listeners = hass.bus.async_listeners()
+    by_entity: list = []
+    firehose: list = []
+    filtered_firehose: list = []
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+
+    unsubs = [
+        tap.async_subscribe(by_entity.append, None, ["light.kitchen"]),
+        tap.async_subscribe(firehose.append, None, None),
+        tap.async_subscribe(
+            filtered_firehose.append, lambda entity_id: entity_id != "light.kitchen", []
+        ),
+    ]
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("sensor.power", "2", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+
+    assert len(by_entity) == 1
+    assert by_entity[0].entity_id == "light.kitchen"
+    assert by_entity[0].state == "on"
+    assert firehose == by_entity
+    assert firehose[0] is by_entity[0]
+    assert filtered_firehose == []
+
+    for unsub in unsubs:
+        unsub()
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
@@ -0,0 +1,10 @@
+"""Fixtures for the recorder component tests."""
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def recorder_storage(hass_storage: dict[str, Any]) -> dict[str, Any]:
+    """Mock storage so tests with their own instance do not save the id cache."""
+    return hass_storage
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
 import threading
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -2465,3 +2465,65 @@ async def test_events_are_recorded_until_final_write(
     await hass.async_block_till_done()
 
     assert not instance.engine
+
+
+async def test_table_managers_warm_start(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the table manager caches are saved at shutdown and primed at startup."""
+    instance = recorder_mock
+    hass.states.async_set("sensor.one", "1", {"one": 1})
+    hass.states.async_set("sensor.two", "2", {"two": 2})
+    hass.states.async_set("sensor.one", "1", {"one": 2})
+    hass.bus.async_fire("custom_event")
+    await async_wait_recording_done(hass)
+
+    cached_ids = {
+        "state_attributes": instance.state_attributes_manager.get_cached_ids(),
+        "states_meta": instance.states_meta_manager.get_cached_ids(),
+        "event_types": instance.event_type_manager.get_cached_ids(),
+    }
+    assert len(cached_ids["state_attributes"]) == 3
+    sensor_one_metadata_id = instance.states_meta_manager.get_from_cache("sensor.one")
+    sensor_one_attributes_id = instance.state_attributes_manager.get_from_cache(
+        '{"one":2}'
+    )
+
+    def _warm_start(
+        warm_start_ids: dict[str, list[int]] | None, entity_ids: list[str]
+    ) -> None:
+        instance.state_attributes_manager.reset()
+        instance.states_meta_manager.reset()
+        instance.event_type_manager.reset()
+        instance._warm_start_ids = warm_start_ids
+        instance._warm_start_entity_ids = entity_ids
+        with session_scope(hass=hass, read_only=True) as session:
+            instance._warm_start_table_managers(session)
+
+    # Entities with a restored state are prefetched
+    await instance.async_add_executor_job(_warm_start, None, ["sensor.one"])
+    assert instance.states_meta_manager.get_cached_ids() == [sensor_one_metadata_id]
+    assert instance.state_attributes_manager.get_cached_ids() == [
+        sensor_one_attributes_id
+    ]
+    assert instance.event_type_manager.get_cached_ids() == []
+
+    # Ids that are no longer in the database are skipped
+    await instance.async_add_executor_job(
+        _warm_start,
+        {key: [*ids, 99999] for key, ids in cached_ids.items()},
+        [],
+    )
+    assert instance.state_attributes_manager.get_cached_ids() == (
+        cached_ids["state_attributes"]
+    )
+    assert instance.states_meta_manager.get_cached_ids() == cached_ids["states_meta"]
+    assert instance.event_type_manager.get_cached_ids() == cached_ids["event_types"]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    id_cache = hass_storage["recorder.id_cache"]["data"]
+    assert id_cache["state_attributes"] == cached_ids["state_attributes"]
+    assert id_cache["states_meta"] == cached_ids["states_meta"]
+    # The final write event type was recorded after the ids were cached
+    assert id_cache["event_types"][:-1] == cached_ids["event_types"]
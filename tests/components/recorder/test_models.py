@@ -20,6 +20,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
     ulid_to_bytes_or_none,
 )
+from homeassistant.components.recorder.models.state_attributes import AttributesCache
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
@@ -271,7 +272,10 @@ async def test_lazy_state_handles_include_json(
         entity_id="sensor.invalid",
         shared_attrs="{INVALID_JSON}",
     )
-    assert LazyState(row, {}, None, row.entity_id, "", 1, False).attributes == {}
+    assert (
+        LazyState(row, AttributesCache(), None, row.entity_id, "", 1, False).attributes
+        == {}
+    )
     assert "Error converting row to state attributes" in caplog.text
 
 
@@ -283,9 +287,62 @@ async def test_lazy_state_can_decode_attributes(
         entity_id="sensor.invalid",
         attributes='{"shared":true}',
     )
-    assert LazyState(row, {}, None, row.entity_id, "", 1, False).attributes == {
-        "shared": True
+    assert LazyState(
+        row, AttributesCache(), None, row.entity_id, "", 1, False
+    ).attributes == {"shared": True}
+
+
+async def test_lazy_state_decodes_single_attributes() -> None:
+    """Test that the LazyState only decodes attributes containing the key."""
+    attr_cache = AttributesCache()
+    row = PropertyMock(
+        entity_id="sensor.power",
+        attributes='{"unit_of_measurement":"W","friendly_name":"Power"}',
+    )
+    state = LazyState(row, attr_cache, None, row.entity_id, "", 1, False)
+    assert state.attribute("last_reset") is None
+    assert state.attribute("last_reset", "missing") == "missing"
+    assert attr_cache == {}
+
+    assert state.attribute("unit_of_measurement") == "W"
+    assert attr_cache == {
+        row.attributes: {"unit_of_measurement": "W", "friendly_name": "Power"}
     }
+    assert state.attribute("friendly_name") == "Power"
+
+    state.attributes = {"unit_of_measurement": "kW"}
+    assert state.attribute("unit_of_measurement") == "kW"
+
+    row = PropertyMock(entity_id="sensor.power", attributes=None)
+    state = LazyState(row, attr_cache, None, row.entity_id, "", 1, False)
+    assert state.attribute("unit_of_measurement") is None
+
+
+class _ScanCountingSource(str):
+    """A row source counting how often it is scanned."""
+
+    scans = 0
+
+    def __contains__(self, key: object) -> bool:
+        """Count the scan."""
+        _ScanCountingSource.scans += 1
+        return super().__contains__(key)
+
+
+async def test_lazy_state_caches_missing_attributes() -> None:
+    """Test that the LazyState only scans a source once for a missing key."""
+    attr_cache = AttributesCache()
+    source = '{"unit_of_measurement":"W"}'
+    for _ in range(3):
+        row = PropertyMock(
+            entity_id="sensor.power", attributes=_ScanCountingSource(source)
+        )
+        state = LazyState(row, attr_cache, None, row.entity_id, "", 1, False)
+        assert state.attribute("last_reset") is None
+
+    assert _ScanCountingSource.scans == 1
+    assert attr_cache.missing_keys == {source: {"last_reset"}}
+    assert not attr_cache
 
 
 async def test_lazy_state_handles_different_last_updated_and_last_changed(
@@ -301,7 +358,13 @@ async def test_lazy_state_handles_different_last_updated_and_last_changed(
         last_changed_ts=(now - timedelta(seconds=60)).timestamp(),
     )
     lstate = LazyState(
-        row, {}, None, row.entity_id, row.state, row.last_updated_ts, False
+        row,
+        AttributesCache(),
+        None,
+        row.entity_id,
+        row.state,
+        row.last_updated_ts,
+        False,
     )
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
@@ -334,7 +397,13 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(
         last_changed_ts=now.timestamp(),
     )
     lstate = LazyState(
-        row, {}, None, row.entity_id, row.state, row.last_updated_ts, False
+        row,
+        AttributesCache(),
+        None,
+        row.entity_id,
+        row.state,
+        row.last_updated_ts,
+        False,
     )
     assert lstate.as_dict() == {
         "attributes": {"shared": True},
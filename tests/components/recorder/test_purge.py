@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -1971,3 +1972,235 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_states_by_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test old states are purged by state_id range."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    def _insert_states():
+        with session_scope(hass=hass) as session:
+            old_attributes = StateAttributes(shared_attrs="{}", hash=1)
+            new_attributes = StateAttributes(shared_attrs='{"new":1}', hash=2)
+            session.add_all((old_attributes, new_attributes))
+            session.flush()
+            states = [
+                States(
+                    state="old",
+                    last_updated_ts=dt_util.utc_to_timestamp(eleven_days_ago),
+                    attributes_id=old_attributes.attributes_id,
+                )
+                for _ in range(30)
+            ]
+            states.extend(
+                States(
+                    state="new",
+                    last_updated_ts=dt_util.utc_to_timestamp(utcnow),
+                    attributes_id=new_attributes.attributes_id,
+                )
+                for _ in range(10)
+            )
+            # The clock went backwards
+            states.append(
+                States(
+                    state="old",
+                    last_updated_ts=dt_util.utc_to_timestamp(eleven_days_ago),
+                )
+            )
+            session.add_all(states)
+            session.flush()
+            states[30].old_state_id = states[29].state_id
+
+    await instance.async_add_executor_job(_insert_states)
+
+    with patch.object(instance, "max_bind_vars", 10), patch.object(
+        instance.database_engine, "max_bind_vars", 10
+    ), session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        assert states.count() == 41
+        assert state_attributes.count() == 2
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+        assert states.count() == 31
+        assert state_attributes.count() == 2
+
+        for _ in range(2):
+            finished = purge_old_data(
+                instance,
+                purge_before,
+                states_batch_size=1,
+                events_batch_size=1,
+                repack=False,
+            )
+            assert not finished
+        assert states.count() == 11
+        assert state_attributes.count() == 1
+
+        # The state left behind by the clock going backwards
+        # is purged by selecting its state_id
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+        assert states.count() == 10
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert finished
+        assert {state.state for state in states} == {"new"}
+        assert {state.old_state_id for state in states} == {None}
+
+
+async def test_purge_events_by_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test old events are purged by event_id range."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    def _insert_events():
+        with session_scope(hass=hass) as session:
+            old_data = EventData(shared_data="{}", hash=1)
+            new_data = EventData(shared_data='{"new":1}', hash=2)
+            session.add_all((old_data, new_data))
+            session.flush()
+            session.add_all(
+                Events(
+                    time_fired_ts=dt_util.utc_to_timestamp(eleven_days_ago),
+                    data_id=old_data.data_id,
+                )
+                for _ in range(20)
+            )
+            session.add_all(
+                Events(
+                    time_fired_ts=dt_util.utc_to_timestamp(utcnow),
+                    data_id=new_data.data_id,
+                )
+                for _ in range(5)
+            )
+
+    await instance.async_add_executor_job(_insert_events)
+
+    with patch.object(instance, "max_bind_vars", 10), patch.object(
+        instance.database_engine, "max_bind_vars", 10
+    ), session_scope(hass=hass) as session:
+        events = session.query(Events)
+        event_data = session.query(EventData).filter(EventData.hash.in_((1, 2)))
+        events_count = events.count()
+        assert event_data.count() == 2
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+        assert events.count() == events_count - 10
+
+        while not finished:
+            finished = purge_old_data(
+                instance,
+                purge_before,
+                states_batch_size=1,
+                events_batch_size=1,
+                repack=False,
+            )
+        assert events.count() == events_count - 20
+        assert event_data.count() == 1
+
+
+async def test_purge_states_by_range_keeps_newer_states_in_range(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a range purge keeps links to and caches of newer states in the range."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+    one_day_ago = utcnow - timedelta(days=1)
+
+    def _insert_states():
+        with session_scope(hass=hass) as session:
+            states = [
+                States(
+                    state="old",
+                    last_updated_ts=dt_util.utc_to_timestamp(eleven_days_ago),
+                )
+                for _ in range(10)
+            ]
+            # The clock went forwards and back again
+            states[5] = States(
+                state="new", last_updated_ts=dt_util.utc_to_timestamp(utcnow)
+            )
+            states.extend(
+                States(
+                    state="new",
+                    last_updated_ts=dt_util.utc_to_timestamp(one_day_ago),
+                )
+                for _ in range(5)
+            )
+            session.add_all(states)
+            session.flush()
+            states[10].old_state_id = states[5].state_id
+            states[11].old_state_id = states[4].state_id
+            return [state.state_id for state in states]
+
+    state_ids = await instance.async_add_executor_job(_insert_states)
+    states_manager = instance.states_manager
+    states_manager._last_committed_id["sensor.kept"] = state_ids[5]
+    states_manager._last_committed_id["sensor.purged"] = state_ids[4]
+
+    with patch.object(instance, "max_bind_vars", 10), patch.object(
+        instance.database_engine, "max_bind_vars", 10
+    ), session_scope(hass=hass) as session:
+        states = session.query(States).filter(States.state_id.in_(state_ids))
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+        assert states.count() == 6
+        old_state_ids = {state.state_id: state.old_state_id for state in states}
+        assert old_state_ids[state_ids[10]] == state_ids[5]
+        assert old_state_ids[state_ids[11]] is None
+
+    assert states_manager._last_committed_id["sensor.kept"] == state_ids[5]
+    assert "sensor.purged" not in states_manager._last_committed_id
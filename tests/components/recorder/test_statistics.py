@@ -8,7 +8,12 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -30,6 +35,10 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import (
+    AdjustStatisticsTask,
+    StatisticsRollupTask,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant, callback
@@ -1743,6 +1752,297 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-11-05 00:00:00+00:00")
+def test_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+    timezone,
+) -> None:
+    """Test days and months read from the rollups match the hourly statistics."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_time_zone == timezone
+
+    # Europe/Vienna leaves daylight saving time on 2022-10-30
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-30 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour,
+            "min": hour - 1,
+            "max": hour + 1,
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(0, 96, 4)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    def assert_rollups_match_hourly_statistics(time_zone: str) -> None:
+        for period in ("day", "month"):
+            stats = statistics_during_period(hass, start, period=period)
+            # Reduce the hourly statistics instead of reading the rollups
+            instance.statistics_rollups_time_zone = None
+            expected = statistics_during_period(hass, start, period=period)
+            instance.statistics_rollups_time_zone = time_zone
+            assert stats == expected
+
+    assert_rollups_match_hourly_statistics(timezone)
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 4
+        assert session.query(StatisticsMonthly).count() == 2
+
+    # Adjusting the sum adjusts the rollups
+    instance.queue_task(
+        AdjustStatisticsTask(
+            "test:total_energy_import", start + timedelta(hours=30), 100, "kWh"
+        )
+    )
+    wait_recording_done(hass)
+    assert statistics_during_period(hass, start, period="month")[
+        "test:total_energy_import"
+    ][-1]["sum"] == pytest.approx(92 * 2 + 100)
+    assert_rollups_match_hourly_statistics(timezone)
+
+    # The rollups are not used until they are rebuilt for the new time zone
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Asia/Tokyo"))
+    stats = statistics_during_period(hass, start, period="day")
+    assert len(stats["test:total_energy_import"]) == 5
+    instance.queue_task(StatisticsRollupTask())
+    wait_recording_done(hass)
+    # The rollups are rebuilt one month at a time
+    assert instance.statistics_rollups_time_zone is None
+    assert instance.statistics_rollups_rebuild == (
+        "Asia/Tokyo",
+        dt_util.parse_datetime("2022-11-01 00:00:00+09:00").timestamp(),
+    )
+    wait_recording_done(hass)
+    assert instance.statistics_rollups_rebuild is None
+    assert instance.statistics_rollups_time_zone == "Asia/Tokyo"
+    assert statistics_during_period(hass, start, period="day") == stats
+    assert_rollups_match_hourly_statistics("Asia/Tokyo")
+
+    with session_scope(hass=hass) as session:
+        assert not statistics._statistics_rollups_need_rebuild(session)
+        session.query(StatisticsMonthly).delete()
+        assert statistics._statistics_rollups_need_rebuild(session)
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.freeze_time("2022-11-05 00:00:00+00:00")
+def test_compile_hourly_statistics_adds_hour_to_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test compiling an hour updates the rollups without reading other hours."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    # The hours cross the end of a day and a month
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-31 20:00:00"))
+    hours = [start + timedelta(hours=hour) for hour in range(8)]
+    with session_scope(hass=hass) as session:
+        metas = [
+            StatisticsMeta.from_meta(
+                {
+                    "has_mean": True,
+                    "has_sum": has_sum,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": f"sensor.test{idx}",
+                    "unit_of_measurement": "kWh",
+                }
+            )
+            for idx, has_sum in enumerate((True, False))
+        ]
+        session.add_all(metas)
+        session.flush()
+        metadata_ids = [meta.id for meta in metas]
+        for idx, hour_start in enumerate(hours):
+            for minute in (0, 55):
+                value = idx * 1.3 + minute / 10
+                for meta in metas:
+                    session.add(
+                        StatisticsShortTerm.from_stats(
+                            meta.id,
+                            {
+                                "start": hour_start + timedelta(minutes=minute),
+                                "mean": value,
+                                "min": value - 1 - idx % 3,
+                                "max": value + 1 + idx % 2,
+                                "state": value,
+                                "sum": value * 3 if meta.has_sum else None,
+                            },
+                        )
+                    )
+
+    def rollup_rows() -> list[tuple]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (
+                    row.metadata_id,
+                    row.start_ts,
+                    pytest.approx(row.mean),
+                    row.min,
+                    row.max,
+                    row.state,
+                    row.sum,
+                    row.mean_count,
+                )
+                for table in (StatisticsDaily, StatisticsMonthly)
+                for row in session.query(table).order_by(
+                    table.metadata_id, table.start_ts
+                )
+            ]
+
+    with patch.object(
+        statistics,
+        "_compile_statistics_rollup",
+        wraps=statistics._compile_statistics_rollup,
+    ) as compile_rollup:
+        for hour_start in hours:
+            with session_scope(hass=hass) as session:
+                statistics._compile_hourly_statistics(session, hour_start)
+    compile_rollup.assert_not_called()
+    incremental = rollup_rows()
+    assert len(incremental) == 8
+
+    # Compile the rollups from all hours of their periods
+    with session_scope(hass=hass) as session:
+        statistics._update_statistics_rollups(
+            session, metadata_ids, (hour.timestamp() for hour in hours)
+        )
+    assert incremental == rollup_rows()
+
+
+@pytest.mark.freeze_time("2022-11-05 00:00:00+00:00")
+def test_reduce_statistics_with_unit_conversion(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test reducing before converting matches converting each hourly row."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-30 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour * 1.5 - 20,
+            "min": hour * 1.5 - 25,
+            "max": hour * 1.5 - 15,
+            "last_reset": None,
+            "state": hour - 10,
+            "sum": hour * 2 - 30,
+        }
+        for hour in range(0, 72, 5)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Outside temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    units = {"temperature": "°F"}
+    types = {"mean", "min", "max", "state", "sum"}
+    hourly = statistics_during_period(
+        hass, start, period="hour", units=units, types=types
+    )["test:temperature"]
+    expected = []
+    for day in range(3):
+        day_start = (start + timedelta(days=day)).timestamp()
+        day_end = (start + timedelta(days=day + 1)).timestamp()
+        rows = [row for row in hourly if day_start <= row["start"] < day_end]
+        expected.append(
+            {
+                "start": day_start,
+                "end": day_end,
+                "mean": pytest.approx(sum(row["mean"] for row in rows) / len(rows)),
+                "min": pytest.approx(min(row["min"] for row in rows)),
+                "max": pytest.approx(max(row["max"] for row in rows)),
+                "state": pytest.approx(rows[-1]["state"]),
+                "sum": pytest.approx(rows[-1]["sum"]),
+            }
+        )
+
+    # Reduce the hourly statistics instead of reading the rollups
+    instance.statistics_rollups_time_zone = None
+    daily = statistics_during_period(
+        hass, start, period="day", units=units, types=types
+    )["test:temperature"]
+    assert daily == expected
+
+
+@pytest.mark.freeze_time("2022-11-05 00:00:00+00:00")
+def test_change_with_other_types_and_unit_conversion(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test change is computed from the converted sums next to other types."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-30 00:00:00"))
+    sums = [10.0, 12.0, None, 15.0, 15.5]
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour * 1.5,
+            "last_reset": None,
+            "state": hour,
+            "sum": _sum,
+        }
+        for hour, _sum in enumerate(sums)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total energy",
+        "source": "test",
+        "statistic_id": "test:total_energy",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    stats = statistics_during_period(
+        hass,
+        start + timedelta(hours=1),
+        period="hour",
+        units={"energy": "Wh"},
+        types={"change", "mean", "state"},
+    )
+    assert stats == {
+        "test:total_energy": [
+            {
+                "start": (start + timedelta(hours=hour)).timestamp(),
+                "end": (start + timedelta(hours=hour + 1)).timestamp(),
+                "mean": hour * 1.5 * 1000,
+                "state": hour * 1000,
+                "change": change,
+            }
+            for hour, change in ((1, 2000.0), (2, None), (3, 3000.0), (4, 500.0))
+        ]
+    }
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
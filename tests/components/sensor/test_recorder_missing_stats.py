@@ -1,6 +1,7 @@
 """The tests for sensor recorder platform can catch up."""
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -38,7 +39,10 @@ def disable_db_issue_creation():
 
 @pytest.mark.timeout(25)
 def test_compile_missing_statistics(
-    freezer: FrozenDateTimeFactory, recorder_db_url: str, tmp_path: Path
+    freezer: FrozenDateTimeFactory,
+    recorder_db_url: str,
+    tmp_path: Path,
+    hass_storage: dict[str, Any],
 ) -> None:
     """Test compile missing statistics."""
     if recorder_db_url == "sqlite://":
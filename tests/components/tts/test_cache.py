@@ -0,0 +1,61 @@
+"""Test the TTS memory cache."""
+from homeassistant.components.tts.cache import MemoryCache, TTSCache
+
+
+def _entry(filename: str, size: int) -> TTSCache:
+    """Return a cache entry with speech of a size."""
+    return {"filename": filename, "voice": b"x" * size, "pending": None}
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used entries are evicted over the budget."""
+    cache = MemoryCache(10)
+    cache.set("a", _entry("a.mp3", 4))
+    cache.set("b", _entry("b.mp3", 4))
+    assert cache.get("a") is not None
+
+    cache.set("c", _entry("c.mp3", 4))
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size == 8
+
+    assert cache.get("b") is None
+    assert cache.statistics() == {
+        "entries": 2,
+        "size": 8,
+        "max_size": 10,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+def test_entry_exceeding_budget() -> None:
+    """Test an entry exceeding the budget is kept until the next one."""
+    cache = MemoryCache(10)
+    cache.set("a", _entry("a.mp3", 4))
+    cache.set("b", _entry("b.mp3", 20))
+    assert len(cache) == 1
+    assert cache.peek("b") is not None
+
+    cache.set("c", _entry("c.mp3", 4))
+    assert len(cache) == 1
+    assert cache.size == 4
+
+
+def test_replace_and_clear() -> None:
+    """Test replacing an entry updates the size."""
+    cache = MemoryCache(10)
+    cache.set("a", _entry("a.mp3", 4))
+    cache.set("a", _entry("a.mp3", 6))
+    assert cache.size == 6
+
+    assert cache.pop("a") is not None
+    assert cache.pop("a") is None
+    assert cache.size == 0
+
+    cache.set("a", _entry("a.mp3", 4))
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
@@ -1227,6 +1227,29 @@ async def test_load_cache_retrieve_without_mem_cache(
     req = await client.get(url)
     assert req.status == HTTPStatus.OK
     assert await req.read() == tts_data
+    # The file is streamed from disk without loading it into memory
+    assert len(hass.data[tts.DATA_TTS_MANAGER].mem_cache) == 0
+
+
+async def test_concurrent_generation_shared(
+    hass: HomeAssistant, mock_tts_entity: MockTTSEntity
+) -> None:
+    """Test concurrent requests for the same speech share the generation."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch.object(
+        mock_tts_entity, "get_tts_audio", return_value=("mp3", b"speech")
+    ) as mock_get_tts_audio:
+        results = await asyncio.gather(
+            *(
+                manager.async_get_tts_audio("tts.test", "There is someone at the door.")
+                for _ in range(3)
+            )
+        )
+
+    assert results == [("mp3", b"speech")] * 3
+    assert len(mock_get_tts_audio.mock_calls) == 1
 
 
 @pytest.mark.parametrize(
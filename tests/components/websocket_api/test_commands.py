@@ -559,6 +559,77 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_serialized_in_executor(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test large get_states and subscribe_entities snapshots are shared."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bye", "universe")
+    states = hass.states.async_all()
+
+    with patch(
+        "homeassistant.components.websocket_api.snapshots.SERIALIZE_EXECUTOR_ITEMS", 1
+    ):
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+        await websocket_client.send_json({"id": 6, "type": "get_states"})
+        await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+        for msg_id in (5, 6):
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == msg_id
+            assert msg["success"]
+            assert msg["result"] == [state.as_dict() for state in states]
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == const.TYPE_RESULT
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"]["a"] == {
+            "greeting.hello": {"s": "world", "a": {}, "c": ANY, "lc": ANY},
+            "greeting.bye": {"s": "universe", "a": {}, "c": ANY, "lc": ANY},
+        }
+
+        snapshots = hass.data[const.DATA_STATES_SNAPSHOT]
+        payload = snapshots.async_get(hass.states.async_all())
+        assert isinstance(payload, asyncio.Future)
+        assert snapshots.async_get(hass.states.async_all()) is payload
+
+        hass.states.async_set("greeting.bye", "moon")
+        assert snapshots.async_get(hass.states.async_all()) is not payload
+
+
+async def test_get_states_serialization_error_in_executor(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a snapshot failing to serialize in the executor sends an error."""
+    hass.states.async_set("greeting.hello", "world")
+    failed_serialization = hass.loop.create_future()
+    failed_serialization.set_exception(
+        RuntimeError("cannot schedule new futures after shutdown")
+    )
+
+    with patch(
+        "homeassistant.components.websocket_api.snapshots.SERIALIZE_EXECUTOR_ITEMS", 1
+    ), patch.object(hass, "async_add_executor_job", return_value=failed_serialization):
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
+    assert "Error serializing snapshot" in caplog.text
+
+    # The connection keeps working
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -940,12 +1011,6 @@ async def test_subscribe_unsubscribe_entities(
     }
     hass.states.async_set("light.not_permitted", "on")
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
-    hass.states.async_set("light.permitted", "on", {"effect": "help"})
-    hass.states.async_set(
-        "light.permitted", "on", {"effect": "help", "color": ["blue", "green"]}
-    )
-    hass.states.async_remove("light.permitted")
-    hass.states.async_set("light.permitted", "on", {"effect": "help", "color": "blue"})
 
     msg = await websocket_client.receive_json()
     assert msg["id"] == 7
@@ -979,6 +1044,12 @@ async def test_subscribe_unsubscribe_entities(
         "state": "on",
     }
 
+    # Changes made in the same loop iteration are merged into one message
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    hass.states.async_set(
+        "light.permitted", "on", {"effect": "help", "color": ["blue", "green"]}
+    )
+
     msg = await websocket_client.receive_json()
     assert msg["id"] == 7
     assert msg["type"] == "event"
@@ -986,11 +1057,10 @@ async def test_subscribe_unsubscribe_entities(
         "c": {
             "light.permitted": {
                 "+": {
-                    "a": {"effect": "help"},
+                    "a": {"effect": "help", "color": ["blue", "green"]},
                     "c": ANY,
                     "lu": ANY,
                 },
-                "-": {"a": ["color"]},
             }
         }
     }
@@ -1000,7 +1070,7 @@ async def test_subscribe_unsubscribe_entities(
     _apply_entities_changes(state_dict, change_set)
 
     assert state_dict == {
-        "attributes": {"effect": "help"},
+        "attributes": {"effect": "help", "color": ["blue", "green"]},
         "context": {
             "id": additions["c"],
             "parent_id": None,
@@ -1012,43 +1082,29 @@ async def test_subscribe_unsubscribe_entities(
         "state": "on",
     }
 
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+
     msg = await websocket_client.receive_json()
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
         "c": {
             "light.permitted": {
-                "+": {
-                    "a": {"color": ["blue", "green"]},
-                    "c": ANY,
-                    "lu": ANY,
-                }
+                "+": {"c": ANY, "lu": ANY},
+                "-": {"a": ["color"]},
             }
         }
     }
 
-    change_set = msg["event"]["c"]["light.permitted"]
-    additions = deepcopy(change_set["+"])
-    _apply_entities_changes(state_dict, change_set)
-
-    assert state_dict == {
-        "attributes": {"effect": "help", "color": ["blue", "green"]},
-        "context": {
-            "id": additions["c"],
-            "parent_id": None,
-            "user_id": None,
-        },
-        "entity_id": "light.permitted",
-        "last_changed": ANY,
-        "last_updated": additions["lu"],
-        "state": "on",
-    }
+    hass.states.async_remove("light.permitted")
 
     msg = await websocket_client.receive_json()
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {"r": ["light.permitted"]}
 
+    hass.states.async_set("light.permitted", "on", {"effect": "help", "color": "blue"})
+
     msg = await websocket_client.receive_json()
     assert msg["id"] == 7
     assert msg["type"] == "event"
@@ -1063,6 +1119,22 @@ async def test_subscribe_unsubscribe_entities(
         }
     }
 
+    # Removing and adding an entity in the same loop iteration is sent as a change
+    hass.states.async_remove("light.permitted")
+    hass.states.async_set("light.permitted", "off", {"effect": "help"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"c": ANY, "lc": ANY, "s": "off"},
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
 
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
@@ -2431,24 +2503,9 @@ async def test_message_coalescing(
     hass.states.async_set("light.permitted", "on", {"color": "green"})
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
+    # Changes made in the same loop iteration are merged into one message
     data = await websocket_client.receive_str()
-    msgs = json_loads(data)
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "yellow"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
+    msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
@@ -2485,23 +2542,22 @@ async def test_message_coalescing_not_supported_by_websocket_client(
     assert msg["type"] == "event"
     assert msg["event"] == {"a": {}}
 
+    # The entity was added and changed in the same loop iteration
     data = await websocket_client.receive_str()
     msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
         "a": {
-            "light.permitted": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "on"}
+            "light.permitted": {
+                "a": {"color": "blue"},
+                "c": ANY,
+                "lc": ANY,
+                "lu": ANY,
+                "s": "on",
+            }
         }
     }
-
-    data = await websocket_client.receive_str()
-    msg = json_loads(data)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "blue"}, "c": ANY, "lu": ANY}}}
-    }
     await websocket_client.close()
     await hass.async_block_till_done()
 
@@ -2550,24 +2606,9 @@ async def test_client_message_coalescing(
     hass.states.async_set("light.permitted", "on", {"color": "green"})
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
+    # Changes made in the same loop iteration are merged into one message
     data = await websocket_client.receive_str()
-    msgs = json_loads(data)
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "yellow"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
+    msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
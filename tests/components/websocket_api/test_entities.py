@@ -0,0 +1,169 @@
+"""Test the shared subscribe_entities hub."""
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.components.websocket_api.entities import (
+    async_get_entity_subscription_hub,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_loads
+
+from tests.common import MockUser
+
+
+class _Queue(list[str | dict[str, Any] | Callable[[], str]]):
+    """Message queue of a connection that is written when rendered."""
+
+    def render(self) -> list[Any]:
+        """Render and write the queued messages."""
+        rendered = [msg() if callable(msg) else msg for msg in self]
+        self.clear()
+        return [json_loads(msg) if isinstance(msg, str) else msg for msg in rendered]
+
+
+async def test_single_state_changed_listener(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test all subscriptions share one state_changed listener."""
+    hub = async_get_entity_subscription_hub(hass)
+    assert async_get_entity_subscription_hub(hass) is hub
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    unsubs = [
+        hub.async_subscribe([].append, hass_admin_user, 1, set()),
+        hub.async_subscribe([].append, hass_admin_user, 2, {"light.kitchen"}),
+        hub.async_subscribe([].append, hass_admin_user, 3, set()),
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
+async def test_changes_merged_per_loop_iteration(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test the changes of a loop iteration are sent as one message."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+    hub = async_get_entity_subscription_hub(hass)
+    all_queue = _Queue()
+    kitchen_queue = _Queue()
+    hub.async_subscribe(all_queue.append, hass_admin_user, 1, set())
+    hub.async_subscribe(kitchen_queue.append, hass_admin_user, 2, {"light.kitchen"})
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("light.new", "on")
+    hass.states.async_remove("light.hallway")
+    await hass.async_block_till_done()
+
+    all_messages = all_queue.render()
+    assert len(all_messages) == 1
+    msg = all_messages[0]
+    assert msg["id"] == 1
+    assert msg["type"] == "event"
+    assert msg["event"]["r"] == ["light.hallway"]
+    assert msg["event"]["a"]["light.new"]["s"] == "on"
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "on"
+    assert msg["event"]["c"]["light.kitchen"]["+"]["a"] == {"brightness": 100}
+
+    kitchen_messages = kitchen_queue.render()
+    assert len(kitchen_messages) == 1
+    msg = kitchen_messages[0]
+    assert msg["id"] == 2
+    assert list(msg["event"]) == ["c"]
+    assert list(msg["event"]["c"]) == ["light.kitchen"]
+
+    # Only the net change of the loop iteration is sent
+    hass.states.async_set("light.kitchen", "off", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+    kitchen_messages = kitchen_queue.render()
+    assert len(kitchen_messages) == 1
+    assert kitchen_messages[0]["event"]["c"]["light.kitchen"]["+"].keys() == {
+        "c",
+        "lc",
+    }
+
+
+async def test_changes_merged_while_queued(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test changes are merged into the queued message of a slow client."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+    hub = async_get_entity_subscription_hub(hass)
+    queue = _Queue()
+    hub.async_subscribe(queue.append, hass_admin_user, 1, set())
+
+    for brightness in range(10):
+        hass.states.async_set("light.kitchen", "on", {"brightness": brightness})
+        await hass.async_block_till_done()
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("light.new", "on")
+    await hass.async_block_till_done()
+    hass.states.async_remove("light.new")
+    await hass.async_block_till_done()
+
+    # The client only gets the latest state of each entity
+    assert len(queue) == 1
+    messages = queue.render()
+    assert len(messages) == 1
+    event = messages[0]["event"]
+    assert event["c"]["light.kitchen"]["+"]["s"] == "on"
+    assert event["c"]["light.kitchen"]["+"]["a"] == {"brightness": 9}
+    assert event["c"]["light.hallway"]["+"]["s"] == "on"
+    # An entity added and removed while queued was never seen by the client
+    assert "a" not in event
+    assert "r" not in event
+
+    # Once written, the next change is queued as a new message
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(queue) == 1
+    messages = queue.render()
+    assert messages[0]["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+
+
+async def test_permissions_checked_per_user(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test only entities the user can read are sent."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hub = async_get_entity_subscription_hub(hass)
+    queue = _Queue()
+    hub.async_subscribe(queue.append, hass_admin_user, 1, set())
+
+    hass.states.async_set("light.not_permitted", "on")
+    await hass.async_block_till_done()
+    assert queue == []
+
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_set("light.permitted", "on")
+    await hass.async_block_till_done()
+    messages = queue.render()
+    assert len(messages) == 1
+    assert list(messages[0]["event"]["a"]) == ["light.permitted"]
+
+
+async def test_subscribe_during_loop_iteration(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test a subscription only gets the changes made after it subscribed."""
+    hub = async_get_entity_subscription_hub(hass)
+    early_queue = _Queue()
+    late_queue = _Queue()
+    hub.async_subscribe(early_queue.append, hass_admin_user, 1, set())
+
+    hass.states.async_set("light.kitchen", "on")
+    hub.async_subscribe(late_queue.append, hass_admin_user, 2, set())
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    assert early_queue.render()[0]["event"]["a"]["light.kitchen"]["s"] == "off"
+    assert late_queue.render()[0]["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
@@ -3,6 +3,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -16,6 +17,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -431,6 +433,43 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_deflate(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test enabling deflate compressed messages."""
+    websocket_client = await hass_ws_client(hass)
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+
+    async def _receive() -> Any:
+        msg = await websocket_client.receive()
+        assert msg.type == WSMsgType.BINARY
+        return json_loads(decompressor.decompress(msg.data))
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_DEFLATE_MESSAGES: 1},
+        }
+    )
+    msg = await _receive()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    # Messages share one compression context
+    for id_ in (2, 3):
+        await websocket_client.send_json({"id": id_, "type": "ping"})
+        msg = await _receive()
+        assert msg == {"id": id_, "type": "pong"}
+
+    # Large messages are compressed in the executor
+    hass.states.async_set("light.kitchen", "on", {"data": "x" * 100000})
+    await websocket_client.send_json({"id": 4, "type": "get_states"})
+    msg = await _receive()
+    assert msg["id"] == 4
+    assert msg["result"][0]["attributes"]["data"] == "x" * 100000
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
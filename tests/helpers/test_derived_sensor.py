@@ -0,0 +1,57 @@
+"""Test the derived sensor graph."""
+import asyncio
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.derived_sensor import (
+    MAX_CASCADE_DEPTH,
+    async_track_derived_state_change_event,
+)
+
+
+async def test_chain_evaluated_in_one_callback(hass: HomeAssistant) -> None:
+    """Test a chain of derived sensors is evaluated before the loop continues."""
+    calls: list[tuple[str, str]] = []
+
+    @callback
+    def derive(source_entity_id: str, entity_id: str):
+        @callback
+        def _derive(event) -> None:
+            calls.append((entity_id, event.data["new_state"].state))
+            hass.states.async_set(entity_id, int(event.data["new_state"].state) * 2)
+
+        return async_track_derived_state_change_event(hass, source_entity_id, _derive)
+
+    unsub_first = derive("sensor.Power", "sensor.energy")
+    derive("sensor.energy", "sensor.meter")
+
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.unrelated", "1")
+    # The whole chain runs in the next loop iteration
+    await asyncio.sleep(0)
+    assert calls == [("sensor.energy", "1"), ("sensor.meter", "2")]
+    assert hass.states.get("sensor.meter").state == "4"
+
+    calls.clear()
+    unsub_first()
+    hass.states.async_set("sensor.power", "2")
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+async def test_cycle_does_not_block_the_loop(hass: HomeAssistant) -> None:
+    """Test derived sensors feeding each other continue in a new callback."""
+    calls = 0
+
+    @callback
+    def _increment(event) -> None:
+        nonlocal calls
+        calls += 1
+        hass.states.async_set("sensor.counter", int(event.data["new_state"].state) + 1)
+
+    unsub = async_track_derived_state_change_event(hass, "sensor.counter", _increment)
+    hass.states.async_set("sensor.counter", "0")
+    await hass.async_add_executor_job(lambda: None)
+    unsub()
+    await hass.async_block_till_done()
+
+    assert MAX_CASCADE_DEPTH <= calls < 100 * MAX_CASCADE_DEPTH
@@ -16,6 +16,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry as er,
     issue_registry as ir,
+    polling,
 )
 from homeassistant.helpers.entity import (
     DeviceInfo,
@@ -80,6 +81,31 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     assert entity_platform._async_unsub_polling is None
 
 
+async def test_polling_waits_for_poll_slot_without_lock(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test waiting for a poll slot does not count as a slow update."""
+    entity_platform = MockEntityPlatform(hass)
+    poll_ent = MockEntity(should_poll=True)
+    poll_ent.async_update = Mock()
+    await entity_platform.async_add_entities([poll_ent])
+    poll_ent.async_update.reset_mock()
+
+    scheduler = polling.async_get_poll_scheduler(hass)
+    scheduler._polls = asyncio.Semaphore(0)
+    first = hass.async_create_task(
+        entity_platform._update_entity_states(dt_util.utcnow())
+    )
+    await asyncio.sleep(0)
+    await entity_platform._update_entity_states(dt_util.utcnow())
+    assert "took longer than the scheduled update interval" not in caplog.text
+    assert not poll_ent.async_update.called
+
+    scheduler._polls.release()
+    await first
+    assert poll_ent.async_update.call_count == 1
+
+
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -17,9 +17,11 @@ from homeassistant.const import MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import event
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TIMER_WHEEL,
     EventStateChangedData,
     TrackStates,
     TrackTemplate,
@@ -2232,6 +2234,68 @@ async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_skips_unread_fields(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes to fields the template did not read do not re-render."""
+    hass.states.async_set("sensor.power", "5", {"unit_of_measurement": "W"})
+    specific_runs = []
+    domain_runs = []
+
+    @ha.callback
+    def specific_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    @ha.callback
+    def domain_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        domain_runs.append(updates.pop().result)
+
+    specific_template = Template("{{ states('sensor.power') }}", hass)
+    domain_template = Template(
+        "{{ states.sensor | selectattr('state', 'eq', '5') | list | count }}", hass
+    )
+    async_track_template_result(
+        hass, [TrackTemplate(specific_template, None)], specific_callback
+    )
+    async_track_template_result(
+        hass,
+        [TrackTemplate(domain_template, None, timedelta(seconds=0))],
+        domain_callback,
+    )
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        hass.states.async_set("sensor.power", "5", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 0
+
+        hass.states.async_set("sensor.power", "6", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 2
+
+        hass.states.async_set("sensor.other", "5")
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+
+        hass.states.async_set("sensor.other", "5", {"friendly_name": "Other"})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 3
+
+    assert specific_runs == [6]
+    assert domain_runs == [0, 1]
+
+
 async def test_track_template_result_errors(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -3567,14 +3631,15 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     """Test tracking time interval name.
 
     This test is to ensure that when a name is passed to async_track_time_interval,
-    that the name can be found in the TimerHandle when stringified.
+    that the name can be found in the TimerHandle when stringified, or in the
+    job dispatched by the timer wheel for whole second intervals.
     """
     specific_runs = []
     unique_string = "xZ13"
     unsub = async_track_time_interval(
         hass,
         callback(lambda x: specific_runs.append(x)),
-        timedelta(seconds=10),
+        timedelta(seconds=10.5),
         name=unique_string,
     )
     scheduled = getattr(hass.loop, "_scheduled")
@@ -3582,6 +3647,26 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     unsub()
 
     assert all(handle for handle in scheduled if unique_string not in str(handle))
+
+    unsub = async_track_time_interval(
+        hass,
+        callback(lambda x: specific_runs.append(x)),
+        timedelta(seconds=10),
+        name=unique_string,
+    )
+    wheel = hass.data[_TIMER_WHEEL]
+
+    def _wheel_job_names() -> list[str]:
+        return [
+            tracker.job.name
+            for bucket in wheel._buckets.values()
+            for tracker in bucket
+            if hasattr(tracker, "job")
+        ]
+
+    assert any(unique_string in name for name in _wheel_job_names())
+    unsub()
+    assert all(unique_string not in name for name in _wheel_job_names())
     await hass.async_block_till_done()
 
 
@@ -3851,6 +3936,122 @@ async def test_async_track_time_change(hass: HomeAssistant) -> None:
     assert len(none_runs) == 3
 
 
+async def test_timer_wheel_shares_loop_timer(hass: HomeAssistant) -> None:
+    """Test time pattern and interval trackers share a single loop timer."""
+    runs = []
+    now = dt_util.utcnow()
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    scheduled = getattr(hass.loop, "_scheduled")
+    handles_before = len([handle for handle in scheduled if not handle.cancelled()])
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsubs = [
+            async_track_utc_time_change(
+                hass, callback(lambda x, i=i: runs.append(i)), minute=0, second=0
+            )
+            for i in range(50)
+        ]
+    wheel = hass.data[_TIMER_WHEEL]
+    assert len(wheel.patterns) == 1
+    unsubs.extend(
+        async_track_time_interval(
+            hass,
+            callback(lambda x: runs.append("interval")),
+            timedelta(hours=1),
+            name="test_timer_wheel",
+        )
+        for _ in range(50)
+    )
+    handles = len([handle for handle in scheduled if not handle.cancelled()])
+    assert handles - handles_before <= 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert sorted(run for run in runs if run != "interval") == list(range(50))
+
+    for unsub in unsubs:
+        unsub()
+    assert not wheel.patterns
+    assert not any(
+        "test_timer_wheel" in tracker.job.name
+        for bucket in wheel._buckets.values()
+        for tracker in bucket
+        if isinstance(tracker, event._IntervalTracker)
+    )
+
+
+async def test_timer_wheel_isolates_failing_listeners(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing listener does not stop other trackers on the timer wheel."""
+    runs = []
+    now = dt_util.utcnow()
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    @callback
+    def _raise(now: datetime) -> None:
+        raise ValueError("boom")
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsubs = [
+            async_track_utc_time_change(hass, _raise, second=0),
+            async_track_utc_time_change(
+                hass, callback(lambda x: runs.append("pattern")), second=0
+            ),
+            async_track_utc_time_change(hass, _raise, minute=1, second=0),
+            async_track_utc_time_change(
+                hass, callback(lambda x: runs.append("other")), minute=1, second=0
+            ),
+        ]
+
+    for minute in range(2):
+        async_fire_time_changed(
+            hass,
+            datetime(now.year + 1, 5, 24, 12, minute, 0, 999999, tzinfo=dt_util.UTC),
+        )
+        await hass.async_block_till_done()
+    assert sorted(runs) == ["other", "pattern", "pattern"]
+    assert "boom" in caplog.text
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_timer_wheel_listener_removes_tracker_in_same_bucket(
+    hass: HomeAssistant,
+) -> None:
+    """Test a tracker removed by a listener due in the same bucket does not fire."""
+    runs = []
+    utc_now = dt_util.utcnow()
+
+    @callback
+    def _remove_other(now: datetime) -> None:
+        runs.append("a")
+        unsub_b()
+
+    unsub_a = async_track_time_interval(hass, _remove_other, timedelta(seconds=10))
+    unsub_b = async_track_time_interval(
+        hass, callback(lambda x: runs.append("b")), timedelta(seconds=10)
+    )
+
+    for seconds in (13, 25, 37):
+        async_fire_time_changed(hass, utc_now + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+    assert runs == ["a", "a", "a"]
+
+    unsub_a()
+
+
 async def test_periodic_task_minute(hass: HomeAssistant) -> None:
     """Test periodic tasks per minute."""
     specific_runs = []
@@ -0,0 +1,134 @@
+"""Test the poll scheduler."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import polling
+
+
+async def test_poll_statistics(hass: HomeAssistant) -> None:
+    """Test poll durations are recorded per integration."""
+    scheduler = polling.async_get_poll_scheduler(hass)
+    assert polling.async_get_poll_scheduler(hass) is scheduler
+
+    with patch("homeassistant.helpers.polling.monotonic", side_effect=[0, 0.3, 10, 50]):
+        async with scheduler.async_poll("test"):
+            pass
+        async with scheduler.async_poll("test") as poll:
+            poll.success = False
+
+    statistics = scheduler.async_statistics("test")
+    assert statistics["count"] == 2
+    assert statistics["failures"] == 1
+    assert statistics["max_time"] == 40
+    assert statistics["total_time"] == pytest.approx(40.3)
+    assert statistics["buckets"]["0.5"] == 1
+    assert statistics["buckets"]["60.0"] == 1
+    assert statistics["buckets"]["+Inf"] == 0
+
+
+async def test_poll_statistics_on_error(hass: HomeAssistant) -> None:
+    """Test a poll that raises is recorded."""
+    scheduler = polling.async_get_poll_scheduler(hass)
+
+    with pytest.raises(ValueError):
+        async with scheduler.async_poll("test"):
+            raise ValueError
+
+    assert scheduler.async_statistics("test")["count"] == 1
+    assert scheduler.async_statistics("other") is None
+
+
+async def test_poll_timeout(hass: HomeAssistant) -> None:
+    """Test a hung poll is cancelled and frees its slot."""
+    scheduler = polling.async_get_poll_scheduler(hass)
+
+    with patch("homeassistant.helpers.polling.POLL_TIMEOUT", 0), pytest.raises(
+        TimeoutError
+    ):
+        async with scheduler.async_poll("test", "host"):
+            await asyncio.Event().wait()
+
+    statistics = scheduler.async_statistics("test")
+    assert statistics["count"] == 1
+    assert statistics["failures"] == 1
+    async with scheduler.async_poll("test", "host"), scheduler.async_poll(
+        "test", "host"
+    ):
+        pass
+
+
+async def test_host_concurrency(hass: HomeAssistant) -> None:
+    """Test polls of the same host are limited."""
+    scheduler = polling.async_get_poll_scheduler(hass)
+    release = asyncio.Event()
+    running: set[str] = set()
+
+    async def _poll(name: str, host: str) -> None:
+        async with scheduler.async_poll("test", host):
+            running.add(name)
+            await release.wait()
+
+    tasks = [
+        hass.async_create_task(_poll("a1", "a")),
+        hass.async_create_task(_poll("a2", "a")),
+        hass.async_create_task(_poll("a3", "a")),
+        hass.async_create_task(_poll("b1", "b")),
+    ]
+    await asyncio.sleep(0)
+    assert running == {"a1", "a2", "b1"}
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert running == {"a1", "a2", "a3", "b1"}
+
+
+async def test_executor_concurrency(hass: HomeAssistant) -> None:
+    """Test polls running in the executor are limited."""
+    scheduler = polling.async_get_poll_scheduler(hass)
+    release = asyncio.Event()
+    running = 0
+
+    async def _poll(executor: bool) -> None:
+        nonlocal running
+        async with scheduler.async_poll("test", executor=executor):
+            running += 1
+            await release.wait()
+
+    tasks = [
+        hass.async_create_task(_poll(True))
+        for _ in range(polling.MAX_CONCURRENT_EXECUTOR_POLLS + 1)
+    ]
+    tasks.append(hass.async_create_task(_poll(False)))
+    await asyncio.sleep(0)
+    assert running == polling.MAX_CONCURRENT_EXECUTOR_POLLS + 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert running == polling.MAX_CONCURRENT_EXECUTOR_POLLS + 2
+
+
+@pytest.mark.parametrize(
+    ("failures", "unchanged", "expected"),
+    [
+        (0, 0, 30),
+        (3, 0, 30),
+        (4, 0, 60),
+        (5, 0, 120),
+        (20, 0, 480),
+        (0, 10, 30),
+        (0, 11, 60),
+        (4, 11, 60),
+    ],
+)
+def test_backoff_interval(failures: int, unchanged: int, expected: float) -> None:
+    """Test the poll interval backs off."""
+    assert polling.backoff_interval(30, failures, unchanged) == expected
+
+
+def test_backoff_interval_capped() -> None:
+    """Test backing off does not exceed the maximum interval."""
+    assert polling.backoff_interval(300, 10, 0) == polling.BACKOFF_MAX_INTERVAL
+    assert polling.backoff_interval(3600, 10, 0) == 3600
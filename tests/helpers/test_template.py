@@ -19,6 +19,8 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STOP,
     STATE_ON,
     STATE_UNAVAILABLE,
     VOLUME_LITERS,
@@ -4073,27 +4075,144 @@ def test_iif(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
-async def test_cache_garbage_collection() -> None:
-    """Test caching a template."""
+async def test_render_info_state_fields(hass: HomeAssistant) -> None:
+    """Test the fields read from states are collected."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+
+    info = render_to_info(hass, "{{ states('sensor.one') }}")
+    assert info.state_fields == {"state"}
+    assert not info.state_attributes
+
+    info = render_to_info(hass, "{{ state_attr('sensor.one', 'unit_of_measurement') }}")
+    assert not info.state_fields
+    assert info.state_attributes == {"unit_of_measurement"}
+
+    info = render_to_info(
+        hass, "{{ states.sensor.one.attributes.unit_of_measurement }}"
+    )
+    assert info.state_fields == {"attributes"}
+
+    info = render_to_info(
+        hass, "{{ states.sensor | selectattr('state', 'eq', '1') | list | count }}"
+    )
+    assert info.state_fields == {"state"}
+
+    info = render_to_info(hass, "{{ states.sensor | list | count }}")
+    assert not info.state_fields
+
+    info = render_to_info(hass, "{{ states.sensor.one }}")
+    assert info.state_fields == {template._ALL_STATE_FIELDS}
+
+
+async def test_render_info_filter_state_change(hass: HomeAssistant) -> None:
+    """Test only changes to fields that were read trigger a re-render."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    old_state = hass.states.get("sensor.one")
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "kW"})
+    attribute_changed = hass.states.get("sensor.one")
+    hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "W"})
+    state_changed = hass.states.get("sensor.one")
+
+    info = render_to_info(hass, "{{ states('sensor.one') }}")
+    assert not info.filter_state_change(old_state, attribute_changed)
+    assert info.filter_state_change(old_state, state_changed)
+
+    info = render_to_info(hass, "{{ state_attr('sensor.one', 'unit_of_measurement') }}")
+    assert info.filter_state_change(old_state, attribute_changed)
+    assert not info.filter_state_change(old_state, state_changed)
+
+    info = render_to_info(hass, "{{ states.sensor.one.last_updated }}")
+    assert info.filter_state_change(old_state, attribute_changed)
+
+    info = render_to_info(hass, "{{ states.sensor.one.state | invalid_filter }}")
+    assert info.filter_state_change(old_state, attribute_changed)
+
+
+async def test_cache_survives_garbage_collection() -> None:
+    """Test compiled code is cached beyond the lifetime of the template."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    key = ("no_hass", template_string)
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.CACHED_TEMPLATE_CODE.get(key)
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    assert tpl2._compiled_code is tpl._compiled_code
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(template_string)
+    assert template.CACHED_TEMPLATE_CODE.get(key)
+
+
+async def test_cache_keyed_by_environment_flavor(hass: HomeAssistant) -> None:
+    """Test compiled code is not shared between environment flavors."""
+    template_string = "{{ states('sensor.flavor') }}"
+    for limited, strict, flavor in (
+        (False, False, "normal"),
+        (True, False, "limited"),
+        (False, True, "strict"),
+    ):
+        env = template.TemplateEnvironment(hass, limited, strict)
+        assert env.template_cache_flavor == flavor
+        env.compile(template_string)
+        assert (flavor, template_string) in template.CACHED_TEMPLATE_CODE
+
+
+async def test_bytecode_cache_persisted(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled code is persisted at shutdown and loaded at startup."""
+    await template.async_load_bytecode_cache(hass)
+
+    template_string = "{{ 'persisted' ~ states('sensor.persisted') }}"
+    assert template.Template(template_string, hass).async_render() == "persistedunknown"
+    key = ("normal", template_string)
+    code = template.CACHED_TEMPLATE_CODE[key]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    assert data["version"] == template.BYTECODE_CACHE_VERSION
+    assert ["normal", template_string] in [item[:2] for item in data["code"]]
+
+    del template.CACHED_TEMPLATE_CODE[key]
+    await template.async_load_bytecode_cache(hass)
+    assert template.CACHED_TEMPLATE_CODE[key] == code
+
+    tpl = template.Template(template_string, hass)
+    with patch("jinja2.sandbox.ImmutableSandboxedEnvironment.compile") as mock_compile:
+        assert tpl.async_render() == "persistedunknown"
+    assert not mock_compile.called
+
+
+async def test_bytecode_cache_version_mismatch(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test persisted code from another version is ignored."""
+    template_string = "{{ 'stale' }}"
+    hass_storage[template.BYTECODE_STORAGE_KEY] = {
+        "version": template.BYTECODE_STORAGE_VERSION,
+        "key": template.BYTECODE_STORAGE_KEY,
+        "data": {"version": "old", "code": [["normal", template_string, "AA=="]]},
+    }
+    await template.async_load_bytecode_cache(hass)
+    assert ("normal", template_string) not in template.CACHED_TEMPLATE_CODE
+
+    hass_storage[template.BYTECODE_STORAGE_KEY]["data"] = {
+        "version": template.BYTECODE_CACHE_VERSION,
+        "code": [["normal", template_string, "AA=="]],
+    }
+    await template.async_load_bytecode_cache(hass)
+    assert ("normal", template_string) not in template.CACHED_TEMPLATE_CODE
+    assert template.Template(template_string, hass).async_render() == "stale"
 
 
 def test_is_template_string() -> None:
@@ -367,6 +367,126 @@ async def test_update_interval(
     assert crd.data == 2
 
 
+async def test_update_interval_backoff_on_failures(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the update interval backs off after repeated failures when enabled."""
+    crd.backoff_failures = True
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    unsub = crd.async_add_listener(Mock())
+
+    for _ in range(4):
+        freezer.tick(crd.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert crd.update_method.call_count == 4
+
+    # The interval doubled after the fourth failure
+    freezer.tick(crd.update_interval)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.update_method.call_count == 4
+
+    freezer.tick(crd.update_interval)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.update_method.call_count == 5
+
+    # A successful refresh restores the interval
+    crd.update_method = AsyncMock(return_value=1)
+    freezer.tick(crd.update_interval * 4)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.update_method.call_count == 1
+    assert crd.last_update_success
+
+    freezer.tick(crd.update_interval)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.update_method.call_count == 2
+
+    unsub()
+
+
+async def test_update_interval_no_backoff_by_default(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the update interval does not back off unless enabled."""
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    unsub = crd.async_add_listener(Mock())
+
+    for _ in range(6):
+        freezer.tick(crd.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert crd.update_method.call_count == 6
+
+    unsub()
+
+
+async def test_update_interval_poll_timeout(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test a scheduled refresh that hangs is cancelled and marked failed."""
+    listener = Mock()
+    unsub = crd.async_add_listener(listener)
+    await crd.async_refresh()
+    assert crd.last_update_success
+
+    async def _hang() -> int:
+        await asyncio.Event().wait()
+        return 0
+
+    crd.update_method = _hang
+    with patch("homeassistant.helpers.polling.POLL_TIMEOUT", 0):
+        freezer.tick(crd.update_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert not crd.last_update_success
+    assert isinstance(crd.last_exception, TimeoutError)
+    assert listener.call_count == 2
+    # The next refresh is still scheduled
+    assert crd._unsub_refresh is not None
+
+    unsub()
+
+
+async def test_update_interval_backoff_unchanged(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the update interval backs off on unchanged data when enabled."""
+    update_method = AsyncMock(return_value=1)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        backoff_unchanged=True,
+    )
+    unsub = crd.async_add_listener(Mock())
+
+    for _ in range(12):
+        freezer.tick(DEFAULT_UPDATE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert update_method.call_count == 12
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.call_count == 12
+
+    unsub()
+
+
 async def test_update_interval_not_present(
     hass: HomeAssistant,
     crd_without_update_interval: update_coordinator.DataUpdateCoordinator[int],
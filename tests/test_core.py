@@ -4,6 +4,7 @@ from __future__ import annotations
 import array
 import asyncio
 from datetime import datetime, timedelta
+from decimal import Decimal
 import functools
 import gc
 import logging
@@ -679,6 +680,18 @@ def test_state_as_dict_json() -> None:
     assert state.as_dict_json is as_dict_json_1
 
 
+def test_state_as_number() -> None:
+    """Test the numeric views of a State."""
+    state = ha.State("sensor.power", "1.5")
+    assert state.as_float == 1.5
+    assert state.as_decimal == Decimal("1.5")
+    assert state.as_decimal is state.as_decimal
+
+    state = ha.State("sensor.power", "on")
+    assert state.as_float is None
+    assert state.as_decimal is None
+
+
 def test_state_as_compressed_state() -> None:
     """Test a State as compressed state."""
     last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)